@@ -3,9 +3,13 @@ Streamlit 웹 애플리케이션: 반달곰 커피 프로젝트 대시보드
 """
 
 import streamlit as st
-import pandas as pd
+import functools
 import os
-from PIL import Image
+
+from profiling import resolve_mode, profile_session
+
+# 프로파일링 (BANDALGOM_PROFILE 환경 변수 또는 `streamlit run app.py -- --profile`, 잘못된 값이면 경고 후 끔)
+PROFILE_MODE = resolve_mode()
 
 # 페이지 설정
 st.set_page_config(
@@ -22,11 +26,502 @@ st.markdown("**코디세이 AI 올인원 프로그램** - 데이터 분석 및 
 st.sidebar.title("🗺 프로젝트 단계")
 stage = st.sidebar.selectbox(
     "단계를 선택하세요:",
-    ["프로젝트 소개", "1단계: 데이터 분석", "2단계: 지도 시각화", "3단계: 최단경로 탐색"]
+    ["프로젝트 소개", "1단계: 데이터 분석", "2단계: 지도 시각화", "3단계: 최단경로 탐색", "경로 질의"]
 )
 
+# 부분 실행 (fragment): 묶음 안의 위젯을 조작하면 그 묶음만 다시 실행
+# (streamlit 1.37 미만에서는 experimental_fragment, 그것도 없으면 전체 실행)
+_fragment_api = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None)
+
+
+def _profiled_fragment(func):
+    """
+    프로파일링이 켜져 있으면 fragment만 다시 실행될 때도 파일 하나를 남기도록 감싸는 함수
+
+    전체 실행 안에서 불릴 때는 같은 스레드의 페이지 프로파일 세션에 합쳐집니다.
+    """
+    if not PROFILE_MODE:
+        return func
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with profile_session(f'app-fragment-{func.__name__}', PROFILE_MODE):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def fragment(func):
+    return _fragment_api(_profiled_fragment(func)) if _fragment_api else func
+
+
+def polling_fragment(seconds):
+    """
+    seconds초마다 저절로 다시 실행되는 fragment (작업 진행률 표시용, fragment가 없으면 한 번만 실행)
+
+    주기 실행마다 프로파일 파일이 쌓이지 않도록 이 fragment는 따로 프로파일하지 않습니다.
+    """
+    api = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None)
+    return api(run_every=seconds) if api else (lambda func: func)
+
+INPUT_FILES = ('area_map.csv', 'area_struct.csv', 'area_category.csv')
+
+# 경로 질의 페이지의 격자 관리 도구를 여는 토큰 (.streamlit/secrets.toml의 admin_token으로도 설정 가능)
+ADMIN_TOKEN_ENV = 'BANDALGOM_ADMIN_TOKEN'
+
+
+def file_signature(*names):
+    """
+    파일들의 (수정 시각, 크기) 목록 (캐시 키로 사용, 파일이 바뀌면 캐시를 새로 만듦)
+    """
+    return tuple((os.path.getmtime(name), os.path.getsize(name)) for name in names)
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def load_input_frames(signature):
+    """
+    1단계 화면에 표시할 입력 데이터와 병합 데이터 (파일이 바뀔 때까지 캐시)
+
+    큰 표를 세션마다 복사하지 않도록 cache_resource로 한 벌만 두고 읽기 전용으로 사용합니다.
+    읽기와 BOM/공백 정리, 검증, 병합은 단계 스크립트와 같은 csv_ingest/grid_join을 사용합니다.
+    """
+    # pandas를 쓰는 모듈은 데이터 표를 보여주는 1단계에서만 불러오기
+    from csv_ingest import read_inputs
+    from grid_join import align_grid
+    
+    area_map, area_struct, area_category = read_inputs()
+    merged_data = align_grid(area_map, area_struct).to_frame()
+    return {
+        'area_map': area_map,
+        'area_struct': area_struct,
+        'area_category': area_category,
+        'merged': merged_data,
+        'area_1': merged_data[merged_data['area'] == 1].reset_index(drop=True),
+    }
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def load_path_table(path_file, signature):
+    """
+    3단계 경로 파일 (단계별 CSV, 압축 CSV, 바이너리 형식 모두 읽기, 파일이 바뀔 때까지 캐시)
+    """
+    from path_store import read_paths
+    
+    return read_paths(path_file)
+
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def load_route_rows(path_file, signature, route_id):
+    """
+    경로 파일에서 경로 하나의 step, x, y (경로 번호별로 캐시)
+    """
+    all_paths = load_path_table(path_file, signature)
+    return all_paths[all_paths['route_id'] == route_id][['step', 'x', 'y']].reset_index(drop=True)
+
+
+@st.cache_data(show_spinner=False)
+def table_stats(_frame, cache_key):
+    """
+    표의 컬럼 통계 (cache_key가 같으면 다시 계산하지 않음)
+    """
+    from table_view import column_stats
+    
+    return column_stats(_frame)
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def table_rows(_frame, cache_key, column, query):
+    """
+    필터를 적용하고 남은 행 위치 (같은 표와 필터면 다시 계산하지 않음)
+    """
+    from table_view import filter_rows
+    
+    return filter_rows(_frame, column, query)
+
+
+@fragment
+def paged_table(frame, key, cache_key, height=None):
+    """
+    큰 표를 서버에서 걸러 내고 보이는 한 페이지만 브라우저로 보내는 표 보기
+
+    Args:
+        frame (pandas.DataFrame): 표시할 데이터 (읽기 전용)
+        key (str): 위젯 이름 접두어 (화면 안에서 표마다 달라야 함)
+        cache_key (tuple): 데이터가 바뀌면 달라지는 값 (필터/통계 캐시 키)
+        height (int): 표 높이
+    """
+    from table_view import PAGE_SIZES, page_window
+    
+    page_key = f'{key}_page'
+    
+    def first_page():
+        st.session_state[page_key] = 1
+    
+    col_column, col_query, col_size, col_page = st.columns([2, 3, 2, 2])
+    column = col_column.selectbox("필터 컬럼", list(frame.columns), key=f'{key}_column', on_change=first_page)
+    query = col_query.text_input("필터 값", key=f'{key}_query', on_change=first_page,
+                                 placeholder="예: 5, 3~7, 1,4")
+    page_size = col_size.selectbox("페이지 크기", PAGE_SIZES, key=f'{key}_size', on_change=first_page)
+    
+    try:
+        positions = table_rows(frame, cache_key, column, query)
+    except ValueError as e:
+        st.warning(str(e))
+        positions = table_rows(frame, cache_key, column, '')
+    
+    pages = max(1, -(-len(positions) // page_size))
+    if st.session_state.get(page_key, 1) > pages:
+        st.session_state[page_key] = pages
+    page = col_page.number_input("페이지", min_value=1, max_value=pages, step=1, key=page_key)
+    rows, page, pages = page_window(positions, page, page_size)
+    
+    if height:
+        st.dataframe(frame.iloc[rows], height=height)
+    else:
+        st.dataframe(frame.iloc[rows])
+    if len(rows):
+        first = (page - 1) * page_size + 1
+        st.caption(f"{len(positions)}개 행 중 {first}~{first + len(rows) - 1}행 ({page}/{pages} 페이지, 전체 {len(frame)}개 행)")
+    else:
+        st.caption(f"조건에 맞는 행이 없습니다. (전체 {len(frame)}개 행)")
+    
+    with st.expander("📊 컬럼 통계", expanded=False):
+        st.dataframe(table_stats(frame, cache_key))
+
+
+@fragment
+def input_tables():
+    """
+    1단계 입력 데이터 표와 구조물 통계
+    """
+    # 데이터 불러오기
+    try:
+        signature = file_signature(*INPUT_FILES)
+        frames = load_input_frames(signature)
+        area_category = frames['area_category']
+        area_1_data = frames['area_1']
+        
+        # 큰 표는 서버에서 한 페이지씩 잘라서 표시
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.subheader("🗺 area_map.csv")
+            paged_table(frames['area_map'], 'area_map', ('area_map', signature), height=300)
+        
+        with col2:
+            st.subheader("🏗 area_struct.csv")
+            paged_table(frames['area_struct'], 'area_struct', ('area_struct', signature), height=300)
+        
+        with col3:
+            st.subheader("📋 area_category.csv")
+            st.dataframe(area_category)
+            st.caption(f"총 {len(area_category)}개 카테고리")
+        
+        # 병합된 데이터 표시
+        st.subheader("🔗 병합된 데이터 (전체)")
+        paged_table(frames['merged'], 'merged', ('merged', signature), height=400)
+        
+        # area 1 데이터만 따로 표시
+        st.subheader("🔗 area 1 데이터")
+        paged_table(area_1_data, 'area_1', ('area_1', signature))
+        
+        # 구조물별 통계
+        st.subheader("📈 구조물별 통계")
+        structures = area_1_data[area_1_data['category'] != 0]
+        if not structures.empty:
+            # 카테고리 매핑
+            category_mapping = area_category.set_index('category')['struct'].to_dict()
+            
+            structure_stats = structures.groupby('category').agg({
+                'x': 'count',
+                'area': 'first'
+            }).rename(columns={'x': '개수', 'area': '지역'})
+            
+            structure_stats['구조물명'] = structure_stats.index.map(category_mapping)
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                st.dataframe(structure_stats[['구조물명', '개수', '지역']])
+            
+            with col2:
+                st.subheader("📍 구조물 위치")
+                for category in structures['category'].unique():
+                    struct_name = category_mapping.get(category, f'Category_{category}')
+                    struct_locations = structures[structures['category'] == category][['x', 'y']]
+                    locations = list(zip(struct_locations['x'], struct_locations['y']))
+                    st.write(f"**{struct_name}**: {locations}")
+        
+    except FileNotFoundError as e:
+        st.error(f"파일을 찾을 수 없습니다: {e}")
+
+
+@st.cache_resource(show_spinner=False)
+def job_queue():
+    """
+    모든 세션이 함께 쓰는 백그라운드 작업 큐 (같은 입력의 작업은 동시에 한 번만 실행)
+    """
+    from job_queue import JobQueue
+    
+    return JobQueue(workers=2)
+
+
+@polling_fragment(1.0)
+def job_progress_view(kind, success):
+    """
+    이 세션이 기다리는 작업의 진행 상황 (1초마다 작업 큐에서 다시 읽음)
+    
+    작업이 끝나면 전체 화면을 다시 실행해서 새로 만들어진 결과를 보여 줍니다.
+    """
+    key = f'job_{kind}'
+    job = job_queue().get(st.session_state.get(key))
+    if job is None:
+        st.session_state.pop(key, None)
+        return
+    
+    info = job.snapshot()
+    if info['status'] == 'queued':
+        st.progress(0.0, text=f"{info['name']}: 앞선 작업을 기다리는 중...")
+        return
+    if info['status'] == 'running':
+        st.progress(info['progress'], text=f"{info['name']}: {info['message']}")
+        st.caption(f"작업 #{info['id']} · {info['elapsed']:.1f}초 경과 · 다른 페이지로 이동해도 작업은 계속됩니다.")
+        return
+    
+    del st.session_state[key]
+    if info['status'] == 'done':
+        st.toast(success)
+    else:
+        st.session_state[f'{key}_error'] = info['error']
+    if hasattr(st, 'fragment'):
+        st.rerun(scope='app')
+    st.rerun()
+
+
+def job_button(kind, label, success, failure):
+    """
+    백그라운드 작업을 시작하는 버튼과 진행 상황
+    
+    누른 세션은 작업 번호만 기억하고 바로 돌아오므로 화면이 멈추지 않습니다.
+    다른 세션이 같은 입력으로 이미 시작한 작업이 있으면 새로 실행하지 않고 그 작업을 함께 기다립니다.
+    """
+    key = f'job_{kind}'
+    if st.button(label, disabled=key in st.session_state):
+        st.session_state[key] = job_queue().submit(kind).id
+    
+    error = st.session_state.pop(f'{key}_error', None)
+    if error:
+        st.error(f"{failure}: {error}")
+    if key in st.session_state:
+        job_progress_view(kind, success)
+
+
+@fragment
+def area_map_view():
+    """
+    2단계 지도 이미지 (없으면 생성 버튼)
+    """
+    if os.path.exists('map.png'):
+        st.subheader("생성된 지도")
+        
+        # 이미지 표시 (파일 경로를 바로 넘겨서 PIL을 직접 불러오지 않음)
+        st.image('map.png', caption="반달곰 커피 지역 지도", use_container_width=True)
+        
+        # 범례 설명
+        st.subheader("🔍 범례 설명")
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("""
+            **구조물 표현:**
+            - 🟤 갈색 원: 아파트, 빌딩
+            - 🟢 녹색 사각형: 반달곰커피
+            - ⬜ 회색 사각형: 건설현장
+            """)
+        
+        with col2:
+            st.markdown("""
+            **좌표계:**
+            - X축: 가로 좌표 (1~7)
+            - Y축: 세로 좌표 (1~8)
+            - 격자: 각 셀은 1x1 크기
+            """)
+    else:
+        st.warning("지도 파일(map.png)이 생성되지 않았습니다. 2단계를 먼저 실행해주세요.")
+        
+        job_button('map', "🗺 지도 생성하기", "지도가 성공적으로 생성되었습니다!", "지도 생성 중 오류 발생")
+
+
+@fragment
+def route_map_view():
+    """
+    3단계 최단경로 지도 (없으면 생성 버튼)
+    """
+    if os.path.exists('map_final.png'):
+        st.subheader("최단경로가 표시된 지도")
+        st.image('map_final.png', caption="최단경로 시각화", use_container_width=True)
+    else:
+        st.warning("최단경로 지도(map_final.png)가 생성되지 않았습니다.")
+    
+        job_button('route', "🎯 최단경로 찾기", "최단경로가 성공적으로 계산되었습니다!", "경로 계산 중 오류 발생")
+
+
+@fragment
+def route_table_view():
+    """
+    3단계 경로 표와 경로 정보
+    """
+    from path_store import DEFAULT_FILES, path_format
+    
+    # 경로 데이터 표시 (3단계 결과와 형식별 경로 파일, 형식은 파일 헤더로 구분)
+    candidates = dict.fromkeys(['home_to_cafe.csv', *DEFAULT_FILES.values()])
+    path_files = [f for f in candidates if os.path.exists(f)]
+    if path_files:
+        st.subheader("📊 경로 데이터")
+        path_file = path_files[0] if len(path_files) == 1 else st.selectbox("경로 파일", path_files)
+        st.caption(f"저장 형식: {path_format(path_file) or '빈 파일'}")
+        signature = file_signature(path_file)
+        all_paths = load_path_table(path_file, signature)
+    
+        # 여러 경로가 저장된 경우 하나를 골라서 표시
+        route_ids = sorted(all_paths['route_id'].unique())
+        route_id = route_ids[0] if len(route_ids) <= 1 else st.selectbox("경로 번호", route_ids)
+        path_data = load_route_rows(path_file, signature, route_id)
+        paged_table(path_data, 'path', (path_file, signature, route_id))
+    
+        st.subheader("📈 경로 정보")
+        st.metric("총 이동 거리", f"{len(path_data) - 1}칸")
+        st.metric("총 단계 수", f"{len(path_data)}단계")
+    
+        # 시작점과 끝점 표시
+        if len(path_data) > 0:
+            start = (path_data.iloc[0]['x'], path_data.iloc[0]['y'])
+            end = (path_data.iloc[-1]['x'], path_data.iloc[-1]['y'])
+            st.write(f"**시작점**: {start}")
+            st.write(f"**도착점**: {end}")
+    else:
+        st.info("경로 데이터(home_to_cafe.csv)가 아직 생성되지 않았습니다.")
+
+
+@st.cache_resource(show_spinner="격자 지도를 준비하는 중...")
+def route_engine():
+    """
+    모든 세션이 함께 쓰는 경로 엔진 (프로세스에 하나, 격자 한 벌과 경로 캐시를 공유)
+    """
+    from route_cache import RouteCache
+    from route_service import RouteEngine
+    
+    return RouteEngine(cache=RouteCache(db_path=None))
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def route_overlay(_engine, version, start, end, path):
+    """
+    경로가 겹쳐진 지도 PNG (격자 버전과 경로가 같으면 다시 그리지 않음)
+    """
+    from map_direct_save import render_path_image
+    
+    data, category_df, _ = _engine.snapshot()
+    return render_path_image(data, category_df, list(path), start, end)
+
+
+@fragment
+def route_query_view():
+    """
+    시작/도착 칸을 고르면 바로 경로와 지도를 보여 주는 질의 화면
+    """
+    from route_service import SEARCH_MODES
+    
+    engine = route_engine()
+    info = engine.info()
+    x_min, y_min, x_max, y_max = info['bounds']
+    default_start = info['default_start'] or (x_min, y_min)
+    default_end = info['default_end'] or (x_max, y_max)
+    
+    col_start, col_end, col_mode = st.columns([2, 2, 1])
+    with col_start:
+        st.markdown("**출발 칸**")
+        start_x = st.number_input("출발 x", x_min, x_max, default_start[0], key='query_start_x')
+        start_y = st.number_input("출발 y", y_min, y_max, default_start[1], key='query_start_y')
+    with col_end:
+        st.markdown("**도착 칸**")
+        end_x = st.number_input("도착 x", x_min, x_max, default_end[0], key='query_end_x')
+        end_y = st.number_input("도착 y", y_min, y_max, default_end[1], key='query_end_y')
+    with col_mode:
+        mode = st.selectbox("탐색 방식", SEARCH_MODES, key='query_mode')
+    
+    start, end = (int(start_x), int(start_y)), (int(end_x), int(end_y))
+    result = engine.route(start, end, mode)
+    
+    col_map, col_info = st.columns([2, 1])
+    with col_info:
+        if result['found']:
+            st.metric("이동 거리", f"{result['distance']}칸")
+        else:
+            st.warning("두 칸 사이에 갈 수 있는 길이 없습니다.")
+        st.metric("질의 시간", f"{result['elapsed_ms']:.1f}ms")
+        st.caption(f"격자 버전 {result['version']} · 칸 {info['cells']}개 · 장애물 {info['obstacles']}개")
+    with col_map:
+        image = route_overlay(engine, result['version'], start, end, tuple(result['path']))
+        st.image(image, caption=f"{start} → {end}", use_container_width=True)
+
+
+def admin_token():
+    """
+    격자 관리 도구를 여는 관리자 토큰 (st.secrets의 admin_token 또는 환경 변수, 없으면 None)
+    """
+    try:
+        token = st.secrets.get('admin_token')
+    except Exception:
+        # secrets.toml이 없으면 streamlit 버전에 따라 예외가 남
+        token = None
+    return token or os.environ.get(ADMIN_TOKEN_ENV) or None
+
+
+@fragment
+def route_engine_admin():
+    """
+    공유 엔진의 격자를 바꾸는 도구 (모든 세션에 바로 반영)
+
+    모든 사용자가 함께 쓰는 엔진을 바꾸므로 관리자 토큰이 설정되어 있고
+    그 토큰을 입력한 세션에서만 보입니다.
+    """
+    import hmac
+    
+    token = admin_token()
+    if token is None:
+        return
+    
+    with st.expander("🛠 격자 관리 (모든 사용자에게 적용)", expanded=False):
+        entered = st.text_input("관리자 토큰", type="password", key='admin_token')
+        if not entered:
+            return
+        if not hmac.compare_digest(entered.encode('utf-8'), str(token).encode('utf-8')):
+            st.error("관리자 토큰이 맞지 않습니다.")
+            return
+        
+        engine = route_engine()
+        st.caption("격자를 바꾸는 동안 진행 중인 질의는 끝날 때까지 기다리고, 새 질의는 바뀐 격자를 사용합니다.")
+        col_x, col_y, col_state, col_apply = st.columns([1, 1, 1, 1])
+        x = col_x.number_input("x", value=1, step=1, key='admin_x')
+        y = col_y.number_input("y", value=1, step=1, key='admin_y')
+        state = col_state.selectbox("상태", ['obstacle', 'free'], key='admin_state')
+        if col_apply.button("칸 바꾸기", key='admin_apply'):
+            try:
+                version = engine.set_cells({(int(x), int(y)): state})
+                st.success(f"({int(x)}, {int(y)}) → {state} (격자 버전 {version})")
+            except ValueError as e:
+                st.error(str(e))
+        if st.button("🔄 CSV 다시 읽기", key='admin_reload'):
+            with st.spinner("격자를 다시 만드는 중..."):
+                engine.reload()
+            st.success("격자를 다시 만들었습니다.")
+
+
 # 각 단계별 내용
-if stage == "프로젝트 소개":
+@fragment
+def intro_page():
+    """
+    프로젝트 소개 페이지
+    """
     st.header("📋 프로젝트 개요")
     
     col1, col2 = st.columns([2, 1])
@@ -62,7 +557,12 @@ if stage == "프로젝트 소개":
         - 🚧 건설현장 (회색 사각형)
         """)
 
-elif stage == "1단계: 데이터 분석":
+
+@fragment
+def stage1_page():
+    """
+    1단계 데이터 분석 페이지
+    """
     st.header("📊 1단계: 데이터 분석")
     
     # 데이터 처리 원리 설명
@@ -224,75 +724,7 @@ elif stage == "1단계: 데이터 분석":
         - <span style='color: #1976d2; font-weight: bold;'>index</span>: DataFrame에서 각 행을 구분하는 번호 **<span style='color: #1976d2;'>(초기화)</span>**
         """, unsafe_allow_html=True)
     
-    # 데이터 불러오기
-    try:
-        area_map = pd.read_csv('area_map.csv')
-        area_struct = pd.read_csv('area_struct.csv')
-        area_category = pd.read_csv('area_category.csv')
-        
-        # 컬럼명과 데이터의 공백 제거
-        area_category.columns = area_category.columns.str.strip()
-        area_category['struct'] = area_category['struct'].str.strip()
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.subheader("🗺 area_map.csv")
-            st.dataframe(area_map, height=300)
-            st.caption(f"총 {len(area_map)}개 좌표 (전체 표시)")
-        
-        with col2:
-            st.subheader("🏗 area_struct.csv")
-            st.dataframe(area_struct, height=300)
-            st.caption(f"총 {len(area_struct)}개 구조물 (전체 표시)")
-        
-        with col3:
-            st.subheader("📋 area_category.csv")
-            st.dataframe(area_category)
-            st.caption(f"총 {len(area_category)}개 카테고리")
-        
-        # 병합된 데이터 표시
-        st.subheader("🔗 병합된 데이터 (전체)")
-        
-        # 데이터 병합 과정 재현
-        merged_data = area_map.merge(area_struct, on=['x', 'y'], how='left')
-        st.dataframe(merged_data, height=400)
-        st.caption(f"전체 데이터: {len(merged_data)}개 행 (225개 좌표 전체)")
-        
-        # area 1 데이터만 따로 표시
-        st.subheader("🔗 area 1 데이터")
-        area_1_data = merged_data[merged_data['area'] == 1].copy()
-        st.dataframe(area_1_data)
-        st.caption(f"area 1 데이터: {len(area_1_data)}개 행")
-        
-        # 구조물별 통계
-        st.subheader("📈 구조물별 통계")
-        structures = area_1_data[area_1_data['category'] != 0]
-        if not structures.empty:
-            # 카테고리 매핑
-            category_mapping = area_category.set_index('category')['struct'].to_dict()
-            
-            structure_stats = structures.groupby('category').agg({
-                'x': 'count',
-                'area': 'first'
-            }).rename(columns={'x': '개수', 'area': '지역'})
-            
-            structure_stats['구조물명'] = structure_stats.index.map(category_mapping)
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                st.dataframe(structure_stats[['구조물명', '개수', '지역']])
-            
-            with col2:
-                st.subheader("📍 구조물 위치")
-                for category in structures['category'].unique():
-                    struct_name = category_mapping.get(category, f'Category_{category}')
-                    struct_locations = structures[structures['category'] == category][['x', 'y']]
-                    locations = list(zip(struct_locations['x'], struct_locations['y']))
-                    st.write(f"**{struct_name}**: {locations}")
-        
-    except FileNotFoundError as e:
-        st.error(f"파일을 찾을 수 없습니다: {e}")
+    input_tables()
     
     # 1단계 요점정리 박스 추가
     st.markdown("---")
@@ -330,7 +762,12 @@ elif stage == "1단계: 데이터 분석":
 🔹 다른 분야 응용
         """)
 
-elif stage == "2단계: 지도 시각화":
+
+@fragment
+def stage2_page():
+    """
+    2단계 지도 시각화 페이지
+    """
     st.header("🗺 2단계: 지도 시각화")
     
     # 시각화 원리 설명
@@ -496,44 +933,7 @@ elif stage == "2단계: 지도 시각화":
         - <span style='color: #1976d2; font-weight: bold;'>matplotlib.patches</span>: 도형 그리기 전용 모듈 **<span style='color: #1976d2;'>(초기화)</span>**
         """, unsafe_allow_html=True)
     
-    if os.path.exists('map.png'):
-        st.subheader("생성된 지도")
-        
-        # 이미지 표시
-        image = Image.open('map.png')
-        st.image(image, caption="반달곰 커피 지역 지도", use_container_width=True)
-        
-        # 범례 설명
-        st.subheader("🔍 범례 설명")
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("""
-            **구조물 표현:**
-            - 🟤 갈색 원: 아파트, 빌딩
-            - 🟢 녹색 사각형: 반달곰커피
-            - ⬜ 회색 사각형: 건설현장
-            """)
-        
-        with col2:
-            st.markdown("""
-            **좌표계:**
-            - X축: 가로 좌표 (1~7)
-            - Y축: 세로 좌표 (1~8)
-            - 격자: 각 셀은 1x1 크기
-            """)
-    else:
-        st.warning("지도 파일(map.png)이 생성되지 않았습니다. 2단계를 먼저 실행해주세요.")
-        
-        if st.button("🗺 지도 생성하기"):
-            with st.spinner("지도를 생성하는 중..."):
-                import subprocess
-                result = subprocess.run(['python', 'map_draw_real.py'], capture_output=True, text=True)
-                if result.returncode == 0:
-                    st.success("지도가 성공적으로 생성되었습니다!")
-                    st.rerun()
-                else:
-                    st.error(f"지도 생성 중 오류 발생: {result.stderr}")
+    area_map_view()
     
     # 2단계 요점정리 박스 추가
     st.markdown("---")
@@ -571,7 +971,12 @@ elif stage == "2단계: 지도 시각화":
 🔹 웹사이트
         """)
 
-elif stage == "3단계: 최단경로 탐색":
+
+@fragment
+def stage3_page():
+    """
+    3단계 최단경로 탐색 페이지
+    """
     st.header("🎯 3단계: 최단경로 탐색")
     
     # BFS 알고리즘 원리 설명
@@ -932,42 +1337,10 @@ if next_pos == end:
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        if os.path.exists('map_final.png'):
-            st.subheader("최단경로가 표시된 지도")
-            image = Image.open('map_final.png')
-            st.image(image, caption="최단경로 시각화", use_container_width=True)
-        else:
-            st.warning("최단경로 지도(map_final.png)가 생성되지 않았습니다.")
-            
-            if st.button("🎯 최단경로 찾기"):
-                with st.spinner("최단경로를 계산하는 중..."):
-                    import subprocess
-                    result = subprocess.run(['python', 'map_direct_save.py'], capture_output=True, text=True)
-                    if result.returncode == 0:
-                        st.success("최단경로가 성공적으로 계산되었습니다!")
-                        st.rerun()
-                    else:
-                        st.error(f"경로 계산 중 오류 발생: {result.stderr}")
+        route_map_view()
     
     with col2:
-        # 경로 데이터 표시
-        if os.path.exists('home_to_cafe.csv'):
-            st.subheader("📊 경로 데이터")
-            path_data = pd.read_csv('home_to_cafe.csv')
-            st.dataframe(path_data)
-            
-            st.subheader("📈 경로 정보")
-            st.metric("총 이동 거리", f"{len(path_data) - 1}칸")
-            st.metric("총 단계 수", f"{len(path_data)}단계")
-            
-            # 시작점과 끝점 표시
-            if len(path_data) > 0:
-                start = (path_data.iloc[0]['x'], path_data.iloc[0]['y'])
-                end = (path_data.iloc[-1]['x'], path_data.iloc[-1]['y'])
-                st.write(f"**시작점**: {start}")
-                st.write(f"**도착점**: {end}")
-        else:
-            st.info("경로 데이터(home_to_cafe.csv)가 아직 생성되지 않았습니다.")
+        route_table_view()
     
     # 3단계 요점정리 박스 추가
     st.markdown("---")
@@ -1014,6 +1387,37 @@ if next_pos == end:
 실제 IT 기업에서 사용하는 핵심 기술들을 모두 경험해보셨습니다.
     """)
 
+
+@fragment
+def route_query_page():
+    """
+    임의의 출발/도착 칸으로 경로를 찾는 질의 페이지
+    """
+    st.header("🧭 경로 질의")
+    st.markdown("""
+    출발 칸과 도착 칸을 고르면 바로 최단경로와 지도를 보여 줍니다.
+    모든 사용자가 프로세스에 하나뿐인 경로 엔진(격자 지도와 경로 캐시)을 함께 사용합니다.
+    """)
+    
+    route_query_view()
+    route_engine_admin()
+
+
+PAGES = {
+    "프로젝트 소개": intro_page,
+    "1단계: 데이터 분석": stage1_page,
+    "2단계: 지도 시각화": stage2_page,
+    "3단계: 최단경로 탐색": stage3_page,
+    "경로 질의": route_query_page,
+}
+
+# 선택한 페이지 실행 (프로파일링이 켜져 있으면 페이지를 열 때마다 파일 하나)
+if PROFILE_MODE:
+    with profile_session(f'app-{stage}', PROFILE_MODE):
+        PAGES[stage]()
+else:
+    PAGES[stage]()
+
 # 푸터
 st.markdown("---")
 st.markdown("**반달곰 커피 프로젝트** | 코디세이 AI 올인원 프로그램 (업데이트됨)")
\ No newline at end of file
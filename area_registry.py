@@ -0,0 +1,219 @@
+"""
+지역(area) 레지스트리 모듈
+결합된 격자 데이터에서 지역별 경계 상자(bounding box)와 좌표 보정값을 계산하고,
+경계 상자에 대한 공간 인덱스와 지역별 격자 캐시를 제공합니다.
+"""
+
+import numpy as np
+
+from grid_components import create_grid_map
+from grid_join import GridFrame, align_grid
+
+
+# 반달곰 커피가 있는 기본 지역
+DEFAULT_AREA = 1
+
+# 공간 인덱스 버킷 한 칸의 크기 (좌표 단위)
+BUCKET_SIZE = 8
+
+
+class AreaBox:
+    """
+    한 지역의 경계 상자와 좌표 보정값
+
+    offset은 지역의 좌측 상단이 (1, 1)이 되도록 더할 (dx, dy) 값입니다.
+    예) area 1은 x(1~7), y(8~15)이므로 offset은 (0, -7)
+    """
+
+    def __init__(self, area_id, x_min, x_max, y_min, y_max):
+        self.area_id = area_id
+        self.x_min = x_min
+        self.x_max = x_max
+        self.y_min = y_min
+        self.y_max = y_max
+        self.offset = (1 - x_min, 1 - y_min)
+
+    def contains(self, x, y):
+        return self.x_min <= x <= self.x_max and self.y_min <= y <= self.y_max
+
+    def intersects(self, x_min, y_min, x_max, y_max):
+        return not (
+            x_max < self.x_min or x_min > self.x_max
+            or y_max < self.y_min or y_min > self.y_max
+        )
+
+    def __repr__(self):
+        return (
+            f'AreaBox(area={self.area_id}, x({self.x_min}-{self.x_max}), '
+            f'y({self.y_min}-{self.y_max}), offset={self.offset})'
+        )
+
+
+class AreaRegistry:
+    """
+    지역별 행 위치, 경계 상자, 공간 인덱스, 격자 캐시를 관리하는 클래스
+
+    전체 데이터는 생성할 때 한 번만 지역별로 묶고,
+    이후 한 지역의 데이터/격자 요청은 그 지역의 행만 사용합니다.
+    """
+
+    def __init__(self, data, bucket_size=BUCKET_SIZE):
+        """
+        Args:
+            data (GridFrame | pandas.DataFrame): 결합된 전체 데이터 (area 컬럼 필요)
+            bucket_size (int): 공간 인덱스 버킷 크기
+        """
+        if not isinstance(data, GridFrame):
+            data = GridFrame.from_frame(data)
+
+        self.data = data
+        self.bucket_size = bucket_size
+        self.boxes = {}
+        self._rows = {}
+        self._buckets = {}
+        self._frames = {}
+        self._grids = {}
+
+        self._group_rows()
+        self._build_index()
+
+    @classmethod
+    def from_inputs(cls, area_map, area_struct, bucket_size=BUCKET_SIZE):
+        """
+        입력 표 두 개를 (x, y)로 결합해서 레지스트리를 만드는 함수
+        """
+        return cls(align_grid(area_map, area_struct), bucket_size)
+
+    def _group_rows(self):
+        """
+        area 값으로 행을 한 번에 묶고 지역별 경계 상자를 계산하는 함수
+        """
+        areas = np.asarray(self.data['area'])
+        xs = np.asarray(self.data['x'])
+        ys = np.asarray(self.data['y'])
+
+        # area가 비어있는(NaN) 행은 어느 지역에도 속하지 않음
+        valid = np.flatnonzero(~np.isnan(areas.astype(float)))
+        order = valid[np.argsort(areas[valid], kind='stable')]
+        ids, starts = np.unique(areas[order], return_index=True)
+
+        for area_id, rows in zip(ids.tolist(), np.split(order, starts[1:])):
+            area_id = int(area_id)
+            self._rows[area_id] = rows
+            self.boxes[area_id] = AreaBox(
+                area_id,
+                int(xs[rows].min()), int(xs[rows].max()),
+                int(ys[rows].min()), int(ys[rows].max())
+            )
+
+    def _bucket_range(self, x_min, y_min, x_max, y_max):
+        size = self.bucket_size
+        for bx in range(x_min // size, x_max // size + 1):
+            for by in range(y_min // size, y_max // size + 1):
+                yield bx, by
+
+    def _build_index(self):
+        """
+        각 경계 상자를 겹치는 버킷에 등록하는 함수 (균일 격자 공간 인덱스)
+        """
+        for box in self.boxes.values():
+            for key in self._bucket_range(box.x_min, box.y_min, box.x_max, box.y_max):
+                self._buckets.setdefault(key, []).append(box)
+
+    def area_ids(self):
+        return sorted(self.boxes)
+
+    def box(self, area_id):
+        return self.boxes[area_id]
+
+    def rows(self, area_id):
+        """
+        지역에 속한 행의 위치(정수 인덱스)를 반환하는 함수
+
+        Args:
+            area_id (int): 지역 번호
+
+        Returns:
+            numpy.ndarray: 원래 데이터에서의 행 위치 (오름차순)
+        """
+        return self._rows[area_id]
+
+    def areas_at(self, x, y):
+        """
+        좌표 (x, y)를 경계 상자에 포함하는 지역들을 찾는 함수
+
+        Args:
+            x (int): x좌표 (원래 좌표계)
+            y (int): y좌표 (원래 좌표계)
+
+        Returns:
+            list: 지역 번호 리스트
+        """
+        key = (x // self.bucket_size, y // self.bucket_size)
+        return [box.area_id for box in self._buckets.get(key, []) if box.contains(x, y)]
+
+    def areas_in(self, x_min, y_min, x_max, y_max):
+        """
+        주어진 사각형 범위와 겹치는 지역들을 찾는 함수
+
+        Returns:
+            list: 지역 번호 리스트 (오름차순)
+        """
+        found = set()
+        for key in self._bucket_range(x_min, y_min, x_max, y_max):
+            for box in self._buckets.get(key, []):
+                if box.intersects(x_min, y_min, x_max, y_max):
+                    found.add(box.area_id)
+        return sorted(found)
+
+    def area_frame(self, area_id, localize=True):
+        """
+        한 지역의 데이터만 담은 GridFrame을 반환하는 함수 (캐시됨)
+
+        Args:
+            area_id (int): 지역 번호
+            localize (bool): True면 좌측 상단이 (1, 1)이 되도록 좌표를 보정
+
+        Returns:
+            GridFrame: 지역 데이터
+        """
+        key = (area_id, localize)
+        if key not in self._frames:
+            box = self.boxes[area_id]
+            rows = self._rows[area_id]
+            frame = self.data.take(rows)
+            # 원본이 격자이고 지역이 경계 상자를 꽉 채우면 격자 정보 유지
+            width = box.x_max - box.x_min + 1
+            height = box.y_max - box.y_min + 1
+            if self.data.is_dense and len(rows) == width * height:
+                frame.width, frame.height = width, height
+                frame.x0, frame.y0 = box.x_min, box.y_min
+            if localize:
+                dx, dy = box.offset
+                frame = frame.offset(dx, dy)
+            self._frames[key] = frame
+        return self._frames[key]
+
+    def grid_map(self, area_id, localize=True):
+        """
+        한 지역의 BFS용 격자 지도를 반환하는 함수 (캐시됨)
+
+        Args:
+            area_id (int): 지역 번호
+            localize (bool): True면 보정된 좌표계 사용
+
+        Returns:
+            dict: {(x, y): '장애물여부'} 형태의 격자 지도
+        """
+        key = (area_id, localize)
+        if key not in self._grids:
+            self._grids[key] = create_grid_map(self.area_frame(area_id, localize))
+        return self._grids[key]
+
+    def invalidate(self, area_id=None):
+        """
+        지역 캐시를 비우는 함수 (area_id가 None이면 전체)
+        """
+        for cache in (self._frames, self._grids):
+            for key in [k for k in cache if area_id is None or k[0] == area_id]:
+                del cache[key]
@@ -0,0 +1,212 @@
+"""
+비트 병렬 BFS
+격자를 한 칸 = 1비트인 비트열로 저장하고, BFS의 탐색 경계(frontier)도 비트열로 두어
+시프트(<<, >>)와 마스크(&, |) 연산으로 모든 행을 한 단계씩 한 번에 확장합니다.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+
+class BitGrid:
+    """
+    비트열로 압축한 장애물 격자
+
+    격자 전체를 정수 하나에 행 순서대로 담습니다. 한 행은 width + 1비트를 차지하며,
+    마지막 1비트는 항상 0인 경계 비트라서 좌우 시프트가 다음 행으로 넘어가지 않습니다.
+    (x, y) 칸은 (y - y0) * stride + (x - x0) 번째 비트입니다.
+    """
+
+    def __init__(self, free, x0, y0, width, height):
+        self.free = free
+        self.x0 = x0
+        self.y0 = y0
+        self.width = width
+        self.height = height
+        self.stride = width + 1
+
+    @classmethod
+    def from_grid_map(cls, grid_map):
+        """
+        create_grid_map으로 만든 격자 지도를 비트 격자로 바꾸는 함수
+
+        Args:
+            grid_map (dict): {(x, y): 'free' | 'obstacle'} 격자 지도
+
+        Returns:
+            BitGrid: 비트 격자 (격자 지도에 없는 칸은 지나갈 수 없는 칸)
+        """
+        cells = np.array(list(grid_map.keys()), dtype=np.int64).reshape(-1, 2)
+        passable = np.array([value != 'obstacle' for value in grid_map.values()], dtype=bool)
+        x0, y0 = cells.min(axis=0).tolist()
+        width = int(cells[:, 0].max()) - x0 + 1
+        height = int(cells[:, 1].max()) - y0 + 1
+
+        # 경계 열(마지막 열)은 비워 둔 (height, width + 1) 배열을 비트로 압축
+        bits = np.zeros((height, width + 1), dtype=bool)
+        bits[cells[passable, 1] - y0, cells[passable, 0] - x0] = True
+        packed = np.packbits(bits.ravel(), bitorder='little')
+        return cls(int.from_bytes(packed.tobytes(), 'little'), x0, y0, width, height)
+
+    def memory_bytes(self):
+        """
+        비트 격자가 차지하는 메모리(바이트)를 계산하는 함수
+        """
+        return sys.getsizeof(self.free)
+
+    def contains(self, cell):
+        x, y = cell
+        return 0 <= x - self.x0 < self.width and 0 <= y - self.y0 < self.height
+
+    def _bit(self, cell):
+        x, y = cell
+        return 1 << ((y - self.y0) * self.stride + (x - self.x0))
+
+    def _unpack(self, bits):
+        """
+        비트열을 (height, width) 불리언 배열로 푸는 함수
+        """
+        size = self.height * self.stride
+        raw = np.frombuffer(bits.to_bytes((size + 7) // 8, 'little'), dtype=np.uint8)
+        cells = np.unpackbits(raw, bitorder='little')[:size]
+        return cells.reshape(self.height, self.stride)[:, :self.width].astype(bool)
+
+    def _levels(self, start, end=None):
+        """
+        BFS를 단계(level)별로 진행하며 각 단계의 탐색 경계를 돌려주는 생성기
+
+        한 단계는 격자 전체에 대한 시프트 4번과 마스크 연산으로 끝납니다.
+        bfs_shortest_path와 같이 시작점 자체의 장애물 여부는 보지 않습니다.
+        시작점이 격자 밖이면 0단계는 빈 비트열(0)이고, 1단계는 시작점과 맞닿은 지나갈 수 있는 칸입니다.
+
+        Yields:
+            int: 이번 단계에 새로 도달한 칸들의 비트열
+        """
+        stride = self.stride
+        end_bit = self._bit(end) if end is not None and self.contains(end) else 0
+        if self.contains(start):
+            frontier = self._bit(start)
+        else:
+            # bfs_shortest_path처럼 격자 밖 시작점에서 격자 안의 이웃 칸으로 들어감
+            yield 0
+            x, y = start
+            frontier = 0
+            for neighbor in ((x, y + 1), (x, y - 1), (x - 1, y), (x + 1, y)):
+                if self.contains(neighbor):
+                    frontier |= self._bit(neighbor)
+            frontier &= self.free
+        visited = frontier
+
+        while frontier:
+            yield frontier
+            if frontier & end_bit:
+                return
+            # 좌우(±1)와 위아래(±stride)로 한 칸씩 퍼뜨린 뒤 지나갈 수 있고 처음 가는 칸만 남김
+            spread = (frontier << 1) | (frontier >> 1) | (frontier << stride) | (frontier >> stride)
+            frontier = spread & self.free & ~visited
+            visited |= frontier
+
+    def distance_field(self, start):
+        """
+        start에서 모든 칸까지의 최단거리를 계산하는 함수
+
+        Args:
+            start (tuple): 시작점 좌표 (격자 범위 안)
+
+        Returns:
+            numpy.ndarray: (height, width) int32 배열, 도달할 수 없는 칸은 -1
+        """
+        distance = np.full((self.height, self.width), -1, dtype=np.int32)
+        for level, frontier in enumerate(self._levels(start)):
+            distance[self._unpack(frontier)] = level
+        return distance
+
+    def shortest_path(self, start, end):
+        """
+        start에서 end까지의 최단경로를 찾는 함수 (bfs_shortest_path와 길이 동일)
+
+        Args:
+            start (tuple): 시작점 좌표 (격자 밖이면 지나갈 수 있는 칸으로 봄)
+            end (tuple): 끝점 좌표
+
+        Returns:
+            list: 경로 좌표 리스트 (없으면 빈 리스트)
+        """
+        if start == end:
+            return [start]
+        if not self.contains(end):
+            return []
+
+        levels = list(self._levels(start, end))
+        if not levels[-1] & self._bit(end):
+            return []
+
+        # 끝점에서 한 단계씩 거꾸로, 이전 단계 경계에 있는 이웃을 따라감
+        path = [end]
+        x, y = end
+        for frontier in reversed(levels[:-1]):
+            for dx, dy in ((0, -1), (0, 1), (1, 0), (-1, 0)):
+                neighbor = (x + dx, y + dy)
+                if self.contains(neighbor) and frontier & self._bit(neighbor):
+                    x, y = neighbor
+                    path.append(neighbor)
+                    break
+        if not self.contains(start):
+            path.append(start)
+        path.reverse()
+        return path
+
+
+def benchmark(size=300, obstacle_ratio=0.25, seed=0):
+    """
+    무작위 격자에서 bfs_shortest_path와 비트 병렬 BFS를 비교하는 함수
+
+    Args:
+        size (int): 격자 한 변의 길이
+        obstacle_ratio (float): 장애물 비율
+        seed (int): 난수 시드
+    """
+    import contextlib
+    import io
+
+    from map_direct_save import bfs_shortest_path
+
+    rng = np.random.default_rng(seed)
+    blocked = rng.random((size, size)) < obstacle_ratio
+    blocked[0, 0] = blocked[-1, -1] = False
+    grid_map = {
+        (x, y): 'obstacle' if blocked[y, x] else 'free'
+        for y in range(size) for x in range(size)
+    }
+    start, end = (0, 0), (size - 1, size - 1)
+
+    began = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        flat = bfs_shortest_path(grid_map, start, end)
+    flat_time = time.perf_counter() - began
+
+    began = time.perf_counter()
+    bit_grid = BitGrid.from_grid_map(grid_map)
+    build_time = time.perf_counter() - began
+
+    began = time.perf_counter()
+    bit_path = bit_grid.shortest_path(start, end)
+    bit_time = time.perf_counter() - began
+
+    began = time.perf_counter()
+    bit_grid.distance_field(start)
+    field_time = time.perf_counter() - began
+
+    dict_bytes = sys.getsizeof(grid_map) + sum(sys.getsizeof(k) for k in grid_map)
+    print(f'격자 {size}x{size}, 장애물 {obstacle_ratio:.0%}')
+    print(f'경로 길이: BFS {len(flat)}, 비트 BFS {len(bit_path)}')
+    print(f'BFS 경로 탐색: {flat_time * 1000:.1f}ms')
+    print(f'비트 BFS 경로 탐색: {bit_time * 1000:.1f}ms (비트 격자 생성 {build_time * 1000:.1f}ms)')
+    print(f'비트 BFS 전체 거리 계산: {field_time * 1000:.1f}ms')
+    print(f'메모리: 격자 지도 dict {dict_bytes / 1024:.0f}KB, 비트 격자 {bit_grid.memory_bytes() / 1024:.0f}KB')
+
+
+if __name__ == '__main__':
+    benchmark()
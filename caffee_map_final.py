@@ -3,44 +3,45 @@
 반달곰 커피 프로젝트의 첫 번째 단계로 CSV 파일들을 불러와 분석합니다.
 """
 
-import pandas as pd
+from area_registry import AreaRegistry, DEFAULT_AREA
+from csv_ingest import read_inputs
+from profiling import profiled
 
 
-def load_and_analyze_data():
+def load_and_analyze_data(inputs=None, registry=None):
     """
     CSV 파일들을 불러와 분석하고 병합하는 함수
     
+    Args:
+        inputs (tuple): 이미 읽어 둔 (area_map, area_struct, area_category) (None이면 파일에서 읽음)
+        registry (AreaRegistry): 이미 결합해 둔 데이터의 레지스트리 (주면 다시 결합하지 않음)
+    
     Returns:
         pandas.DataFrame: 병합된 데이터프레임
     """
     # CSV 파일들 불러오기
     print('=== 데이터 파일 불러오기 ===')
     
-    area_map = pd.read_csv('area_map.csv')
+    # 선언한 스키마로 세 파일을 읽고 한 번에 검증 (BOM과 공백은 읽을 때 정리)
+    area_map, area_struct, area_category = inputs if inputs is not None else read_inputs()
+    
     print('area_map.csv 내용:')
     print(area_map.head())
     print(f'데이터 크기: {area_map.shape}\n')
     
-    area_struct = pd.read_csv('area_struct.csv')
     print('area_struct.csv 내용:')
     print(area_struct.head())
     print(f'데이터 크기: {area_struct.shape}\n')
     
-    area_category = pd.read_csv('area_category.csv')
-    # 컬럼명과 데이터의 공백 제거
-    area_category.columns = area_category.columns.str.strip()
-    area_category['struct'] = area_category['struct'].str.strip()
     print('area_category.csv 내용:')
     print(area_category.head())
     print(f'데이터 크기: {area_category.shape}\n')
     
     # 세 데이터를 하나의 DataFrame으로 병합
     print('=== 데이터 병합 ===')
-    merged_data = area_map.merge(
-        area_struct, 
-        on=['x', 'y'], 
-        how='left'
-    )
+    if registry is None:
+        registry = AreaRegistry.from_inputs(area_map, area_struct)
+    merged_data = registry.data.to_frame()
     
     # 좌표 기준으로 정렬
     merged_data = merged_data.sort_values(['x', 'y']).reset_index(drop=True)
@@ -50,7 +51,7 @@ def load_and_analyze_data():
     
     # area 1에 대한 데이터만 필터링 (반달곰 커피가 있는 지역)
     print('=== area 1 데이터 필터링 ===')
-    area_1_data = merged_data[merged_data['area'] == 1].copy()
+    area_1_data = merged_data[merged_data['area'] == DEFAULT_AREA].copy()
     print('area 1 필터링된 데이터:')
     print(area_1_data.head(10))
     print(f'area 1 데이터 크기: {area_1_data.shape}\n')
@@ -98,15 +99,20 @@ def generate_structure_report(data, category_df):
     print()
 
 
-def main():
+@profiled('caffee_map_final')
+def main(inputs=None, registry=None):
     """
     메인 실행 함수
+    
+    Args:
+        inputs (tuple): 이미 읽어 둔 입력 데이터 (파이프라인에서 단계끼리 공유)
+        registry (AreaRegistry): 이미 결합해 둔 데이터의 레지스트리 (파이프라인에서 단계끼리 공유)
     """
     print('반달곰 커피 데이터 분석 프로젝트 - 1단계')
     print('=' * 50)
     
     # 데이터 불러오기 및 분석
-    filtered_data, area_category = load_and_analyze_data()
+    filtered_data, area_category = load_and_analyze_data(inputs, registry)
     
     # 보너스: 구조물 종류별 요약 통계 생성
     generate_structure_report(filtered_data, area_category)
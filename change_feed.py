@@ -0,0 +1,290 @@
+"""
+변경 피드 (칸 단위 변경 기록)
+area_map.csv, area_struct.csv 전체를 다시 쓰는 대신 바뀐 칸만 추가 전용(append-only) 파일에 기록합니다.
+
+    area_changes.csv
+    x,y,field,value
+    5,9,ConstructionSite,1
+    12,3,category,2
+
+- field는 ConstructionSite(0 또는 1) 또는 category(카테고리 번호, 0은 빈 칸)입니다.
+- 좌표는 입력 CSV와 같은 원래 좌표입니다.
+- 감시 모드(watch.py)는 새로 추가된 줄만 읽어서 메모리의 데이터와 격자를 그 칸만 고칩니다.
+- 쌓인 기록은 주기적으로 스냅샷(입력 CSV)에 합치고(compaction) 피드 파일을 비웁니다.
+  합치기 전에 피드 파일을 area_changes.csv.compacting으로 이름을 바꿔 떼어 내므로,
+  합치는 동안 추가된 줄은 새 피드 파일에 쌓이고 잃어버리지 않습니다.
+
+사용법:
+    python change_feed.py            # 쌓인 변경을 입력 CSV에 합치고 피드 비우기
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from csv_ingest import SCHEMAS, read_inputs, validate_inputs
+
+
+DELTA_FILE = 'area_changes.csv'
+DELTA_HEADER = 'x,y,field,value'
+
+# 합치는 동안 떼어 낸 피드 파일 이름에 붙는 꼬리
+DETACHED_SUFFIX = '.compacting'
+
+# 필드별로 값이 저장되는 입력 파일 순서 (read_inputs 결과의 위치)
+FIELD_TABLES = {'ConstructionSite': 0, 'category': 1}
+
+# 스냅샷으로 다시 쓰는 파일
+SNAPSHOT_FILES = ('area_map.csv', 'area_struct.csv')
+
+# 이 개수만큼 변경이 쌓이면 스냅샷에 합침
+COMPACT_EVERY = 500
+
+
+def parse_change(line):
+    """
+    피드 한 줄을 (x, y, field, value)로 바꾸는 함수
+
+    Raises:
+        ValueError: 형식이 맞지 않거나 값이 필드에 맞지 않을 때
+    """
+    parts = [part.strip() for part in line.split(',')]
+    if len(parts) != 4:
+        raise ValueError(f'x,y,field,value 네 값이 필요합니다: {line!r}')
+    x, y, field, value = parts
+    if field not in FIELD_TABLES:
+        raise ValueError(f'알 수 없는 필드입니다: {field} (가능: {", ".join(FIELD_TABLES)})')
+    try:
+        x, y, value = int(x), int(y), int(value)
+    except ValueError:
+        raise ValueError(f'좌표와 값은 정수여야 합니다: {line!r}') from None
+    if field == 'ConstructionSite' and value not in (0, 1):
+        raise ValueError(f'ConstructionSite 값은 0 또는 1이어야 합니다: {line!r}')
+    return x, y, field, value
+
+
+class ChangeFeed:
+    """
+    추가 전용 피드 파일에서 마지막으로 읽은 위치 이후의 줄만 읽는 클래스
+    """
+
+    def __init__(self, filename=DELTA_FILE):
+        self.filename = filename
+        self.detached = filename + DETACHED_SUFFIX
+        self.position = 0
+        self.line_number = 0
+        self._saved = None
+
+    def _parse(self, chunk, filename):
+        records = []
+        for line in chunk.decode('utf-8-sig').splitlines():
+            self.line_number += 1
+            line = line.strip()
+            if not line or line.replace(' ', '') == DELTA_HEADER:
+                continue
+            try:
+                records.append(parse_change(line))
+            except ValueError as e:
+                print(f'경고: {filename} {self.line_number}번째 줄을 건너뜁니다. {e}')
+        return records
+
+    def recover(self):
+        """
+        지난번 합치기가 끝나지 못하고 남긴 떼어 낸 피드의 기록을 모두 읽는 함수 (시작할 때 한 번)
+
+        이미 스냅샷에 합쳐졌을 수도 있지만, 기록은 칸 값을 덮어쓰는 것이라 다시 얹어도 결과가 같습니다.
+        떼어 낸 파일은 다음 합치기가 끝날 때 지워집니다.
+
+        Returns:
+            list: (x, y, field, value) 리스트
+        """
+        if not os.path.exists(self.detached):
+            return []
+        with open(self.detached, 'rb') as f:
+            chunk = f.read()
+        line_number, self.line_number = self.line_number, 0
+        records = self._parse(chunk[:chunk.rfind(b'\n') + 1], self.detached)
+        self.line_number = line_number
+        if records:
+            print(f'지난번에 합치지 못한 {self.detached}의 변경 {len(records)}건을 다시 반영합니다.')
+        return records
+
+    def read_new(self):
+        """
+        마지막으로 읽은 뒤 추가된 변경 기록을 읽는 함수
+
+        아직 줄바꿈으로 끝나지 않은 마지막 줄은 쓰는 중일 수 있으므로 다음 번에 읽습니다.
+        형식이 잘못된 줄은 경고를 출력하고 건너뜁니다.
+
+        Returns:
+            list: (x, y, field, value) 리스트
+        """
+        if not os.path.exists(self.filename):
+            return []
+        if os.path.getsize(self.filename) < self.position:
+            # 파일이 비워졌으면(다른 곳에서 합친 경우) 처음부터 다시 읽음
+            self.position = self.line_number = 0
+
+        with open(self.filename, 'rb') as f:
+            f.seek(self.position)
+            chunk = f.read()
+        end = chunk.rfind(b'\n') + 1
+        if end == 0:
+            return []
+        self.position += end
+        return self._parse(chunk[:end], self.filename)
+
+    def detach(self):
+        """
+        합치기 전에 피드 파일을 떼어 내고, 마지막으로 읽은 뒤 추가된 기록을 읽어 돌려주는 함수
+
+        이름을 바꾼 뒤에 추가되는 줄은 새 피드 파일(헤더 없이 시작할 수 있음)에 쌓이고
+        다음 read_new()에서 처음부터 읽습니다.
+
+        Returns:
+            list: 떼어 낸 파일에서 아직 읽지 않았던 (x, y, field, value) 리스트
+        """
+        self._saved = (self.position, self.line_number)
+        if not os.path.exists(self.filename):
+            self.position = self.line_number = 0
+            return []
+        os.replace(self.filename, self.detached)
+
+        with open(self.detached, 'rb') as f:
+            f.seek(self.position)
+            chunk = f.read()
+        end = chunk.rfind(b'\n') + 1
+        if end < len(chunk):
+            print(f'경고: {self.filename} 마지막 줄이 줄바꿈으로 끝나지 않아 건너뜁니다: {chunk[end:]!r}')
+        records = self._parse(chunk[:end], self.filename)
+        self.position = self.line_number = 0
+        return records
+
+    def release(self):
+        """
+        스냅샷에 합친 뒤 떼어 낸 피드 파일을 지우는 함수
+        """
+        if os.path.exists(self.detached):
+            os.remove(self.detached)
+        self._saved = None
+
+    def restore(self):
+        """
+        합치기에 실패했을 때 떼어 낸 기록을 새 피드 파일 앞에 되돌리는 함수
+
+        읽은 위치도 떼어 내기 전으로 되돌리므로, detach()가 돌려준 기록은 다음 read_new()에서 다시 읽힙니다.
+        """
+        if not os.path.exists(self.detached):
+            return
+        with open(self.detached, 'rb') as f:
+            content = f.read()
+        if os.path.exists(self.filename):
+            with open(self.filename, 'rb') as f:
+                added = f.read()
+            first, _, rest = added.partition(b'\n')
+            if first.decode('utf-8-sig').strip().replace(' ', '') == DELTA_HEADER:
+                added = rest
+            if content and not content.endswith(b'\n'):
+                content += b'\r\n'
+            content += added
+
+        temporary = self.filename + '.tmp'
+        with open(temporary, 'wb') as f:
+            f.write(content)
+        os.replace(temporary, self.filename)
+        os.remove(self.detached)
+        if self._saved is not None:
+            self.position, self.line_number = self._saved
+            self._saved = None
+
+
+def apply_changes_to_inputs(inputs, records):
+    """
+    변경 기록을 입력 데이터에 반영한 새 (area_map, area_struct, area_category)를 만드는 함수
+
+    같은 칸과 필드에 여러 기록이 있으면 마지막 기록이 남습니다.
+    스냅샷 전체를 다루므로 합치기(compaction)나 전체 다시 읽기 때만 사용합니다.
+
+    Raises:
+        ValueError: 입력에 없는 칸을 바꾸는 기록이 있을 때
+    """
+    tables = [inputs[0].copy(), inputs[1].copy(), inputs[2]]
+    for field, position in FIELD_TABLES.items():
+        latest = {(x, y): value for x, y, name, value in records if name == field}
+        if not latest:
+            continue
+        frame = tables[position]
+        xs = frame['x'].to_numpy(dtype=np.int64)
+        ys = frame['y'].to_numpy(dtype=np.int64)
+        rows = {cell: i for i, cell in enumerate(zip(xs.tolist(), ys.tolist()))}
+        missing = [cell for cell in latest if cell not in rows]
+        if missing:
+            raise ValueError(f'입력에 없는 칸을 바꾸는 변경 기록이 있습니다: {missing[:5]}')
+
+        values = frame[field].to_numpy(dtype=np.int64).copy()
+        values[[rows[cell] for cell in latest]] = list(latest.values())
+        kind = SCHEMAS[SNAPSHOT_FILES[position]][field]
+        frame[field] = pd.Series(values.astype(kind), index=frame.index)
+    return tables[0], tables[1], tables[2]
+
+
+def write_snapshot(inputs):
+    """
+    area_map.csv와 area_struct.csv를 원래 형식(BOM, CRLF, 0/1 정수)으로 다시 쓰는 함수
+
+    임시 파일에 쓴 뒤 이름을 바꾸므로 읽는 쪽이 반쯤 쓰인 파일을 보지 않습니다.
+    """
+    for filename, frame in zip(SNAPSHOT_FILES, inputs):
+        frame = pd.DataFrame({
+            name: frame[name].to_numpy(dtype=np.int64) for name in SCHEMAS[filename]
+        })
+        temporary = filename + '.tmp'
+        with open(temporary, 'w', encoding='utf-8-sig', newline='') as f:
+            frame.to_csv(f, index=False, lineterminator='\r\n')
+        os.replace(temporary, filename)
+
+
+def compact(inputs, records, feed):
+    """
+    쌓인 변경을 스냅샷에 합치고 피드를 비우는 함수
+
+    피드 파일을 먼저 떼어 내고, records를 읽은 뒤에 추가된 기록(tail)까지 함께 합칩니다.
+    합치기에 실패하면 떼어 낸 기록을 피드에 되돌리고 예외를 다시 발생시킵니다.
+
+    Args:
+        inputs (tuple): 현재 스냅샷 (area_map, area_struct, area_category)
+        records (list): 이미 읽은 변경 기록
+        feed (ChangeFeed): 변경 피드
+
+    Returns:
+        tuple: (변경이 반영된 (area_map, area_struct, area_category), tail 기록 리스트)
+    """
+    tail = feed.detach()
+    records = list(records) + tail
+    try:
+        merged = apply_changes_to_inputs(inputs, records)
+        validate_inputs(*merged)
+        write_snapshot(merged)
+    except Exception:
+        feed.restore()
+        raise
+    feed.release()
+    print(f'변경 {len(records)}건을 {", ".join(SNAPSHOT_FILES)}에 합치고 {feed.filename}을 비웠습니다.')
+    return merged, tail
+
+
+def main():
+    """
+    메인 실행 함수 (쌓인 변경을 한 번에 합치기)
+    """
+    feed = ChangeFeed()
+    records = feed.recover() + feed.read_new()
+    if not records:
+        print(f'{DELTA_FILE}에 합칠 변경이 없습니다.')
+        return
+    compact(read_inputs(), records, feed)
+
+
+if __name__ == '__main__':
+    main()
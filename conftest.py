@@ -0,0 +1,32 @@
+import contextlib
+import io
+
+from map_direct_save import bfs_shortest_path
+
+
+def random_grid(rng, density=0.3, holes=0.05):
+    """
+    x -3~11, y 2~13 범위의 무작위 격자 지도 (음수 좌표와 격자 지도에 없는 칸(구멍)도 섞음)
+    """
+    return {
+        (x, y): 'obstacle' if rng.random() < density else 'free'
+        for x in range(-3, 12) for y in range(2, 14) if rng.random() >= holes
+    }
+
+
+def reference_path(grid_map, start, end):
+    """
+    bfs_shortest_path 결과 (진행 메시지는 출력하지 않음)
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        return bfs_shortest_path(grid_map, start, end)
+
+
+def assert_valid_path(grid_map, path, start, end):
+    """
+    start에서 end까지 한 칸씩 이어지고, 시작점 말고는 지나갈 수 있는 칸만 밟는 경로인지 확인
+    """
+    assert path[0] == start and path[-1] == end
+    for (x1, y1), (x2, y2) in zip(path, path[1:]):
+        assert abs(x1 - x2) + abs(y1 - y2) == 1
+    assert all(grid_map.get(cell) == 'free' for cell in path[1:])
@@ -0,0 +1,230 @@
+"""
+CSV 입력 읽기 모듈
+세 입력 파일(area_map.csv, area_struct.csv, area_category.csv)을 미리 선언한 스키마로 읽고
+한 번의 벡터 연산으로 검증합니다.
+
+- pyarrow가 있으면 멀티스레드 Arrow CSV 리더로 읽고 Arrow 기반 DataFrame(pd.ArrowDtype)을 돌려줍니다.
+- 없으면 같은 스키마로 pandas.read_csv를 사용합니다.
+
+헤더의 BOM과 공백, 카테고리 이름 앞뒤 공백은 읽는 단계에서 정리하므로
+불러온 뒤에 따로 고칠 필요가 없습니다.
+"""
+
+import importlib.util
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+
+# 파일별 선언 스키마 (컬럼 순서대로)
+SCHEMAS = {
+    'area_map.csv': {'x': 'int64', 'y': 'int64', 'ConstructionSite': 'bool'},
+    'area_struct.csv': {'x': 'int64', 'y': 'int64', 'category': 'int64', 'area': 'int64'},
+    'area_category.csv': {'category': 'int64', 'struct': 'string'},
+}
+
+# 앞뒤 공백을 지우는 문자열 컬럼
+TRIMMED_COLUMNS = {'area_category.csv': ['struct']}
+
+# 구조물이 없는 칸의 카테고리 번호
+EMPTY_CATEGORY = 0
+
+ARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+
+def _read_header(filename):
+    """
+    파일 첫 줄을 읽어 BOM과 공백을 지운 컬럼 이름 리스트를 돌려주는 함수
+    """
+    with open(filename, encoding='utf-8-sig') as f:
+        return [name.strip() for name in f.readline().split(',')]
+
+
+def _check_header(filename, schema):
+    header = _read_header(filename)
+    if header != list(schema):
+        raise ValueError(f'{filename}의 컬럼이 예상과 다릅니다: {header} (예상: {list(schema)})')
+
+
+def _read_arrow(filename, schema, trimmed):
+    """
+    Arrow CSV 리더로 파일을 읽는 함수 (헤더는 건너뛰고 선언한 이름과 타입을 그대로 사용)
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv
+
+    # 0/1 컬럼은 정수로 읽은 뒤 바꿈 (Arrow의 bool 변환은 쉼표 뒤 공백(' 0')을 받지 않음)
+    types = {'int64': pa.int64(), 'bool': pa.int64(), 'string': pa.string()}
+    table = csv.read_csv(
+        filename,
+        read_options=csv.ReadOptions(column_names=list(schema), skip_rows=1, use_threads=True),
+        convert_options=csv.ConvertOptions(
+            column_types={name: types[kind] for name, kind in schema.items()},
+            strings_can_be_null=False,
+        ),
+    )
+    for name, kind in schema.items():
+        if kind == 'bool':
+            if not pc.all(pc.is_in(table[name], value_set=pa.array([0, 1]))).as_py():
+                raise ValueError(f'{filename}의 {name} 컬럼에는 0 또는 1만 올 수 있습니다.')
+            index = table.schema.get_field_index(name)
+            table = table.set_column(index, name, pc.cast(table[name], pa.bool_()))
+    for name in trimmed:
+        index = table.schema.get_field_index(name)
+        table = table.set_column(index, name, pc.utf8_trim_whitespace(table[name]))
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def _read_pandas(filename, schema, trimmed):
+    """
+    pyarrow가 없을 때 같은 스키마로 pandas.read_csv를 사용하는 함수
+    """
+    frame = pd.read_csv(
+        filename,
+        names=list(schema),
+        header=0,
+        skipinitialspace=True,
+        dtype={name: ('int64' if kind == 'bool' else kind) for name, kind in schema.items()},
+    )
+    for name, kind in schema.items():
+        if kind == 'bool':
+            values = frame[name].to_numpy()
+            if not np.isin(values, [0, 1]).all():
+                raise ValueError(f'{filename}의 {name} 컬럼에는 0 또는 1만 올 수 있습니다.')
+            frame[name] = values.astype(bool)
+    for name in trimmed:
+        frame[name] = frame[name].str.strip()
+    return frame
+
+
+def read_table(filename, kind=None):
+    """
+    선언한 스키마로 CSV 파일 하나를 읽는 함수
+
+    Args:
+        filename (str): 읽을 파일 경로
+        kind (str): SCHEMAS에 등록된 파일 종류 (None이면 파일 이름으로 판단)
+
+    Returns:
+        pandas.DataFrame: 스키마대로 타입이 정해진 데이터프레임 (pyarrow가 있으면 Arrow 기반)
+    """
+    kind = kind or os.path.basename(filename)
+    schema = SCHEMAS[kind]
+    trimmed = TRIMMED_COLUMNS.get(kind, [])
+    _check_header(filename, schema)
+    if ARROW_AVAILABLE:
+        return _read_arrow(filename, schema, trimmed)
+    return _read_pandas(filename, schema, trimmed)
+
+
+def validate_inputs(area_map, area_struct, area_category):
+    """
+    세 입력 데이터를 한 번에 검증하는 함수 (문제를 모두 모아 ValueError 하나로 알림)
+
+    - 빈 값이 없을 것
+    - area_map과 area_struct에서 (x, y) 좌표가 겹치지 않을 것
+    - area_struct의 카테고리가 0이거나 area_category에 있는 번호일 것
+    - area_category의 번호와 이름이 겹치지 않을 것
+    """
+    problems = []
+
+    for name, frame in (('area_map', area_map), ('area_struct', area_struct), ('area_category', area_category)):
+        for column, count in frame.isna().sum().items():
+            if count:
+                problems.append(f'{name}.{column}에 빈 값이 {count}개 있습니다.')
+    if problems:
+        # 빈 값이 있으면 정수 배열로 바꿀 수 없으므로 여기서 멈춤
+        raise ValueError('입력 데이터 검증 실패:\n- ' + '\n- '.join(problems))
+
+    for name, frame in (('area_map', area_map), ('area_struct', area_struct)):
+        if frame.empty:
+            continue
+        xs = frame['x'].to_numpy(dtype=np.int64)
+        ys = frame['y'].to_numpy(dtype=np.int64)
+        # (x, y)를 선형 인덱스 하나로 바꿔 1차원으로 중복 확인
+        height = int(ys.max() - ys.min()) + 1
+        keys = (xs - xs.min()) * height + (ys - ys.min())
+        if keys.max() < 4 * len(keys):
+            # 격자처럼 좌표가 촘촘하면 정렬 없이 칸별 개수로 확인
+            cells = np.count_nonzero(np.bincount(keys))
+        else:
+            cells = np.unique(keys).size
+        if cells != len(frame):
+            problems.append(f'{name}에 중복된 (x, y) 좌표가 {len(frame) - cells}개 있습니다.')
+
+    known = np.append(area_category['category'].to_numpy(dtype=np.int64), EMPTY_CATEGORY)
+    categories = area_struct['category'].to_numpy(dtype=np.int64)
+    unknown = np.unique(categories[~np.isin(categories, known)])
+    if unknown.size:
+        problems.append(f'area_struct에 area_category에 없는 카테고리가 있습니다: {unknown.tolist()}')
+
+    if area_category['category'].duplicated().any() or area_category['struct'].duplicated().any():
+        problems.append('area_category에 중복된 카테고리 번호 또는 이름이 있습니다.')
+
+    if problems:
+        raise ValueError('입력 데이터 검증 실패:\n- ' + '\n- '.join(problems))
+
+
+def read_inputs():
+    """
+    세 입력 CSV를 읽고 검증하는 함수 (모든 단계의 공통 진입점)
+
+    Returns:
+        tuple: (area_map, area_struct, area_category) 데이터프레임
+    """
+    area_map = read_table('area_map.csv')
+    area_struct = read_table('area_struct.csv')
+    area_category = read_table('area_category.csv')
+    validate_inputs(area_map, area_struct, area_category)
+    return area_map, area_struct, area_category
+
+
+def benchmark(side=1000):
+    """
+    side x side 격자 크기의 area_map.csv를 만들어 읽기 시간을 비교하는 함수
+
+    기존 방식(pd.read_csv 후 타입 추론)과 선언 스키마 읽기 + 검증을 비교합니다.
+
+    Args:
+        side (int): 격자 한 변의 길이 (행 수는 side * side)
+    """
+    rng = np.random.default_rng(0)
+    xs, ys = np.meshgrid(np.arange(1, side + 1), np.arange(1, side + 1), indexing='ij')
+    frame = pd.DataFrame({
+        'x': xs.ravel(),
+        'y': ys.ravel(),
+        'ConstructionSite': (rng.random(side * side) < 0.1).astype(int),
+    })
+
+    with tempfile.TemporaryDirectory() as folder:
+        filename = os.path.join(folder, 'area_map.csv')
+        with open(filename, 'w', encoding='utf-8-sig', newline='') as f:
+            frame.to_csv(f, index=False, lineterminator='\r\n')
+
+        if ARROW_AVAILABLE:
+            # pyarrow 모듈을 처음 불러오는 시간은 읽기 시간에서 제외
+            import pyarrow.csv
+
+        began = time.perf_counter()
+        pd.read_csv(filename)
+        pandas_time = time.perf_counter() - began
+
+        began = time.perf_counter()
+        table = read_table(filename)
+        empty = pd.DataFrame({'category': pd.Series([], dtype='int64'), 'struct': pd.Series([], dtype='string')})
+        struct = pd.DataFrame({'x': [1], 'y': [1], 'category': [0], 'area': [0]})
+        validate_inputs(table, struct, empty)
+        schema_time = time.perf_counter() - began
+
+    reader = 'Arrow 멀티스레드' if ARROW_AVAILABLE else 'pandas (pyarrow 없음)'
+    print(f'area_map.csv {side * side:,}행 ({reader})')
+    print(f'pd.read_csv (타입 추론): {pandas_time * 1000:.0f}ms')
+    print(f'선언 스키마 읽기 + 검증: {schema_time * 1000:.0f}ms')
+
+
+if __name__ == '__main__':
+    benchmark()
@@ -0,0 +1,228 @@
+"""
+집 × 카페 거리 행렬 미리 계산
+MyHome/Apartment 칸 전체를 출발지로, BandalgomCoffee 칸 전체를 도착지로 두고
+출발지마다 한 번의 탐색으로 모든 칸까지의 거리를 구해 행렬 한 행을 채웁니다.
+(출발지-도착지 쌍마다 bfs_shortest_path를 돌리지 않습니다.)
+결과는 행/열 이름표와 함께 압축 바이너리(.npz)로 저장합니다.
+
+사용법:
+    python distance_matrix.py                # 계산 후 home_cafe_matrix.npz 저장
+    python distance_matrix.py --workers 4    # 출발지별 탐색을 스레드 4개로 나눠 계산
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from search_kernels import FlatGrid, COMPILED
+from vector_bfs import distance_field
+
+
+DEFAULT_FILE = 'home_cafe_matrix.npz'
+
+# 출발지와 도착지로 쓰는 구조물 이름 (area_category.csv 기준)
+SOURCE_STRUCTS = ('MyHome', 'Apartment')
+TARGET_STRUCTS = ('BandalgomCoffee',)
+
+# 도달할 수 없는 쌍의 거리
+UNREACHABLE = -1
+
+
+def find_struct_cells(data, category_df, structs):
+    """
+    구조물 이름에 해당하는 칸들을 찾는 함수
+
+    Args:
+        data (pandas.DataFrame | GridFrame): x, y, category 컬럼을 가진 데이터
+        category_df (pandas.DataFrame): 카테고리 매핑 데이터프레임
+        structs (tuple): 찾을 구조물 이름들 (이 순서대로 나열)
+
+    Returns:
+        tuple: (좌표 리스트, 이름표 리스트)
+    """
+    reverse_mapping = dict(zip(category_df['struct'], category_df['category']))
+    xs = np.asarray(data['x']).astype(int)
+    ys = np.asarray(data['y']).astype(int)
+    categories = np.asarray(data['category'])
+
+    cells, labels = [], []
+    for struct in structs:
+        if struct not in reverse_mapping:
+            print(f'경고: {struct} 카테고리를 찾을 수 없습니다.')
+            continue
+        mask = categories == reverse_mapping[struct]
+        for x, y in zip(xs[mask].tolist(), ys[mask].tolist()):
+            cells.append((x, y))
+            labels.append(f'{struct} ({x}, {y})')
+    return cells, labels
+
+
+class DistanceMatrix:
+    """
+    출발지 × 도착지 최단거리 행렬
+
+    distances[i, j]는 i번째 출발지에서 j번째 도착지까지의 거리 (도달 불가면 -1)입니다.
+    """
+
+    def __init__(self, distances, row_labels, col_labels, row_cells, col_cells):
+        self.distances = distances
+        self.row_labels = list(row_labels)
+        self.col_labels = list(col_labels)
+        self.row_cells = [tuple(cell) for cell in row_cells]
+        self.col_cells = [tuple(cell) for cell in col_cells]
+
+    @property
+    def shape(self):
+        return self.distances.shape
+
+    def save(self, filename=DEFAULT_FILE):
+        """
+        행렬과 이름표를 압축 바이너리(.npz)로 저장하는 함수
+        """
+        np.savez_compressed(
+            filename,
+            distances=self.distances,
+            row_labels=np.array(self.row_labels),
+            col_labels=np.array(self.col_labels),
+            row_cells=np.array(self.row_cells, dtype=np.int32).reshape(-1, 2),
+            col_cells=np.array(self.col_cells, dtype=np.int32).reshape(-1, 2),
+        )
+        print(f'거리 행렬이 {filename}에 저장되었습니다. ({self.shape[0]}x{self.shape[1]})')
+
+    @classmethod
+    def load(cls, filename=DEFAULT_FILE):
+        """
+        save로 저장한 파일을 읽는 함수
+        """
+        with np.load(filename) as saved:
+            return cls(
+                saved['distances'],
+                saved['row_labels'].tolist(),
+                saved['col_labels'].tolist(),
+                saved['row_cells'].tolist(),
+                saved['col_cells'].tolist(),
+            )
+
+    def to_frame(self):
+        """
+        이름표를 행/열 인덱스로 쓰는 데이터프레임으로 바꾸는 함수 (도달 불가는 빈 값)
+        """
+        import pandas as pd
+
+        frame = pd.DataFrame(self.distances, index=self.row_labels, columns=self.col_labels)
+        return frame.where(frame != UNREACHABLE)
+
+    def nearest(self):
+        """
+        출발지마다 가장 가까운 도착지를 찾는 함수
+
+        Returns:
+            list: (출발지 이름표, 도착지 이름표, 거리) 리스트 (도달 가능한 도착지가 없으면 (이름표, None, None))
+        """
+        result = []
+        for i, label in enumerate(self.row_labels):
+            row = self.distances[i]
+            reachable = np.flatnonzero(row != UNREACHABLE)
+            if reachable.size == 0:
+                result.append((label, None, None))
+                continue
+            j = reachable[np.argmin(row[reachable])]
+            result.append((label, self.col_labels[j], int(row[j])))
+        return result
+
+
+def _source_distances(flat_grid, source, target_index, target_inside):
+    """
+    한 출발지에서 모든 도착지까지의 거리를 한 번의 탐색으로 계산하는 함수 (행렬 한 행)
+    """
+    if COMPILED:
+        field = flat_grid.kernel_distances(source).ravel()
+    else:
+        occupancy = flat_grid.passable.reshape(flat_grid.height, flat_grid.width).astype(bool)
+        field = distance_field(occupancy, flat_grid.x0, flat_grid.y0, source).distance.ravel()
+
+    row = np.full(len(target_index), UNREACHABLE, dtype=np.int32)
+    row[target_inside] = field[target_index[target_inside]]
+    return row
+
+
+def compute_distance_matrix(grid_map, sources, targets, workers=1):
+    """
+    출발지 × 도착지 최단거리 행렬을 계산하는 함수
+
+    출발지마다 전체 거리 배열을 한 번 계산하고 도착지 칸만 뽑아 씁니다.
+    numba 커널은 GIL을 놓고 돌기 때문에 workers > 1이면 스레드로 나눠 계산합니다.
+
+    Args:
+        grid_map (dict): 격자 지도 (출발지가 모두 격자 범위 안에 있어야 함)
+        sources (list): 출발지 좌표 리스트
+        targets (list): 도착지 좌표 리스트
+        workers (int): 동시에 계산할 스레드 수
+
+    Returns:
+        numpy.ndarray: (출발지 수, 도착지 수) int32 거리 행렬 (도달 불가 -1)
+    """
+    flat_grid = FlatGrid.from_grid_map(grid_map)
+    target_inside = np.array([flat_grid.contains(cell) for cell in targets], dtype=bool)
+    target_index = np.array(
+        [flat_grid.index(cell) if inside else 0 for cell, inside in zip(targets, target_inside)],
+        dtype=np.int64,
+    )
+
+    def compute_row(source):
+        return _source_distances(flat_grid, source, target_index, target_inside)
+
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            rows = list(executor.map(compute_row, sources))
+    else:
+        rows = [compute_row(source) for source in sources]
+
+    return np.array(rows, dtype=np.int32).reshape(len(sources), len(targets))
+
+
+def build_home_cafe_matrix(workers=1):
+    """
+    CSV 데이터에서 집 × 카페 거리 행렬을 만드는 함수
+
+    Args:
+        workers (int): 동시에 계산할 스레드 수
+
+    Returns:
+        DistanceMatrix: 집 × 카페 거리 행렬
+    """
+    from map_direct_save import load_processed_data, create_grid_map
+
+    data, category_df = load_processed_data()
+    sources, row_labels = find_struct_cells(data, category_df, SOURCE_STRUCTS)
+    targets, col_labels = find_struct_cells(data, category_df, TARGET_STRUCTS)
+    print(f'출발지 {len(sources)}곳, 도착지 {len(targets)}곳')
+
+    grid_map = create_grid_map(data)
+    distances = compute_distance_matrix(grid_map, sources, targets, workers)
+    return DistanceMatrix(distances, row_labels, col_labels, sources, targets)
+
+
+def main():
+    """
+    메인 실행 함수
+    """
+    parser = argparse.ArgumentParser(description='집 × 카페 거리 행렬 미리 계산')
+    parser.add_argument('--workers', type=int, default=1, help='동시에 계산할 스레드 수')
+    parser.add_argument('--output', default=DEFAULT_FILE, help='저장할 .npz 파일')
+    args = parser.parse_args()
+
+    matrix = build_home_cafe_matrix(args.workers)
+    matrix.save(args.output)
+
+    print('\n출발지별 가장 가까운 반달곰 커피:')
+    for source, target, distance in matrix.nearest():
+        if target is None:
+            print(f'  {source}: 도달 가능한 카페 없음')
+        else:
+            print(f'  {source} → {target}: {distance}칸')
+
+
+if __name__ == '__main__':
+    main()
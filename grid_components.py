@@ -0,0 +1,310 @@
+"""
+격자 연결 요소(connected component) 인덱스
+지나갈 수 있는 칸들을 연결 요소로 묶어 두고, 두 지점이 같은 요소에 있는지
+바로 확인할 수 있게 합니다. 장애물이 바뀌면 바뀐 칸 주변만 다시 계산합니다.
+"""
+
+from collections import deque
+
+import numpy as np
+
+
+# 4방향 이웃 (상, 하, 좌, 우)
+DIRECTIONS = [(0, 1), (0, -1), (-1, 0), (1, 0)]
+
+# 장애물인 카테고리 번호 (Apartment, Building)
+OBSTACLE_CATEGORIES = (1, 2)
+
+
+class ComponentIndex:
+    """
+    지나갈 수 있는 칸별 연결 요소 번호를 관리하는 클래스
+
+    처음에는 union-find로 한 번에 번호를 붙이고, 이후에는
+    요소별 칸 집합(members)을 함께 유지해서
+    - 칸이 열리면(free) 이웃 요소들을 작은 쪽에서 큰 쪽으로 합치고,
+    - 칸이 막히면(obstacle) 원래 요소 안에서만 다시 나눕니다.
+    """
+
+    def __init__(self, grid_map):
+        self.grid_map = grid_map
+        self.labels = {}
+        self.members = {}
+        self._next_label = 0
+        self._label_all()
+
+    @staticmethod
+    def _passable(value):
+        # bfs_shortest_path와 같은 기준: 'obstacle'이 아니면 지나갈 수 있음
+        return value is not None and value != 'obstacle'
+
+    def _label_all(self):
+        """
+        union-find로 전체 격자의 연결 요소 번호를 붙이는 함수
+        """
+        parent = {}
+
+        def find(cell):
+            root = cell
+            while parent[root] != root:
+                root = parent[root]
+            # 경로 압축
+            while parent[cell] != root:
+                parent[cell], cell = root, parent[cell]
+            return root
+
+        for cell, value in self.grid_map.items():
+            if self._passable(value):
+                parent[cell] = cell
+
+        # 오른쪽, 아래쪽 이웃과만 합치면 모든 인접 쌍을 한 번씩 확인
+        for (x, y) in parent:
+            for neighbor in ((x + 1, y), (x, y + 1)):
+                if neighbor in parent:
+                    root_a, root_b = find((x, y)), find(neighbor)
+                    if root_a != root_b:
+                        parent[root_b] = root_a
+
+        roots = {}
+        for cell in parent:
+            root = find(cell)
+            if root not in roots:
+                roots[root] = self._new_label()
+            label = roots[root]
+            self.labels[cell] = label
+            self.members[label].add(cell)
+
+    def _new_label(self):
+        label = self._next_label
+        self._next_label += 1
+        self.members[label] = set()
+        return label
+
+    def _neighbor_labels(self, cell):
+        x, y = cell
+        return {
+            self.labels[neighbor]
+            for neighbor in ((x + dx, y + dy) for dx, dy in DIRECTIONS)
+            if neighbor in self.labels
+        }
+
+    def component_count(self):
+        return len(self.members)
+
+    def connected(self, start, end):
+        """
+        start에서 end까지 경로가 있을 수 있는지 O(1)로 확인하는 함수
+
+        bfs_shortest_path는 시작점 자체의 장애물 여부는 보지 않으므로,
+        시작점이 지나갈 수 없는 칸이면 이웃 칸들의 요소를 시작 요소로 봅니다.
+
+        Args:
+            start (tuple): 시작점 좌표
+            end (tuple): 끝점 좌표
+
+        Returns:
+            bool: 같은 연결 요소에 있으면 True
+        """
+        if start == end:
+            return True
+        end_label = self.labels.get(end)
+        if end_label is None:
+            return False
+        if start in self.labels:
+            return self.labels[start] == end_label
+        return end_label in self._neighbor_labels(start)
+
+    def update(self, cell, value):
+        """
+        한 칸의 상태가 바뀌었을 때 연결 요소를 갱신하는 함수
+
+        Args:
+            cell (tuple): 바뀐 좌표
+            value (str): 새 상태 ('free', 'obstacle' 또는 None(삭제))
+        """
+        was_passable = cell in self.labels
+        now_passable = self._passable(value)
+        if was_passable == now_passable:
+            return
+        if now_passable:
+            self._open(cell)
+        else:
+            self._close(cell)
+
+    def _open(self, cell):
+        """
+        새로 지나갈 수 있게 된 칸을 이웃 요소들과 합치는 함수 (작은 쪽 → 큰 쪽)
+        """
+        neighbor_labels = self._neighbor_labels(cell)
+        if not neighbor_labels:
+            label = self._new_label()
+        else:
+            label = max(neighbor_labels, key=lambda l: len(self.members[l]))
+            # 작은 요소의 칸들만 큰 요소로 번호를 옮김
+            for other in neighbor_labels - {label}:
+                moved = self.members.pop(other)
+                for member in moved:
+                    self.labels[member] = label
+                self.members[label] |= moved
+        self.labels[cell] = label
+        self.members[label].add(cell)
+
+    def _close(self, cell):
+        """
+        막힌 칸이 속했던 요소가 둘 이상으로 나뉘는지 확인하고 떨어져 나간 부분만 번호를 바꾸는 함수
+
+        막힌 칸의 이웃들에서 BFS를 한 걸음씩 번갈아 진행하다가
+        - 두 탐색이 만나면 하나로 합치고,
+        - 한 탐색이 더 갈 곳이 없으면 그 칸들은 떨어져 나간 요소이므로 새 번호를 붙이며,
+        - 진행 중인 탐색이 하나만 남으면 나머지는 모두 원래 번호를 그대로 씁니다.
+        그래서 비용은 요소 전체가 아니라 (이웃 수 × 떨어져 나간 작은 부분의 크기),
+        나뉘지 않을 때는 이웃들이 서로 만날 때까지의 거리에 비례합니다.
+        (가장 나쁜 경우는 큰 요소가 거의 반으로 나뉠 때로, 그때는 작은 쪽 전체를 탐색합니다.)
+        """
+        label = self.labels.pop(cell)
+        members = self.members[label]
+        members.discard(cell)
+        if not members:
+            del self.members[label]
+            return
+
+        x, y = cell
+        seeds = [
+            neighbor for neighbor in ((x + dx, y + dy) for dx, dy in DIRECTIONS)
+            if self.labels.get(neighbor) == label
+        ]
+        if len(seeds) < 2:
+            # 같은 요소의 이웃이 하나뿐이면 나뉘지 않음
+            return
+
+        # 탐색 번호별 (진행할 칸, 방문한 칸), 합쳐진 탐색은 대표 번호로 찾음
+        owner = {seed: i for i, seed in enumerate(seeds)}
+        parent = list(range(len(seeds)))
+        frontiers = {i: deque([seed]) for i, seed in enumerate(seeds)}
+        visited = {i: [seed] for i, seed in enumerate(seeds)}
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        while len(frontiers) > 1:
+            for search in list(frontiers):
+                if search not in frontiers:
+                    continue
+                frontier = frontiers[search]
+                if not frontier:
+                    # 더 갈 곳이 없으면 떨어져 나간 요소
+                    del frontiers[search]
+                    piece = visited.pop(search)
+                    new_label = self._new_label()
+                    for member in piece:
+                        self.labels[member] = new_label
+                    self.members[new_label].update(piece)
+                    members.difference_update(piece)
+                    if len(frontiers) == 1:
+                        break
+                    continue
+
+                cx, cy = frontier.popleft()
+                for dx, dy in DIRECTIONS:
+                    neighbor = (cx + dx, cy + dy)
+                    if neighbor not in members:
+                        continue
+                    other = owner.get(neighbor)
+                    if other is None:
+                        owner[neighbor] = search
+                        frontier.append(neighbor)
+                        visited[search].append(neighbor)
+                        continue
+                    other = find(other)
+                    if other != search:
+                        # 두 탐색이 만났으므로 같은 요소
+                        parent[other] = search
+                        frontier.extend(frontiers.pop(other))
+                        visited[search].extend(visited.pop(other))
+                if len(frontiers) == 1:
+                    break
+
+
+class GridMap(dict):
+    """
+    연결 요소 인덱스를 함께 들고 다니는 격자 지도
+
+    일반 dict처럼 {(x, y): 'free' | 'obstacle'}로 사용하며,
+    칸을 바꾸는 dict 메서드(대입, del, update, pop, popitem, setdefault, clear, |=)는
+    모두 components도 함께 갱신합니다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.components = ComponentIndex(self)
+
+    def __setitem__(self, cell, value):
+        super().__setitem__(cell, value)
+        self.components.update(cell, value)
+
+    def __delitem__(self, cell):
+        super().__delitem__(cell)
+        self.components.update(cell, None)
+
+    def update(self, *args, **kwargs):
+        for cell, value in dict(*args, **kwargs).items():
+            self[cell] = value
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def setdefault(self, cell, default=None):
+        if cell not in self:
+            self[cell] = default
+        return super().__getitem__(cell)
+
+    def pop(self, cell, *default):
+        if cell not in self:
+            return super().pop(cell, *default)
+        value = super().pop(cell)
+        self.components.update(cell, None)
+        return value
+
+    def popitem(self):
+        cell, value = super().popitem()
+        self.components.update(cell, None)
+        return cell, value
+
+    def clear(self):
+        super().clear()
+        self.components = ComponentIndex(self)
+
+
+def create_grid_map(data, start_point=None):
+    """
+    BFS를 위한 격자 지도를 생성하는 함수
+    
+    Args:
+        data (pandas.DataFrame | GridFrame): 데이터프레임 또는 결합된 격자 데이터
+        start_point (tuple): 시작점 좌표 (격자 맵에 추가할 경우)
+        
+    Returns:
+        GridMap: {(x, y): '장애물여부'} 형태의 격자 지도 (연결 요소 인덱스 포함)
+    """
+    # 컬럼을 배열로 꺼내 한 번에 장애물 여부 계산
+    xs = np.asarray(data['x']).astype(int)
+    ys = np.asarray(data['y']).astype(int)
+    
+    # 건설현장, Apartment(1)와 Building(2)은 장애물
+    blocked = (np.asarray(data['ConstructionSite']) == 1) | np.isin(np.asarray(data['category']), OBSTACLE_CATEGORIES)
+    
+    grid_map = GridMap(
+        ((x, y), 'obstacle' if is_blocked else 'free')
+        for x, y, is_blocked in zip(xs.tolist(), ys.tolist(), blocked.tolist())
+    )
+    
+    # 시작점이 격자 맵에 없다면 추가 (MyHome이 area 1 외부에 있는 경우)
+    if start_point and start_point not in grid_map:
+        grid_map[start_point] = 'free'
+        print(f'시작점 {start_point}을 격자 맵에 추가했습니다.')
+    
+    return grid_map
@@ -0,0 +1,210 @@
+"""
+격자 데이터 결합 모듈
+area_map.csv와 area_struct.csv를 (x, y) 좌표 기준으로 결합합니다.
+두 데이터가 빈틈없는 직사각형 격자이면 pandas merge 대신
+선형 인덱스(y * W + x)로 배열에 바로 채워 넣는 빠른 경로를 사용합니다.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class GridFrame:
+    """
+    컬럼별 numpy 배열을 담는 가벼운 표 구조
+
+    create_grid_map과 렌더러가 사용하는 만큼의 DataFrame 기능
+    (컬럼 조회, 불리언 필터링, 컬럼 대입, shape/empty)만 제공합니다.
+    빈틈없는 격자에서 만들어진 경우 width/height/x0/y0에 격자 정보가 남습니다.
+    """
+
+    def __init__(self, columns, width=None, height=None, x0=None, y0=None):
+        self._columns = dict(columns)
+        self.width = width
+        self.height = height
+        self.x0 = x0
+        self.y0 = y0
+
+    @property
+    def columns(self):
+        return list(self._columns)
+
+    @property
+    def shape(self):
+        return (len(self), len(self._columns))
+
+    @property
+    def empty(self):
+        return len(self) == 0
+
+    @property
+    def is_dense(self):
+        return self.width is not None
+
+    def __len__(self):
+        if not self._columns:
+            return 0
+        return len(next(iter(self._columns.values())))
+
+    def __contains__(self, name):
+        return name in self._columns
+
+    def __getitem__(self, key):
+        # 컬럼 이름이면 배열 반환
+        if isinstance(key, str):
+            return self._columns[key]
+        # 불리언 마스크면 해당 행만 담은 새 GridFrame 반환 (격자 정보는 버림)
+        mask = np.asarray(key, dtype=bool)
+        return GridFrame({name: values[mask] for name, values in self._columns.items()})
+
+    def take(self, positions):
+        """
+        정수 위치로 지정한 행만 담은 새 GridFrame을 만드는 함수 (격자 정보는 버림)
+
+        Args:
+            positions (numpy.ndarray): 가져올 행 위치
+
+        Returns:
+            GridFrame: 선택된 행들
+        """
+        return GridFrame({name: values[positions] for name, values in self._columns.items()})
+
+    def __setitem__(self, name, values):
+        self._columns[name] = np.asarray(values)
+        # 좌표를 직접 바꾸면 격자 정보가 더 이상 맞지 않으므로 버림
+        if name in ('x', 'y'):
+            self.width = self.height = self.x0 = self.y0 = None
+
+    def offset(self, dx=0, dy=0):
+        """
+        좌표를 (dx, dy)만큼 평행이동한 새 GridFrame을 만드는 함수 (격자 정보 유지)
+
+        Args:
+            dx (int): x좌표 이동량
+            dy (int): y좌표 이동량
+
+        Returns:
+            GridFrame: 좌표가 이동된 GridFrame
+        """
+        moved = self.copy()
+        moved._columns['x'] = moved._columns['x'] + dx
+        moved._columns['y'] = moved._columns['y'] + dy
+        if moved.is_dense:
+            moved.x0 += dx
+            moved.y0 += dy
+        return moved
+
+    def copy(self):
+        return GridFrame(
+            {name: values.copy() for name, values in self._columns.items()},
+            self.width, self.height, self.x0, self.y0
+        )
+
+    def linear_index(self):
+        """
+        각 행의 격자 선형 인덱스 (y - y0) * width + (x - x0)를 계산하는 함수
+
+        Returns:
+            numpy.ndarray: 행별 선형 인덱스 (격자 정보가 없으면 None)
+        """
+        if not self.is_dense:
+            return None
+        return (self._columns['y'] - self.y0) * self.width + (self._columns['x'] - self.x0)
+
+    def to_frame(self):
+        """
+        화면 출력이나 통계용으로 pandas DataFrame을 만드는 함수
+
+        Returns:
+            pandas.DataFrame: 같은 컬럼을 가진 데이터프레임
+        """
+        return pd.DataFrame(self._columns)
+
+    def head(self, n=5):
+        return self.to_frame().head(n)
+
+    @classmethod
+    def from_frame(cls, frame):
+        """
+        pandas DataFrame을 GridFrame으로 변환하는 함수
+
+        Args:
+            frame (pandas.DataFrame): 변환할 데이터프레임
+
+        Returns:
+            GridFrame: 컬럼별 배열을 담은 GridFrame
+        """
+        return cls({name: frame[name].to_numpy() for name in frame.columns})
+
+
+def _dense_index(x, y):
+    """
+    좌표 배열이 빈틈없는 직사각형 격자인지 확인하고 선형 인덱스를 계산하는 함수
+
+    Args:
+        x (numpy.ndarray): x좌표 배열
+        y (numpy.ndarray): y좌표 배열
+
+    Returns:
+        tuple: (선형 인덱스, 너비, 높이, x0, y0) 또는 격자가 아니면 None
+    """
+    if len(x) == 0 or not (np.issubdtype(x.dtype, np.integer) and np.issubdtype(y.dtype, np.integer)):
+        return None
+
+    x0, y0 = int(x.min()), int(y.min())
+    width = int(x.max()) - x0 + 1
+    height = int(y.max()) - y0 + 1
+    if width * height != len(x):
+        return None
+
+    # 모든 칸이 정확히 한 번씩 나오는지 확인 (중복이 있으면 빈 칸도 생김)
+    index = (y - y0) * width + (x - x0)
+    if np.bincount(index, minlength=width * height).max() != 1:
+        return None
+
+    return index, width, height, x0, y0
+
+
+def align_grid(area_map, area_struct):
+    """
+    area_map과 area_struct를 (x, y) 기준으로 결합하는 함수
+
+    두 데이터가 같은 범위의 빈틈없는 격자이면 y * W + x 선형 인덱스로
+    미리 할당한 배열에 값을 채우고, 그렇지 않으면 pandas merge(how='left')로 대체합니다.
+
+    Args:
+        area_map (pandas.DataFrame): x, y, ConstructionSite 컬럼을 가진 데이터프레임
+        area_struct (pandas.DataFrame): x, y, category, area 컬럼을 가진 데이터프레임
+
+    Returns:
+        GridFrame: 결합된 데이터 (행 순서는 area_map과 동일)
+    """
+    map_x = area_map['x'].to_numpy()
+    map_y = area_map['y'].to_numpy()
+    struct_x = area_struct['x'].to_numpy()
+    struct_y = area_struct['y'].to_numpy()
+
+    map_dense = _dense_index(map_x, map_y)
+    struct_dense = _dense_index(struct_x, struct_y)
+
+    # 둘 다 격자이고 범위가 같을 때만 빠른 경로 사용
+    if map_dense is None or struct_dense is None or map_dense[1:] != struct_dense[1:]:
+        merged = area_map.merge(area_struct, on=['x', 'y'], how='left')
+        return GridFrame.from_frame(merged)
+
+    map_index, width, height, x0, y0 = map_dense
+    struct_index = struct_dense[0]
+
+    # area_map의 행 순서를 그대로 유지 (merge(how='left')와 같은 순서)
+    columns = {name: area_map[name].to_numpy() for name in area_map.columns}
+
+    # 미리 할당한 선형 배열에 area_struct 값을 흩어 넣은 뒤 area_map 순서로 모으기
+    for name in area_struct.columns:
+        if name in ('x', 'y'):
+            continue
+        values = area_struct[name].to_numpy()
+        by_cell = np.empty(width * height, dtype=values.dtype)
+        by_cell[struct_index] = values
+        columns[name] = by_cell[map_index]
+
+    return GridFrame(columns, width, height, x0, y0)
@@ -0,0 +1,343 @@
+"""
+계층적 경로 탐색 (HPA*)
+지역(area)을 묶음 단위로 보고, 지역 경계의 출입구(entrance)와 지역 내부 거리를
+미리 계산해 둔 작은 추상 그래프에서 먼저 경로를 찾은 뒤,
+경로가 지나가는 지역만 실제 격자에서 세부 경로로 다시 계산합니다.
+"""
+
+import heapq
+from collections import deque
+
+import numpy as np
+
+
+# 4방향 이동 (상, 하, 좌, 우) - bfs_shortest_path와 같은 순서
+DIRECTIONS = [(0, 1), (0, -1), (-1, 0), (1, 0)]
+
+# 출입구 구간이 이 길이 이상이면 양 끝 두 칸을, 짧으면 가운데 한 칸을 출입구로 사용
+WIDE_ENTRANCE = 6
+
+
+def build_area_lookup(data):
+    """
+    좌표별 지역 번호 사전을 만드는 함수
+
+    Args:
+        data (pandas.DataFrame | GridFrame): x, y, area 컬럼을 가진 데이터
+
+    Returns:
+        dict: {(x, y): 지역 번호}
+    """
+    xs = np.asarray(data['x']).astype(int).tolist()
+    ys = np.asarray(data['y']).astype(int).tolist()
+    areas = np.asarray(data['area']).astype(float)
+    return {
+        (x, y): int(area)
+        for x, y, area in zip(xs, ys, areas.tolist())
+        if not np.isnan(area)
+    }
+
+
+def _bfs_within(grid_map, source, allowed, targets=None):
+    """
+    허용된 칸(allowed)만 지나가는 BFS로 거리와 부모 정보를 계산하는 함수
+
+    Args:
+        grid_map (dict): 격자 지도
+        source (tuple): 시작 좌표
+        allowed (set): 지나갈 수 있는 좌표 집합
+        targets (set): 모두 찾으면 일찍 멈출 좌표 집합 (None이면 전체 탐색)
+
+    Returns:
+        tuple: (거리 사전, 부모 사전)
+    """
+    distance = {source: 0}
+    parent = {source: None}
+    remaining = set(targets) - {source} if targets else None
+    queue = deque([source])
+
+    while queue:
+        current = queue.popleft()
+        if remaining is not None and not remaining:
+            break
+        cx, cy = current
+        for dx, dy in DIRECTIONS:
+            next_pos = (cx + dx, cy + dy)
+            if next_pos in distance or next_pos not in allowed:
+                continue
+            if grid_map.get(next_pos) != 'free':
+                continue
+            distance[next_pos] = distance[current] + 1
+            parent[next_pos] = current
+            if remaining is not None:
+                remaining.discard(next_pos)
+            queue.append(next_pos)
+
+    return distance, parent
+
+
+def _trace(parent, end):
+    path = []
+    node = end
+    while node is not None:
+        path.append(node)
+        node = parent[node]
+    path.reverse()
+    return path
+
+
+class HierarchicalPlanner:
+    """
+    지역 단위 추상 그래프를 미리 계산해 두고 경로 질의에 답하는 클래스
+
+    추상 그래프의 노드는 출입구 칸이고, 간선은
+    (1) 이웃한 두 지역의 출입구 쌍 사이 비용 1 간선,
+    (2) 같은 지역 안 출입구끼리의 지역 내부 최단거리 간선입니다.
+    """
+
+    def __init__(self, grid_map, area_of):
+        """
+        Args:
+            grid_map (dict): create_grid_map으로 만든 격자 지도
+            area_of (dict): {(x, y): 지역 번호} (build_area_lookup 결과)
+        """
+        self.grid_map = grid_map
+        self.area_of = area_of
+        self.area_cells = {}
+        self.entrances = {}
+        self.edges = {}
+
+        for cell, area in area_of.items():
+            self.area_cells.setdefault(area, set()).add(cell)
+
+        self._find_entrances()
+        self._connect_intra_area()
+
+    def _is_free(self, cell):
+        return self.grid_map.get(cell) == 'free'
+
+    def _add_edge(self, a, b, cost):
+        self.edges.setdefault(a, {})
+        self.edges.setdefault(b, {})
+        if cost < self.edges[a].get(b, float('inf')):
+            self.edges[a][b] = cost
+            self.edges[b][a] = cost
+
+    def _find_entrances(self):
+        """
+        지역 경계에서 양쪽 모두 지나갈 수 있는 칸 쌍을 찾아 출입구로 등록하는 함수
+
+        경계를 따라 이어진 구간마다 가운데(또는 양 끝) 칸 쌍만 출입구로 남겨
+        추상 그래프를 작게 유지합니다.
+        """
+        # (지역쌍, 경계 방향, 경계선 위치)별로 경계 칸 쌍 모으기
+        segments = {}
+        for (x, y), area in self.area_of.items():
+            for dx, dy in ((1, 0), (0, 1)):
+                neighbor = (x + dx, y + dy)
+                other = self.area_of.get(neighbor)
+                if other is None or other == area:
+                    continue
+                if not (self._is_free((x, y)) and self._is_free(neighbor)):
+                    continue
+                # 세로 경계(dx=1)는 y를 따라, 가로 경계(dy=1)는 x를 따라 이어짐
+                line = x if dx else y
+                along = y if dx else x
+                key = (area, other, dx, line)
+                segments.setdefault(key, []).append((along, (x, y), neighbor))
+
+        for pairs in segments.values():
+            pairs.sort()
+            run = [pairs[0]]
+            for item in pairs[1:]:
+                if item[0] == run[-1][0] + 1:
+                    run.append(item)
+                    continue
+                self._register_run(run)
+                run = [item]
+            self._register_run(run)
+
+    def _register_run(self, run):
+        if len(run) >= WIDE_ENTRANCE:
+            chosen = [run[0], run[-1]]
+        else:
+            chosen = [run[len(run) // 2]]
+        for _, inside, outside in chosen:
+            self.entrances.setdefault(self.area_of[inside], set()).add(inside)
+            self.entrances.setdefault(self.area_of[outside], set()).add(outside)
+            self._add_edge(inside, outside, 1)
+
+    def _connect_intra_area(self):
+        """
+        지역마다 출입구끼리의 지역 내부 최단거리를 미리 계산하는 함수
+        """
+        for area, nodes in self.entrances.items():
+            cells = self.area_cells[area]
+            for node in nodes:
+                distance, _ = _bfs_within(self.grid_map, node, cells, nodes)
+                for other in nodes:
+                    if other != node and other in distance:
+                        self._add_edge(node, other, distance[other])
+
+    def _local_links(self, cell):
+        """
+        질의 지점에서 같은 지역 출입구까지의 거리를 계산하는 함수
+        """
+        area = self.area_of.get(cell)
+        nodes = self.entrances.get(area, set())
+        if area is None:
+            return {}
+        distance, _ = _bfs_within(self.grid_map, cell, self.area_cells[area], nodes)
+        return {node: distance[node] for node in nodes if node in distance}
+
+    def _abstract_search(self, start, end):
+        """
+        시작/끝 지점을 임시로 연결한 추상 그래프에서 다익스트라 탐색을 하는 함수
+
+        Returns:
+            list: 추상 경로 (노드 좌표 리스트), 없으면 빈 리스트
+        """
+        start_links = self._local_links(start)
+        end_links = self._local_links(end)
+
+        best = {start: 0}
+        parent = {start: None}
+        heap = [(0, start)]
+
+        # 같은 지역이면 지역 안에서 바로 가는 경로도 후보
+        if self.area_of.get(start) is not None and self.area_of.get(start) == self.area_of.get(end):
+            distance, _ = _bfs_within(self.grid_map, start, self.area_cells[self.area_of[start]], {end})
+            if end in distance:
+                best[end] = distance[end]
+                parent[end] = start
+                heapq.heappush(heap, (distance[end], end))
+
+        while heap:
+            cost, node = heapq.heappop(heap)
+            if cost > best.get(node, float('inf')):
+                continue
+            if node == end:
+                return _trace(parent, end)
+
+            neighbors = self.edges.get(node, {})
+            if node == start:
+                neighbors = {**neighbors, **start_links}
+            for other, weight in neighbors.items():
+                new_cost = cost + weight
+                if new_cost < best.get(other, float('inf')):
+                    best[other] = new_cost
+                    parent[other] = node
+                    heapq.heappush(heap, (new_cost, other))
+
+            # 끝 지점이 속한 지역의 출입구에서는 끝 지점으로 갈 수 있음
+            if node in end_links:
+                new_cost = cost + end_links[node]
+                if new_cost < best.get(end, float('inf')):
+                    best[end] = new_cost
+                    parent[end] = node
+                    heapq.heappush(heap, (new_cost, end))
+
+        return []
+
+    def _refine(self, a, b):
+        """
+        추상 경로의 한 구간을 실제 격자 경로로 바꾸는 함수 (해당 지역만 탐색)
+        """
+        if abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1:
+            return [a, b]
+        cells = self.area_cells[self.area_of[a]]
+        _, parent = _bfs_within(self.grid_map, a, cells, {b})
+        return _trace(parent, b)
+
+    def find_path(self, start, end):
+        """
+        계층적 탐색으로 start에서 end까지의 경로를 찾는 함수
+
+        Args:
+            start (tuple): 시작점 좌표
+            end (tuple): 끝점 좌표
+
+        Returns:
+            list: 경로 좌표 리스트 (없으면 빈 리스트)
+        """
+        if start == end:
+            return [start]
+        if not (self._is_free(start) and self._is_free(end)):
+            return []
+
+        abstract = self._abstract_search(start, end)
+        if not abstract:
+            return []
+
+        path = [start]
+        for a, b in zip(abstract, abstract[1:]):
+            path.extend(self._refine(a, b)[1:])
+        return path
+
+    def abstract_size(self):
+        """
+        추상 그래프 크기를 반환하는 함수
+
+        Returns:
+            tuple: (노드 수, 간선 수)
+        """
+        edge_count = sum(len(v) for v in self.edges.values()) // 2
+        return len(self.edges), edge_count
+
+
+def compare_with_flat(planner, start, end):
+    """
+    계층적 경로와 전체 격자 BFS(정확한 최단경로)의 길이를 비교하는 함수
+
+    Args:
+        planner (HierarchicalPlanner): 계층적 탐색기
+        start (tuple): 시작점 좌표
+        end (tuple): 끝점 좌표
+
+    Returns:
+        dict: 두 경로의 거리와 비율(hierarchical / flat)
+    """
+    from map_direct_save import bfs_shortest_path
+
+    hierarchical = planner.find_path(start, end)
+    flat = bfs_shortest_path(planner.grid_map, start, end)
+
+    report = {
+        'hierarchical_distance': len(hierarchical) - 1 if hierarchical else None,
+        'flat_distance': len(flat) - 1 if flat else None,
+        'ratio': None,
+    }
+    if hierarchical and flat and len(flat) > 1:
+        report['ratio'] = (len(hierarchical) - 1) / (len(flat) - 1)
+    return report
+
+
+def main():
+    """
+    메인 실행 함수
+    """
+    from map_direct_save import load_processed_data, find_start_and_end_points, create_grid_map
+
+    print('반달곰 커피 계층적 경로 탐색 (HPA*)')
+    print('=' * 50)
+
+    data, category_df = load_processed_data()
+    start_point, end_point = find_start_and_end_points(data, category_df)
+    if start_point is None or end_point is None:
+        print('시작점 또는 끝점을 찾을 수 없어서 경로 탐색을 중단합니다.')
+        return
+
+    grid_map = create_grid_map(data, start_point)
+    planner = HierarchicalPlanner(grid_map, build_area_lookup(data))
+    nodes, edges = planner.abstract_size()
+    print(f'추상 그래프: 출입구 {nodes}개, 간선 {edges}개')
+
+    report = compare_with_flat(planner, start_point, end_point)
+    print(f'계층적 경로 거리: {report["hierarchical_distance"]}칸')
+    print(f'전체 BFS 거리: {report["flat_distance"]}칸')
+    if report['ratio'] is not None:
+        print(f'경로 품질 (계층적/최단): {report["ratio"]:.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,323 @@
+"""
+백그라운드 작업 큐
+대시보드의 '지도 생성하기', '최단경로 찾기' 같은 오래 걸리는 작업을 작업 스레드에서
+별도 프로세스로 실행합니다. 화면은 작업 번호만 받아 두고 진행 상황을 주기적으로 읽어 갑니다.
+
+- 같은 작업 종류와 같은 입력(입력 파일 내용의 해시)이면 새로 실행하지 않고 기존 작업을 돌려줍니다.
+  파일 내용 해시는 (수정 시각, 크기)가 그대로면 다시 읽지 않고 기억해 둔 값을 씁니다.
+- 같은 종류의 작업은 결과 파일이 같으므로 한 번에 하나만 실행합니다.
+- 진행률은 스크립트가 출력하는 단계별 문구(이정표)를 몇 개 지났는지로 계산합니다.
+"""
+
+import collections
+import hashlib
+import itertools
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+import weakref
+
+from path_store import path_format
+from pipeline import INPUT_FILES, local_modules
+
+
+class JobSpec:
+    """
+    작업 종류 하나의 정의 (실행할 스크립트, 입력 파일, 진행률 이정표)
+    """
+
+    def __init__(self, name, script, inputs, outputs, milestones, formats=None):
+        """
+        Args:
+            name (str): 화면에 보일 작업 이름
+            script (str): 실행할 파이썬 스크립트
+            inputs (tuple): 결과에 영향을 주는 파일 (내용 해시로 중복 판단, 스크립트는 자동으로 포함)
+            outputs (tuple): 작업이 만드는 파일 (지워졌으면 끝난 작업도 다시 실행)
+            milestones (tuple): 스크립트 출력에 차례로 나타나는 문구 (진행률 계산용)
+            formats (dict): 경로 파일 결과의 저장 형식 {파일: path_store 형식}
+                (다른 형식으로 바뀌어 있으면 끝난 작업도 다시 실행)
+        """
+        self.name = name
+        self.script = script
+        self.inputs = tuple(dict.fromkeys(tuple(inputs) + (script,)))
+        self.outputs = tuple(outputs)
+        self.milestones = tuple(milestones)
+        self.formats = dict(formats or {})
+
+    def outputs_ready(self):
+        """
+        결과 파일이 모두 있고 기대한 형식인지 확인하는 함수
+        """
+        if not all(os.path.exists(name) for name in self.outputs):
+            return False
+        try:
+            return all(path_format(name) == expected for name, expected in self.formats.items())
+        except ValueError:
+            return False
+
+
+# 입력에는 스크립트가 불러오는 이 폴더의 도우미 모듈도 포함 (모듈이 바뀌면 끝난 작업도 다시 실행)
+JOB_SPECS = {
+    'map': JobSpec('지도 생성', 'map_draw_real.py', INPUT_FILES + local_modules('map_draw_real.py'), ('map.png',),
+                   ('불러온 데이터 크기', '좌표 범위', '지도가 map.png')),
+    'route': JobSpec('최단경로 찾기', 'map_direct_save.py', INPUT_FILES + local_modules('map_direct_save.py'),
+                     ('map_final.png', 'home_to_cafe.csv'),
+                     ('불러온 데이터 크기', '시작점:', '격자 지도 생성 완료', '경로 탐색 성공',
+                      '지도가 map_final.png', '경로가'),
+                     formats={'home_to_cafe.csv': 'legacy'}),
+}
+
+# 작업 상태
+QUEUED, RUNNING, DONE, FAILED = 'queued', 'running', 'done', 'failed'
+
+# 끝난 작업을 기억하는 개수
+HISTORY = 50
+
+# 만들어진 작업 큐들 (wait_all에서 사용)
+_queues = weakref.WeakSet()
+
+# 파일 이름 → ((수정 시각, 크기), 내용 해시)
+_digests = {}
+_digests_lock = threading.Lock()
+
+
+def _hash_file(name):
+    digest = hashlib.sha1()
+    with open(name, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.digest()
+
+
+def file_digest(name):
+    """
+    파일 내용 해시 (수정 시각과 크기가 그대로면 파일을 다시 읽지 않음, 파일이 없으면 None)
+    """
+    try:
+        stat = os.stat(name)
+    except FileNotFoundError:
+        return None
+    state = (stat.st_mtime_ns, stat.st_size)
+    with _digests_lock:
+        cached = _digests.get(name)
+    if cached is not None and cached[0] == state:
+        return cached[1]
+    digest = _hash_file(name)
+    with _digests_lock:
+        _digests[name] = (state, digest)
+    return digest
+
+
+def input_hash(spec):
+    """
+    작업 종류와 입력 파일 내용으로 중복 판단용 해시를 계산하는 함수
+
+    버튼을 누를 때마다 화면 스레드에서 불리므로, 바뀌지 않은 파일은 stat 한 번으로 끝납니다.
+    """
+    digest = hashlib.sha1(spec.script.encode('utf-8'))
+    for name in spec.inputs:
+        digest.update(name.encode('utf-8'))
+        digest.update(file_digest(name) or b'')
+    return digest.hexdigest()[:16]
+
+
+class Job:
+    """
+    작업 하나의 상태 (작업 스레드가 쓰고 화면이 읽음)
+    """
+
+    def __init__(self, job_id, kind, name, key):
+        self.id = job_id
+        self.kind = kind
+        self.name = name
+        self.key = key
+        self.status = QUEUED
+        self.progress = 0.0
+        self.message = '대기 중'
+        self.error = None
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def active(self):
+        return self.status in (QUEUED, RUNNING)
+
+    def update(self, **fields):
+        with self._lock:
+            for name, value in fields.items():
+                setattr(self, name, value)
+
+    def snapshot(self):
+        """
+        화면에 보여 줄 현재 상태 (한 번에 읽은 값)
+        """
+        with self._lock:
+            elapsed = None
+            if self.started_at is not None:
+                elapsed = (self.finished_at or time.time()) - self.started_at
+            return {
+                'id': self.id,
+                'kind': self.kind,
+                'name': self.name,
+                'key': self.key,
+                'status': self.status,
+                'progress': self.progress,
+                'message': self.message,
+                'error': self.error,
+                'elapsed': elapsed,
+            }
+
+
+class JobQueue:
+    """
+    작업 스레드 여러 개로 작업을 처리하는 큐 (프로세스에 하나 두고 모든 세션이 함께 사용)
+    """
+
+    def __init__(self, workers=2, specs=None):
+        """
+        Args:
+            workers (int): 작업 스레드 수 (종류가 다른 작업은 동시에 실행)
+            specs (dict): 작업 종류별 JobSpec (None이면 JOB_SPECS)
+        """
+        self.specs = specs or JOB_SPECS
+        self._queue = queue.Queue()
+        self._jobs = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._kind_locks = {kind: threading.Lock() for kind in self.specs}
+        self._ids = itertools.count(1)
+        self._threads = [
+            threading.Thread(target=self._work, name=f'job-worker-{n}', daemon=True)
+            for n in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+        _queues.add(self)
+
+    def submit(self, kind, force=False):
+        """
+        작업을 큐에 넣는 함수
+
+        같은 종류와 같은 입력의 작업이 대기 중이거나 실행 중이면 그 작업을 돌려주고,
+        이미 성공했고 결과 파일이 남아 있으면(force가 아니면) 다시 실행하지 않고 그 작업을 돌려줍니다.
+
+        Args:
+            kind (str): 작업 종류 (JOB_SPECS의 키)
+            force (bool): True면 성공한 같은 작업이 있어도 다시 실행
+
+        Returns:
+            Job: 새로 넣었거나 이미 있던 작업
+        """
+        if kind not in self.specs:
+            raise ValueError(f'알 수 없는 작업 종류입니다: {kind}')
+        spec = self.specs[kind]
+        key = input_hash(spec)
+        reusable = not force and spec.outputs_ready()
+
+        with self._lock:
+            for job in reversed(self._jobs.values()):
+                if job.kind == kind and job.key == key and (job.active or (job.status == DONE and reusable)):
+                    return job
+
+            job = Job(next(self._ids), kind, spec.name, key)
+            self._jobs[job.id] = job
+            while len(self._jobs) > HISTORY:
+                oldest = next(iter(self._jobs.values()))
+                if oldest.active:
+                    break
+                self._jobs.popitem(last=False)
+        self._queue.put(job)
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self):
+        """
+        기억하고 있는 작업들의 상태 (최근 작업이 먼저)
+        """
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return [job.snapshot() for job in reversed(jobs)]
+
+    def _work(self):
+        while True:
+            job = self._queue.get()
+            try:
+                # 같은 종류(같은 결과 파일)는 한 번에 하나만
+                with self._kind_locks[job.kind]:
+                    self._run(job)
+            except Exception as e:
+                # 실행 중(RUNNING)으로 남으면 같은 입력의 작업이 모두 이 작업을 기다리게 되므로 실패로 표시
+                job.update(status=FAILED, error=f'{type(e).__name__}: {e}', finished_at=time.time())
+            finally:
+                self._queue.task_done()
+
+    def _run(self, job):
+        spec = self.specs[job.kind]
+        job.update(status=RUNNING, started_at=time.time(), message='시작')
+        command = [sys.executable, spec.script]
+        env = dict(os.environ, PYTHONUNBUFFERED='1')
+
+        try:
+            process = subprocess.Popen(
+                command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                text=True, encoding='utf-8', errors='replace', env=env,
+            )
+        except OSError as e:
+            job.update(status=FAILED, error=str(e), finished_at=time.time())
+            return
+
+        passed = 0
+        tail = collections.deque(maxlen=20)
+        try:
+            for line in process.stdout:
+                line = line.rstrip()
+                if not line:
+                    continue
+                tail.append(line)
+                while passed < len(spec.milestones) and spec.milestones[passed] in line:
+                    passed += 1
+                job.update(progress=passed / len(spec.milestones) if spec.milestones else 0.0, message=line)
+        except BaseException:
+            # 출력을 읽다가 예외가 나면 프로세스를 남겨 두지 않음 (작업은 _work에서 실패로 표시)
+            process.kill()
+            process.wait()
+            raise
+        process.wait()
+
+        if process.returncode == 0:
+            job.update(status=DONE, progress=1.0, message='완료', finished_at=time.time())
+        else:
+            job.update(status=FAILED, error='\n'.join(tail), finished_at=time.time())
+
+    def wait(self, timeout=None):
+        """
+        큐에 들어간 작업이 모두 끝날 때까지 기다리는 함수 (스크립트/측정용)
+        """
+        began = time.time()
+        while self._queue.unfinished_tasks:
+            if timeout is not None and time.time() - began > timeout:
+                return False
+            time.sleep(0.05)
+        return True
+
+
+def wait_all(timeout=None):
+    """
+    이 프로세스에서 만든 모든 작업 큐의 작업이 끝날 때까지 기다리는 함수 (부하 테스트 정리용)
+
+    Returns:
+        bool: 제한 시간 안에 모두 끝났으면 True
+    """
+    began = time.time()
+    for job_queue in list(_queues):
+        remaining = None if timeout is None else max(0.0, timeout - (time.time() - began))
+        if not job_queue.wait(remaining):
+            return False
+    return True
@@ -0,0 +1,256 @@
+"""
+대시보드 부하 테스트
+Streamlit 앱 테스트 API(AppTest)로 app.py를 브라우저 없이 실행합니다.
+가상 세션 N개가 동시에 단계 페이지를 오가며 생성 버튼을 누르고,
+페이지별로 응답 시간 p50/p95/p99와 최대 메모리를 보고합니다.
+
+- 세션들은 한 프로세스 안의 스레드이므로 실제 서버처럼 st.cache_resource / st.cache_data와
+  백그라운드 작업 큐를 함께 씁니다. (캐시와 fragment 작업의 효과를 비교하는 용도)
+- 주의: AppTest는 실행할 때마다 전역 Runtime과 설정을 바꿔 끼우므로 두 실행이 겹치면 안 됩니다.
+  그래서 이 도구는 스크립트 실행을 자체 잠금(_run_lock)으로 한 번에 하나씩만 하고, 세션들은 차례를 기다립니다.
+  응답 시간의 대부분은 이 잠금을 기다린 시간이라 실제 서버의 동시 처리 성능이 아닙니다.
+  세션 간 비교나 서버 동시성은 실행 시간과 잠금 대기를 나눠 보거나, 서버 프로세스를 따로 띄워 측정해야 합니다.
+    실행 시간: 스크립트 한 번이 실행되는 데 걸린 시간
+    잠금 대기: 실행 차례를 기다린 시간 (하네스가 만든 대기)
+    응답 시간: 버튼을 누른 때부터 화면이 나올 때까지 (= 잠금 대기 + 실행 시간)
+- 메모리는 tracemalloc으로 잰 파이썬 할당량입니다. 실행이 겹치지 않으므로 그 페이지를
+  실행하는 동안의 최댓값과 실행 전보다 늘어난 양을 페이지별로 셀 수 있습니다.
+  tracemalloc은 실행을 느리게 하므로 응답 시간만 볼 때는 --no-memory를 사용합니다.
+
+사용법:
+    python load_test.py                      # 세션 4개 × 페이지 이동 10번
+    python load_test.py -s 16 -r 20          # 세션 16개 × 20번
+    python load_test.py --fresh              # 결과 파일이 없는 임시 복사본 폴더에서 실행 (생성 버튼 측정)
+    python load_test.py --no-memory --seed 1
+"""
+
+import argparse
+import glob
+import importlib.util
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+import numpy as np
+
+
+# 사이드바에서 고르는 단계 페이지 (app.py의 PAGES 이름과 같아야 함)
+STAGE_PAGES = ("프로젝트 소개", "1단계: 데이터 분석", "2단계: 지도 시각화", "3단계: 최단경로 탐색")
+
+# 페이지별 생성 버튼 (결과 파일이 없을 때만 보임)
+GENERATE_BUTTONS = {
+    "2단계: 지도 시각화": "🗺 지도 생성하기",
+    "3단계: 최단경로 탐색": "🎯 최단경로 찾기",
+}
+
+# 생성 버튼이 만드는 결과 파일 (--fresh의 임시 복사본에서 빼는 파일)
+GENERATED_FILES = ('map.png', 'map_final.png')
+
+# --fresh 임시 복사본으로 옮기는 파일 (앱과 작업 스크립트가 읽는 파일)
+COPY_PATTERNS = ('*.py', '*.csv', '*.png')
+
+# 결과 표 위에 항상 출력하는 안내
+SERIAL_NOTICE = (
+    '주의: AppTest 실행은 이 도구의 잠금으로 한 번에 하나씩만 진행됩니다. '
+    '응답 시간에는 이 잠금을 기다린 시간이 포함되므로 실제 서버의 동시 처리 성능이 아닙니다.'
+)
+
+# AppTest 실행은 한 번에 하나씩 (전역 Runtime을 바꿔 끼우므로)
+_run_lock = threading.Lock()
+
+
+def percentile(values, q):
+    return float(np.percentile(values, q)) if values else float('nan')
+
+
+def run_session(number, pages, rounds, rng, think, timeout, records, errors, jobs):
+    """
+    가상 세션 하나: 첫 화면을 연 뒤 페이지를 rounds번 바꾸고, 생성 버튼이 보이면 누름
+
+    Args:
+        records (list): (동작 이름, 요청 시각, 실행 시작, 실행 끝, 실행 전 메모리, 최대 메모리)를
+            추가할 리스트 (세션끼리 공유)
+        errors (list): (세션 번호, 동작 이름, 메시지)를 추가할 리스트
+        jobs (list): 세션이 받은 백그라운드 작업 번호 ({종류: 번호})를 추가할 리스트
+    """
+    from streamlit.testing.v1 import AppTest
+
+    def timed(label, action):
+        requested = time.perf_counter()
+        with _run_lock:
+            began = time.perf_counter()
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            try:
+                at = action()
+            except Exception as e:
+                errors.append((number, label, f'{type(e).__name__}: {e}'))
+                return None
+            ended = time.perf_counter()
+            peak = tracemalloc.get_traced_memory()[1]
+        records.append((label, requested, began, ended, before, peak))
+        for exception in at.exception:
+            errors.append((number, label, exception.message))
+        return at
+
+    # from_file은 상대 경로를 이 파일 기준으로 찾으므로 현재 폴더(--fresh면 복사본)의 절대 경로로 지정
+    at = AppTest.from_file(os.path.abspath('app.py'), default_timeout=timeout)
+    if timed('(첫 화면)', at.run) is None:
+        return
+
+    for _ in range(rounds):
+        page = rng.choice(pages)
+        if timed(page, lambda: at.sidebar.selectbox[0].select(page).run()) is None:
+            return
+
+        label = GENERATE_BUTTONS.get(page)
+        buttons = [b for b in at.button if b.label == label and not b.disabled] if label else []
+        if buttons:
+            timed(f'{page} [{label}]', lambda: buttons[0].click().run())
+        if think:
+            time.sleep(think)
+
+    jobs.append({key: at.session_state[key] for key in ('job_map', 'job_route') if key in at.session_state})
+
+
+def report(records, errors, jobs, memory, elapsed):
+    """
+    페이지별 실행/응답 시간과 메모리 요약 출력
+    """
+    pages, job_ids = {}, {}
+    for label, requested, began, ended, before, peak in records:
+        page = pages.setdefault(label, {'run': [], 'wait': [], 'response': [], 'peak': 0, 'growth': 0})
+        page['run'].append((ended - began) * 1000)
+        page['wait'].append((began - requested) * 1000)
+        page['response'].append((ended - requested) * 1000)
+        page['peak'] = max(page['peak'], peak)
+        page['growth'] = max(page['growth'], peak - before)
+
+    total = len(records)
+    print(f'총 {total}회 실행 (한 번에 하나씩), {elapsed:.1f}초 ({total / elapsed:.1f}회/초)')
+    print()
+    print(SERIAL_NOTICE)
+    print()
+    header = f'{"":<32}{"":>6}{"실행 시간 (ms)":^24}{"잠금 대기 (ms)":^24}{"응답 시간 (ms)":^24}'
+    columns = f'{"페이지":<32}{"횟수":>6}' + f'{"p50":>8}{"p95":>8}{"p99":>8}' * 3
+    if memory:
+        header += f'{"메모리 (MB)":^16}'
+        columns += f'{"최대":>8}{"증가":>8}'
+    print(header)
+    print(columns)
+    for label, page in sorted(pages.items()):
+        line = f'{label:<32}{len(page["run"]):>6}'
+        for values in (page['run'], page['wait'], page['response']):
+            line += ''.join(f'{percentile(values, q):>8.0f}' for q in (50, 95, 99))
+        if memory:
+            line += f'{page["peak"] / 1024 / 1024:>8.1f}{page["growth"] / 1024 / 1024:>8.1f}'
+        print(line)
+
+    for session_jobs in jobs:
+        for kind, job_id in session_jobs.items():
+            job_ids.setdefault(kind, set()).add(job_id)
+    if job_ids:
+        print()
+        for kind, ids in job_ids.items():
+            print(f'{kind} 작업: 세션들이 받은 작업 번호 {sorted(ids)} (같은 입력은 한 작업을 함께 기다림)')
+    if errors:
+        print()
+        print(f'오류 {len(errors)}건:')
+        for number, label, message in errors[:10]:
+            print(f'  세션 {number} {label}: {message}')
+
+
+def fresh_copy(workdir):
+    """
+    생성 결과 파일을 뺀 작업 폴더 복사본을 만드는 함수 (원래 폴더의 결과 파일은 건드리지 않음)
+    """
+    for pattern in COPY_PATTERNS:
+        for name in glob.glob(pattern):
+            if name not in GENERATED_FILES:
+                shutil.copy2(name, workdir)
+    if os.path.isdir('.streamlit'):
+        shutil.copytree('.streamlit', os.path.join(workdir, '.streamlit'))
+
+
+def main():
+    """
+    메인 실행 함수
+    """
+    parser = argparse.ArgumentParser(description='대시보드 부하 테스트 (AppTest 가상 세션)')
+    parser.add_argument('-s', '--sessions', type=int, default=4, help='동시에 실행할 가상 세션 수')
+    parser.add_argument('-r', '--rounds', type=int, default=10, help='세션마다 페이지를 바꾸는 횟수')
+    parser.add_argument('--pages', nargs='+', default=list(STAGE_PAGES), help='오갈 페이지 이름')
+    parser.add_argument('--think', type=float, default=0.0, help='동작 사이에 쉬는 시간 (초)')
+    parser.add_argument('--timeout', type=float, default=120.0, help='한 번 실행의 제한 시간 (초)')
+    parser.add_argument('--seed', type=int, default=None, help='페이지 선택 난수 시드')
+    parser.add_argument('--fresh', action='store_true',
+                        help='결과 파일이 없는 임시 복사본 폴더에서 실행 (생성 버튼 측정, 원래 파일은 그대로)')
+    parser.add_argument('--no-memory', action='store_true', help='tracemalloc 메모리 측정 끄기')
+    args = parser.parse_args()
+
+    if importlib.util.find_spec('streamlit') is None:
+        print('streamlit이 설치되어 있지 않아 부하 테스트를 실행할 수 없습니다.')
+        sys.exit(1)
+    if args.sessions < 1 or args.rounds < 0:
+        raise ValueError('세션 수는 1 이상, 횟수는 0 이상이어야 합니다.')
+    original = os.getcwd()
+    workdir = None
+    if args.fresh:
+        workdir = tempfile.TemporaryDirectory(prefix='load-test-')
+        fresh_copy(workdir.name)
+        os.chdir(workdir.name)
+        print(f'결과 파일({", ".join(GENERATED_FILES)})이 없는 복사본 {workdir.name}에서 실행합니다.')
+
+    try:
+        errors = run(args)
+    finally:
+        if workdir is not None:
+            # 생성 버튼으로 시작된 작업이 복사본에 쓰기를 마친 뒤에 지움
+            if 'job_queue' in sys.modules and not sys.modules['job_queue'].wait_all(args.timeout):
+                print('경고: 제한 시간 안에 끝나지 않은 백그라운드 작업이 있습니다.')
+            os.chdir(original)
+            workdir.cleanup()
+    sys.exit(1 if errors else 0)
+
+
+def run(args):
+    """
+    가상 세션들을 실행하고 결과를 출력하는 함수
+
+    Returns:
+        list: 오류 리스트
+    """
+    print(f'가상 세션 {args.sessions}개 × 페이지 이동 {args.rounds}번 ({", ".join(args.pages)})')
+    print(SERIAL_NOTICE)
+    seeds = random.Random(args.seed)
+    records, errors, jobs = [], [], []
+    threads = [
+        threading.Thread(
+            target=run_session, name=f'load-test-session-{n}',
+            args=(n, args.pages, args.rounds, random.Random(seeds.random()), args.think, args.timeout,
+                  records, errors, jobs),
+        )
+        for n in range(1, args.sessions + 1)
+    ]
+
+    if not args.no_memory:
+        tracemalloc.start()
+    began = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - began
+    tracemalloc.stop()
+
+    report(records, errors, jobs, not args.no_memory, elapsed)
+    return errors
+
+
+if __name__ == '__main__':
+    main()
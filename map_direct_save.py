@@ -3,38 +3,63 @@
 반달곰 커피 프로젝트의 세 번째 단계로 BFS를 이용해 MyHome에서 BandalgomCoffee까지의 최단경로를 찾습니다.
 """
 
+import os
+import sys
+import numpy as np
 import pandas as pd
 from collections import deque
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
 
-# 한글 폰트 경고 방지 - 영어 폰트 사용
-plt.rcParams['font.family'] = 'DejaVu Sans'
+from area_registry import AreaRegistry, DEFAULT_AREA
+from csv_ingest import read_inputs
+from grid_components import create_grid_map
+from path_store import PathSink, compress_path
+from profiling import profiled
+from vector_bfs import grid_distance_field
 
 
-def load_processed_data():
+def _load_pyplot():
     """
-    전체 데이터를 불러오는 함수 (MyHome 위치 포함)
+    matplotlib을 실제로 그림을 그릴 때만 불러오는 함수 (경로 계산만 할 때는 불러오지 않음)
     
     Returns:
-        tuple: (전체 데이터프레임, 카테고리 데이터프레임)
+        module: matplotlib.pyplot
     """
-    # CSV 파일들 불러오기
-    area_map = pd.read_csv('area_map.csv')
-    area_struct = pd.read_csv('area_struct.csv')
-    area_category = pd.read_csv('area_category.csv')
-    
-    # 컬럼명과 데이터의 공백 제거
-    area_category.columns = area_category.columns.str.strip()
-    area_category['struct'] = area_category['struct'].str.strip()
+    import matplotlib.pyplot as plt
     
-    # 세 데이터를 하나의 DataFrame으로 병합
-    merged_data = area_map.merge(area_struct, on=['x', 'y'], how='left')
+    # 한글 폰트 경고 방지 - 영어 폰트 사용
+    plt.rcParams['font.family'] = 'DejaVu Sans'
+    return plt
+
+
+def load_processed_data(area_id=None, inputs=None, registry=None):
+    """
+    전체 데이터를 불러오는 함수 (MyHome 위치 포함)
     
-    # y좌표를 1부터 시작하도록 변환 (8→1, 9→2, ..., 15→8)
-    merged_data['y'] = merged_data['y'] - 7
+    Args:
+        area_id (int): 특정 지역만 사용할 경우 지역 번호 (None이면 전체 데이터)
+        inputs (tuple): 이미 읽어 둔 (area_map, area_struct, area_category) (None이면 파일에서 읽음)
+        registry (AreaRegistry): 이미 결합해 둔 데이터의 레지스트리 (주면 다시 결합하지 않고 지역 캐시를 이어 씀)
     
-    # 전체 데이터 사용 (area 필터링 제거)
+    Returns:
+        tuple: (전체 데이터프레임, 카테고리 데이터프레임)
+    """
+    # CSV 파일들 불러오기 (선언한 스키마로 읽고 검증, BOM과 공백은 읽을 때 정리)
+    area_map, area_struct, area_category = inputs if inputs is not None else read_inputs()
+    
+    # 두 데이터를 (x, y) 기준으로 결합 (격자이면 배열 인덱스로 바로 정렬)
+    if registry is None:
+        registry = AreaRegistry.from_inputs(area_map, area_struct)
+    merged_data = registry.data
+    
+    if area_id is not None:
+        # 선택한 지역의 행만 사용 (지역 좌측 상단이 (1, 1)이 되도록 보정)
+        area_data = registry.area_frame(area_id)
+        print(f'area {area_id} 데이터 크기: {area_data.shape}')
+        return area_data, area_category
+    
+    # 전체 데이터 사용, 좌표는 기본 지역 기준으로 보정 (area 1: y 8→1, 9→2, ..., 15→8)
+    dx, dy = registry.box(DEFAULT_AREA).offset
+    merged_data = merged_data.offset(dx, dy)
     print(f'전체 데이터 크기: {merged_data.shape}')
     
     return merged_data, area_category
@@ -69,14 +94,14 @@ def find_start_and_end_points(data, category_df):
     
     if not home_data_full.empty:
         # 전체 데이터에서 MyHome 발견 - 실제 위치 사용
-        start_point = (int(home_data_full.iloc[0]['x']), int(home_data_full.iloc[0]['y']))
+        start_point = (int(np.asarray(home_data_full['x'])[0]), int(np.asarray(home_data_full['y'])[0]))
         print(f'MyHome 실제 위치: {start_point}')
     else:
         print('경고: MyHome을 찾을 수 없습니다.')
         return None, None
     
     # 첫 번째 카페 위치를 목적지로 사용
-    end_point = (int(cafe_data_full.iloc[0]['x']), int(cafe_data_full.iloc[0]['y']))
+    end_point = (int(np.asarray(cafe_data_full['x'])[0]), int(np.asarray(cafe_data_full['y'])[0]))
     
     print(f'시작점: {start_point}')
     print(f'목적지 (BandalgomCoffee): {end_point}')
@@ -84,39 +109,6 @@ def find_start_and_end_points(data, category_df):
     return start_point, end_point
 
 
-def create_grid_map(data, start_point=None):
-    """
-    BFS를 위한 격자 지도를 생성하는 함수
-    
-    Args:
-        data (pandas.DataFrame): 데이터프레임
-        start_point (tuple): 시작점 좌표 (격자 맵에 추가할 경우)
-        
-    Returns:
-        dict: {(x, y): '장애물여부'} 형태의 격자 지도
-    """
-    grid_map = {}
-    
-    for _, row in data.iterrows():
-        x, y = int(row['x']), int(row['y'])
-        
-        # 건설현장은 장애물
-        if row['ConstructionSite'] == 1:
-            grid_map[(x, y)] = 'obstacle'
-        # Apartment와 Building도 장애물
-        elif row['category'] in [1, 2]:  # 1: Apartment, 2: Building
-            grid_map[(x, y)] = 'obstacle'
-        else:
-            grid_map[(x, y)] = 'free'
-    
-    # 시작점이 격자 맵에 없다면 추가 (MyHome이 area 1 외부에 있는 경우)
-    if start_point and start_point not in grid_map:
-        grid_map[start_point] = 'free'
-        print(f'시작점 {start_point}을 격자 맵에 추가했습니다.')
-    
-    return grid_map
-
-
 def bfs_shortest_path(grid_map, start, end):
     """
     BFS 알고리즘을 이용해 최단경로를 찾는 함수
@@ -129,6 +121,12 @@ def bfs_shortest_path(grid_map, start, end):
     Returns:
         list: 최단경로 좌표 리스트
     """
+    # 연결 요소 인덱스가 있으면 서로 다른 요소인지 먼저 확인 (탐색 없이 바로 판단)
+    components = getattr(grid_map, 'components', None)
+    if components is not None and not components.connected(start, end):
+        print('경로를 찾을 수 없습니다.')
+        return []
+    
     # BFS 초기화
     queue = deque([(start, [start])])
     visited = {start}
@@ -166,24 +164,20 @@ def bfs_shortest_path(grid_map, start, end):
     return []
 
 
-def visualize_path(data, category_df, path, start, end):
+def draw_base_map(ax, data, category_df):
     """
-    경로를 시각화하는 함수
+    격자, 건설현장, 구조물과 축 설정 등 경로와 상관없는 지도 바탕을 그리는 함수
+    (visualize_path와 탐색 애니메이션이 같은 모양을 쓰도록 분리)
     
     Args:
-        data (pandas.DataFrame): 데이터프레임
+        ax (matplotlib.axes.Axes): 그림을 그릴 축
+        data (pandas.DataFrame | GridFrame): 데이터프레임 또는 결합된 격자 데이터
         category_df (pandas.DataFrame): 카테고리 데이터프레임
-        path (list): 경로 좌표 리스트
-        start (tuple): 시작점
-        end (tuple): 끝점
     """
     # 좌표 범위 확인
     x_min, x_max = data['x'].min(), data['x'].max()
     y_min, y_max = data['y'].min(), data['y'].max()
     
-    # 그래프 설정
-    fig, ax = plt.subplots(figsize=(12, 10))
-    
     # 좌표계 설정
     ax.set_xlim(x_min - 0.5, x_max + 0.5)
     ax.set_ylim(y_min - 0.5, y_max + 0.5)  # y축 범위 설정
@@ -237,7 +231,7 @@ def visualize_path(data, category_df, path, start, end):
     
     # 구조물 시각화
     structures = data[data['category'] != 0]
-    for category in structures['category'].unique():
+    for category in pd.unique(structures['category']):
         struct_name = category_mapping.get(category, f'Category_{category}')
         struct_data = structures[structures['category'] == category]
         
@@ -253,31 +247,122 @@ def visualize_path(data, category_df, path, start, end):
             label=struct_name
         )
     
-    # 경로 시각화
-    if path:
-        path_x = [point[0] for point in path]
-        path_y = [point[1] for point in path]
-        
-        # 경로 선 그리기
-        ax.plot(path_x, path_y, 'r-', linewidth=3, alpha=0.7, label='Shortest Path')
-        
-        # 경로 점들 표시
-        ax.scatter(path_x, path_y, c='red', s=50, alpha=0.7, zorder=5)
-        
-        # 시작점과 끝점 강조
-        ax.scatter(start[0], start[1], c='blue', s=400, marker='*', 
-                  edgecolors='black', linewidth=2, label='Start', zorder=6)
-        ax.scatter(end[0], end[1], c='red', s=400, marker='*', 
-                  edgecolors='black', linewidth=2, label='End', zorder=6)
-    
     # 축 설정
     ax.set_xlabel('X Coordinate', fontsize=12)
     ax.set_ylabel('Y Coordinate', fontsize=12)
-    ax.set_title('Coffee Map with Shortest Path', fontsize=16, fontweight='bold')
     
     # 격자 눈금 설정
     ax.set_xticks(range(x_min, x_max + 1))
     ax.set_yticks(range(y_min, y_max + 1))
+
+
+def draw_path(ax, path, start, end):
+    """
+    경로 선과 경로 점, 시작점/끝점 별표를 그리는 함수
+    
+    Args:
+        ax (matplotlib.axes.Axes): 그림을 그릴 축
+        path (list): 경로 좌표 리스트
+        start (tuple): 시작점
+        end (tuple): 끝점
+    """
+    path_x = [point[0] for point in path]
+    path_y = [point[1] for point in path]
+    
+    # 경로 선 그리기
+    ax.plot(path_x, path_y, 'r-', linewidth=3, alpha=0.7, label='Shortest Path')
+    
+    # 경로 점들 표시
+    ax.scatter(path_x, path_y, c='red', s=50, alpha=0.7, zorder=5)
+    
+    # 시작점과 끝점 강조
+    ax.scatter(start[0], start[1], c='blue', s=400, marker='*', 
+              edgecolors='black', linewidth=2, label='Start', zorder=6)
+    ax.scatter(end[0], end[1], c='red', s=400, marker='*', 
+              edgecolors='black', linewidth=2, label='End', zorder=6)
+
+
+def render_path_image(data, category_df, path, start, end, dpi=100):
+    """
+    경로가 겹쳐진 지도를 파일로 저장하지 않고 PNG 바이트로 만드는 함수
+    
+    pyplot의 전역 상태를 쓰지 않고 Figure 객체를 직접 만들므로
+    대시보드의 여러 세션 스레드에서 동시에 불러도 됩니다.
+    
+    Args:
+        data (pandas.DataFrame | GridFrame): 데이터프레임 또는 결합된 격자 데이터
+        category_df (pandas.DataFrame): 카테고리 데이터프레임
+        path (list): 경로 좌표 리스트 (비어 있으면 지도만)
+        start (tuple): 시작점
+        end (tuple): 끝점
+        dpi (int): 해상도
+    
+    Returns:
+        bytes: PNG 이미지
+    """
+    import io
+    from matplotlib.figure import Figure
+    
+    fig = Figure(figsize=(12, 10))
+    ax = fig.subplots()
+    draw_base_map(ax, data, category_df)
+    if path:
+        draw_path(ax, path, start, end)
+    ax.set_title(f'Route {start} -> {end}', fontsize=16, fontweight='bold')
+    ax.legend(loc='upper left', bbox_to_anchor=(1.02, 1), fontsize=10)
+    
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight')
+    return buffer.getvalue()
+
+
+def visualize_path(data, category_df, path, start, end, field=None, waypoints=False):
+    """
+    경로를 시각화하는 함수
+    
+    Args:
+        data (pandas.DataFrame | GridFrame): 데이터프레임 또는 결합된 격자 데이터
+        category_df (pandas.DataFrame): 카테고리 데이터프레임
+        path (list): 경로 좌표 리스트 (꼭짓점만 남긴 경로도 가능)
+        start (tuple): 시작점
+        end (tuple): 끝점
+        field (DistanceField): 주어지면 시작점에서의 거리를 배경 히트맵으로 표시
+        waypoints (bool): True면 경로를 꼭짓점으로 접어 선 꼭짓점과 점을 꺾이는 곳에만 그림
+    """
+    plt = _load_pyplot()
+    
+    # 그래프 설정
+    fig, ax = plt.subplots(figsize=(12, 10))
+    
+    # 격자, 건설현장, 구조물
+    draw_base_map(ax, data, category_df)
+    x_min, x_max = data['x'].min(), data['x'].max()
+    y_min, y_max = data['y'].min(), data['y'].max()
+    
+    # 거리 히트맵 (도달할 수 없는 칸은 비워 둠)
+    if field is not None:
+        height, width = field.distance.shape
+        heat = np.ma.masked_less(field.distance, 0)
+        ax.imshow(
+            heat,
+            cmap='YlOrRd',
+            alpha=0.35,
+            zorder=0,
+            aspect='auto',
+            extent=(field.x0 - 0.5, field.x0 + width - 0.5, field.y0 + height - 0.5, field.y0 - 0.5)
+        )
+        # imshow가 바꾼 좌표 범위를 원래대로 (y축은 뒤집힌 상태 유지)
+        ax.set_xlim(x_min - 0.5, x_max + 0.5)
+        ax.set_ylim(y_max + 0.5, y_min - 0.5)
+    
+    # 경로 시각화
+    if path:
+        if waypoints:
+            path = compress_path(path)
+        draw_path(ax, path, start, end)
+    
+    # 제목
+    ax.set_title('Coffee Map with Shortest Path', fontsize=16, fontweight='bold')
     
     # 범례 추가
     ax.legend(loc='upper left', bbox_to_anchor=(1.02, 1), fontsize=10)
@@ -285,8 +370,9 @@ def visualize_path(data, category_df, path, start, end):
     # 그래프 조정
     plt.tight_layout()
     
-    # 이미지 저장
-    plt.savefig('map_final.png', dpi=300, bbox_inches='tight')
+    # 이미지 저장 (임시 파일에 쓴 뒤 이름을 바꿔서 대시보드가 반쯤 저장된 그림을 읽지 않게 함)
+    plt.savefig('map_final.png.tmp', format='png', dpi=300, bbox_inches='tight')
+    os.replace('map_final.png.tmp', 'map_final.png')
     print('최단경로가 포함된 지도가 map_final.png 파일로 저장되었습니다.')
     
     # 화면에 표시
@@ -296,17 +382,28 @@ def visualize_path(data, category_df, path, start, end):
         pass
 
 
-def save_path_to_csv(path):
+def save_path_to_csv(path, encoding=None, filename=None, overwrite=False):
     """
     경로를 CSV 파일로 저장하는 함수
     
     Args:
         path (list): 경로 좌표 리스트
+        encoding (str): None이면 기존 step,x,y 형식으로 덮어쓰기,
+            'steps'/'compact'/'waypoints'/'binary'면 PathSink로 경로 파일에 이어 쓰기
+        filename (str): 저장할 파일 이름 (None이면 home_to_cafe.csv 또는 형식별 기본 파일)
+        overwrite (bool): PathSink로 저장할 때 이어 쓰지 않고 기존 파일을 새로 씀
     """
     if not path:
         print('저장할 경로가 없습니다.')
         return
     
+    if encoding is not None:
+        with PathSink(filename, encoding=encoding, overwrite=overwrite) as sink:
+            route_id = sink.add(path)
+            filename = sink.filename
+        print(f'경로 {route_id}번이 {filename} 파일에 {encoding} 형식으로 저장되었습니다. (총 {len(path)}단계)')
+        return
+    
     # DataFrame 생성 (step, x, y 순서)
     path_df = pd.DataFrame({
         'x': [point[0] for point in path],
@@ -318,8 +415,9 @@ def save_path_to_csv(path):
     path_df = path_df[['step', 'x', 'y']]
     
     # CSV로 저장
-    path_df.to_csv('home_to_cafe.csv', index=False)
-    print(f'경로가 home_to_cafe.csv 파일로 저장되었습니다. (총 {len(path)}단계)')
+    filename = filename or 'home_to_cafe.csv'
+    path_df.to_csv(filename, index=False)
+    print(f'경로가 {filename} 파일로 저장되었습니다. (총 {len(path)}단계)')
     print('저장된 경로:')
     print(path_df.head(10))
     if len(path) > 10:
@@ -327,15 +425,24 @@ def save_path_to_csv(path):
         print(path_df.tail(3))
 
 
-def main():
+@profiled('map_direct_save')
+def main(render=True, heatmap=False, waypoints=False, inputs=None, registry=None):
     """
     메인 실행 함수
+    
+    Args:
+        render (bool): False면 지도 그림 없이 경로 계산과 저장만 수행 (matplotlib을 불러오지 않음)
+        heatmap (bool): True면 시작점에서 모든 칸까지의 거리를 계산해 지도 배경에 표시
+        waypoints (bool): True면 경로를 꼭짓점으로 접어 그리고 home_to_cafe_waypoints.csv에도 꼭짓점 형식으로 저장
+            (home_to_cafe.csv는 항상 step,x,y 형식)
+        inputs (tuple): 이미 읽어 둔 입력 데이터 (파이프라인에서 단계끼리 공유)
+        registry (AreaRegistry): 이미 결합해 둔 데이터의 레지스트리 (파이프라인에서 단계끼리 공유)
     """
     print('반달곰 커피 최단경로 찾기 프로젝트 - 3단계')
     print('=' * 50)
     
     # 데이터 불러오기
-    data, category_df = load_processed_data()
+    data, category_df = load_processed_data(inputs=inputs, registry=registry)
     print(f'불러온 데이터 크기: {data.shape}')
     print()
     
@@ -366,11 +473,22 @@ def main():
         print(f'최단 거리: {len(shortest_path) - 1}칸')
         print()
         
+        # 시작점에서 모든 칸까지의 거리 (벡터화 BFS)
+        field = None
+        if heatmap:
+            field = grid_distance_field(grid_map, start_point)
+            reachable = int((field.distance >= 0).sum())
+            print(f'거리 히트맵 계산 완료: 도달 가능한 칸 {reachable}개, 최대 거리 {int(field.distance.max())}칸')
+            print()
+        
         # 경로 시각화
-        visualize_path(data, category_df, shortest_path, start_point, end_point)
+        if render:
+            visualize_path(data, category_df, shortest_path, start_point, end_point, field, waypoints)
         
-        # 경로 CSV로 저장
+        # 경로 CSV로 저장 (home_to_cafe.csv는 대시보드와 작업 큐가 읽는 step,x,y 형식 그대로)
         save_path_to_csv(shortest_path)
+        if waypoints:
+            save_path_to_csv(shortest_path, encoding='waypoints', overwrite=True)
     else:
         print('경로를 찾을 수 없습니다.')
     
@@ -378,4 +496,12 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    # --route-only: 경로만 계산해서 저장 (지도 그림 생략)
+    # --heatmap: 시작점 기준 거리 히트맵을 지도 배경에 표시
+    # --waypoints: 경로를 꺾이는 점만 남겨 그리고 저장
+    # --profile[=speedscope]: 실행을 프로파일링해서 profiles/ 폴더에 저장
+    main(
+        render='--route-only' not in sys.argv,
+        heatmap='--heatmap' in sys.argv,
+        waypoints='--waypoints' in sys.argv,
+    )
\ No newline at end of file
@@ -3,40 +3,52 @@
 반달곰 커피 프로젝트의 두 번째 단계로 분석된 데이터를 기반으로 지역 지도를 시각화합니다.
 """
 
+import os
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
 
-# 한글 폰트 경고 방지 - 영어 폰트 사용
-plt.rcParams['font.family'] = 'DejaVu Sans'
+from area_registry import AreaRegistry, DEFAULT_AREA
+from csv_ingest import read_inputs
+from profiling import profiled
 
 
-def load_processed_data():
+def _load_pyplot():
     """
-    1단계에서 처리된 데이터를 다시 불러오는 함수
+    matplotlib을 실제로 그림을 그릴 때만 불러오는 함수 (데이터만 불러올 때는 불러오지 않음)
     
     Returns:
-        tuple: (처리된 데이터프레임, 카테고리 데이터프레임)
+        module: matplotlib.pyplot
     """
-    # CSV 파일들 불러오기
-    area_map = pd.read_csv('area_map.csv')
-    area_struct = pd.read_csv('area_struct.csv')
-    area_category = pd.read_csv('area_category.csv')
+    import matplotlib.pyplot as plt
+    
+    # 한글 폰트 경고 방지 - 영어 폰트 사용
+    plt.rcParams['font.family'] = 'DejaVu Sans'
+    return plt
+
+
+def load_processed_data(area_id=DEFAULT_AREA, inputs=None, registry=None):
+    """
+    1단계에서 처리된 데이터를 다시 불러오는 함수
     
-    # 컬럼명과 데이터의 공백 제거
-    area_category.columns = area_category.columns.str.strip()
-    area_category['struct'] = area_category['struct'].str.strip()
+    Args:
+        area_id (int): 시각화할 지역 번호
+        inputs (tuple): 이미 읽어 둔 (area_map, area_struct, area_category) (None이면 파일에서 읽음)
+        registry (AreaRegistry): 이미 결합해 둔 데이터의 레지스트리 (주면 다시 결합하지 않고 지역 캐시를 이어 씀)
     
-    # 세 데이터를 하나의 DataFrame으로 병합
-    merged_data = area_map.merge(area_struct, on=['x', 'y'], how='left')
+    Returns:
+        tuple: (처리된 데이터프레임, 카테고리 데이터프레임)
+    """
+    # CSV 파일들 불러오기 (선언한 스키마로 읽고 검증, BOM과 공백은 읽을 때 정리)
+    area_map, area_struct, area_category = inputs if inputs is not None else read_inputs()
     
-    # area 1에 대한 데이터만 필터링
-    area_1_data = merged_data[merged_data['area'] == 1].copy()
+    # 두 데이터를 (x, y) 기준으로 결합 (격자이면 배열 인덱스로 바로 정렬)
+    if registry is None:
+        registry = AreaRegistry.from_inputs(area_map, area_struct)
     
-    # y좌표를 1부터 시작하도록 변환 (8→1, 9→2, ..., 15→8)
-    area_1_data['y'] = area_1_data['y'] - 7
+    # 선택한 지역의 데이터만 가져오기
+    # 좌표는 지역의 좌측 상단이 (1, 1)이 되도록 보정 (area 1: y 8→1, 9→2, ..., 15→8)
+    area_data = registry.area_frame(area_id)
     
-    return area_1_data, area_category
+    return area_data, area_category
 
 
 def create_map_visualization(data, category_df):
@@ -44,9 +56,11 @@ def create_map_visualization(data, category_df):
     지도 시각화를 생성하는 함수
     
     Args:
-        data (pandas.DataFrame): 시각화할 데이터프레임
+        data (pandas.DataFrame | GridFrame): 시각화할 데이터프레임 또는 결합된 격자 데이터
         category_df (pandas.DataFrame): 카테고리 매핑 데이터프레임
     """
+    plt = _load_pyplot()
+    
     # 좌표 범위 확인
     x_min, x_max = data['x'].min(), data['x'].max()
     y_min, y_max = data['y'].min(), data['y'].max()
@@ -106,7 +120,7 @@ def create_map_visualization(data, category_df):
             linewidth=1,
             label='ConstructionSite'
         )
-        print(f'건설현장 위치: {list(zip(construction_sites["x"], construction_sites["y"]))}')
+        print(f'건설현장 위치: {list(zip(construction_sites["x"].tolist(), construction_sites["y"].tolist()))}')
     
     # 범례를 위한 핸들 저장
     legend_handles = []
@@ -115,7 +129,7 @@ def create_map_visualization(data, category_df):
     # 구조물이 있는 좌표 시각화
     structures = data[data['category'] != 0]
     
-    for category in structures['category'].unique():
+    for category in pd.unique(structures['category']):
         struct_name = category_mapping.get(category, f'Category_{category}')
         struct_data = structures[structures['category'] == category]
         
@@ -134,7 +148,7 @@ def create_map_visualization(data, category_df):
         legend_handles.append(scatter)
         legend_labels.append(struct_name)
         
-        print(f'{struct_name} 위치: {list(zip(struct_data["x"], struct_data["y"]))}')
+        print(f'{struct_name} 위치: {list(zip(struct_data["x"].tolist(), struct_data["y"].tolist()))}')
     
     # 축 설정 (영어로 변경하여 폰트 경고 방지)
     ax.set_xlabel('X Coordinate', fontsize=12)
@@ -158,8 +172,9 @@ def create_map_visualization(data, category_df):
     # 그래프 조정
     plt.tight_layout()
     
-    # 이미지 저장
-    plt.savefig('map.png', dpi=300, bbox_inches='tight')
+    # 이미지 저장 (임시 파일에 쓴 뒤 이름을 바꿔서 대시보드가 반쯤 저장된 그림을 읽지 않게 함)
+    plt.savefig('map.png.tmp', format='png', dpi=300, bbox_inches='tight')
+    os.replace('map.png.tmp', 'map.png')
     print('지도가 map.png 파일로 저장되었습니다.')
     
     # 화면에 표시 (헤드리스 환경에서는 에러 발생 가능하지만 무시)
@@ -171,15 +186,20 @@ def create_map_visualization(data, category_df):
     return fig, ax
 
 
-def main():
+@profiled('map_draw_real')
+def main(inputs=None, registry=None):
     """
     메인 실행 함수
+    
+    Args:
+        inputs (tuple): 이미 읽어 둔 입력 데이터 (파이프라인에서 단계끼리 공유)
+        registry (AreaRegistry): 이미 결합해 둔 데이터의 레지스트리 (파이프라인에서 단계끼리 공유)
     """
     print('반달곰 커피 지도 시각화 프로젝트 - 2단계')
     print('=' * 50)
     
     # 데이터 불러오기
-    data, category_df = load_processed_data()
+    data, category_df = load_processed_data(inputs=inputs, registry=registry)
     print(f'불러온 데이터 크기: {data.shape}')
     print()
     
@@ -0,0 +1,250 @@
+"""
+여러 지점 경유 경로 최적화
+MyHome에서 출발해 여러 BandalgomCoffee 지점을 한 번에 도는 경로를 만듭니다.
+지점 사이 거리 행렬(distance_matrix)을 한 번 계산한 뒤,
+지점이 적으면 동적 계획법(Held-Karp)으로 최적 순서를,
+많으면 최근접 이웃 + 2-opt 개선으로 빠르게 좋은 순서를 찾습니다.
+구간 경로는 경로 캐시로 계산해서 이어 붙이고 home_to_cafe.csv 형식(step,x,y)으로 저장합니다.
+
+사용법:
+    python multi_stop.py                      # 모든 카페를 도는 경로 → home_to_cafe_multi.csv
+    python multi_stop.py --return-home        # 마지막에 집으로 돌아오는 경로
+    python multi_stop.py --output home_to_cafe.csv
+"""
+
+import argparse
+
+from distance_matrix import compute_distance_matrix, find_struct_cells, UNREACHABLE
+from route_cache import RouteCache, grid_version
+from search_kernels import FlatGrid, shortest_path
+
+
+DEFAULT_FILE = 'home_to_cafe_multi.csv'
+
+# 이 개수 이하의 경유지는 동적 계획법으로 최적 순서를 구함 (2^n * n^2 연산)
+EXACT_LIMIT = 10
+
+# 도달할 수 없는 구간의 비용
+INFINITY = float('inf')
+
+
+def _cost_table(distances):
+    """
+    거리 행렬을 비용 표(리스트)로 바꾸는 함수 (도달 불가는 무한대)
+    """
+    return [
+        [INFINITY if value == UNREACHABLE else int(value) for value in row]
+        for row in distances.tolist()
+    ]
+
+
+def route_cost(cost, order, return_to_start=False):
+    """
+    0번 지점에서 출발해 order 순서로 방문할 때의 총 거리를 계산하는 함수
+    """
+    sequence = [0] + list(order) + ([0] if return_to_start else [])
+    return sum(cost[a][b] for a, b in zip(sequence, sequence[1:]))
+
+
+def exact_order(cost, return_to_start=False):
+    """
+    Held-Karp 동적 계획법으로 최적 방문 순서를 구하는 함수
+
+    Args:
+        cost (list): (n, n) 비용 표, 0번이 출발지
+        return_to_start (bool): 마지막에 출발지로 돌아오는지 여부
+
+    Returns:
+        list: 1 ~ n-1번 지점의 방문 순서 (유한한 비용의 순서가 없으면 heuristic_order의 순서)
+    """
+    stops = len(cost) - 1
+    if stops == 0:
+        return []
+
+    # best[mask][j]: mask에 속한 지점을 모두 방문하고 j번 경유지(0부터)에서 끝나는 최소 비용
+    full = 1 << stops
+    best = [[INFINITY] * stops for _ in range(full)]
+    previous = [[-1] * stops for _ in range(full)]
+    for j in range(stops):
+        best[1 << j][j] = cost[0][j + 1]
+
+    for mask in range(1, full):
+        for j in range(stops):
+            current = best[mask][j]
+            if current == INFINITY or not mask & (1 << j):
+                continue
+            for k in range(stops):
+                if mask & (1 << k):
+                    continue
+                candidate = current + cost[j + 1][k + 1]
+                next_mask = mask | (1 << k)
+                if candidate < best[next_mask][k]:
+                    best[next_mask][k] = candidate
+                    previous[next_mask][k] = j
+
+    closing = [cost[j + 1][0] if return_to_start else 0 for j in range(stops)]
+    last = min(range(stops), key=lambda j: best[full - 1][j] + closing[j])
+    if best[full - 1][last] == INFINITY:
+        # 모든 지점을 잇는 순서가 없으면 되짚을 기록이 없으므로 휴리스틱 순서를 그대로 씀
+        return heuristic_order(cost, return_to_start)
+
+    order = []
+    mask = full - 1
+    while last >= 0:
+        order.append(last + 1)
+        last, mask = previous[mask][last], mask & ~(1 << last)
+    order.reverse()
+    return order
+
+
+def heuristic_order(cost, return_to_start=False):
+    """
+    최근접 이웃으로 처음 순서를 만들고 2-opt로 구간을 뒤집어 가며 개선하는 함수
+
+    Args:
+        cost (list): (n, n) 비용 표, 0번이 출발지
+        return_to_start (bool): 마지막에 출발지로 돌아오는지 여부
+
+    Returns:
+        list: 1 ~ n-1번 지점의 방문 순서
+    """
+    remaining = set(range(1, len(cost)))
+    order = []
+    current = 0
+    while remaining:
+        current = min(remaining, key=lambda stop: (cost[current][stop], stop))
+        order.append(current)
+        remaining.remove(current)
+
+    # sequence[0]은 출발지로 고정, 돌아오는 경우 마지막 0도 고정
+    sequence = [0] + order + ([0] if return_to_start else [])
+    last = len(sequence) - (2 if return_to_start else 1)
+    improved = True
+    while improved:
+        improved = False
+        for i in range(1, last):
+            for k in range(i + 1, last + 1):
+                a, b, c = sequence[i - 1], sequence[i], sequence[k]
+                after = sequence[k + 1] if k + 1 < len(sequence) else None
+                before_cost = cost[a][b] + (cost[c][after] if after is not None else 0)
+                after_cost = cost[a][c] + (cost[b][after] if after is not None else 0)
+                if after_cost < before_cost:
+                    sequence[i:k + 1] = reversed(sequence[i:k + 1])
+                    improved = True
+
+    return sequence[1:last + 1]
+
+
+def plan_order(cost, return_to_start=False):
+    """
+    경유지 수에 따라 정확한 방법 또는 휴리스틱으로 방문 순서를 구하는 함수
+    """
+    if len(cost) - 1 <= EXACT_LIMIT:
+        return exact_order(cost, return_to_start)
+    return heuristic_order(cost, return_to_start)
+
+
+class MultiStopPlanner:
+    """
+    격자 지도 위에서 여러 지점을 도는 경로를 만드는 클래스
+    """
+
+    def __init__(self, grid_map, cache=None):
+        """
+        Args:
+            grid_map (dict): 격자 지도
+            cache (RouteCache): 구간 경로 캐시 (None이면 메모리 전용 캐시를 새로 만듦)
+        """
+        self.grid_map = grid_map
+        self.flat_grid = FlatGrid.from_grid_map(grid_map)
+        self.version = grid_version(grid_map)
+        self.cache = cache if cache is not None else RouteCache(db_path=None)
+
+    def leg_path(self, start, end):
+        """
+        한 구간의 최단경로 (경로 캐시 사용)
+        """
+        key = RouteCache.make_key(self.version, start, end, 'bfs')
+        return self.cache.get_or_compute(
+            key, lambda: shortest_path(self.grid_map, self.flat_grid, start, end)
+        )
+
+    def plan(self, start, stops, return_to_start=False):
+        """
+        start에서 출발해 stops를 모두 방문하는 경로를 만드는 함수
+
+        출발지에서 도달할 수 없는 지점은 경고를 출력하고 제외합니다.
+
+        Args:
+            start (tuple): 출발지 좌표
+            stops (list): 경유지 좌표 리스트
+            return_to_start (bool): 마지막에 출발지로 돌아오는지 여부
+
+        Returns:
+            dict: order(방문 순서 좌표), distance(총 거리), path(이어 붙인 경로), skipped(제외된 지점)
+        """
+        points = [start] + list(stops)
+        cost = _cost_table(compute_distance_matrix(self.grid_map, points, points))
+
+        reachable = [i for i in range(1, len(points)) if cost[0][i] != INFINITY]
+        skipped = [points[i] for i in range(1, len(points)) if cost[0][i] == INFINITY]
+        for point in skipped:
+            print(f'경고: {point}에는 도달할 수 없어 제외합니다.')
+
+        index = [0] + reachable
+        sub_cost = [[cost[a][b] for b in index] for a in index]
+        order = [index[i] for i in plan_order(sub_cost, return_to_start)]
+
+        sequence = [0] + order + ([0] if return_to_start else [])
+        path = [start]
+        for a, b in zip(sequence, sequence[1:]):
+            # 구간 경로의 첫 칸은 앞 구간의 마지막 칸과 같으므로 빼고 이어 붙임
+            path.extend(self.leg_path(points[a], points[b])[1:])
+
+        return {
+            'order': [points[i] for i in order],
+            'distance': route_cost(cost, order, return_to_start),
+            'path': path,
+            'skipped': skipped,
+        }
+
+
+def main():
+    """
+    메인 실행 함수
+    """
+    from map_direct_save import (
+        load_processed_data,
+        find_start_and_end_points,
+        create_grid_map,
+        save_path_to_csv,
+    )
+
+    parser = argparse.ArgumentParser(description='여러 반달곰 커피 지점 경유 경로 최적화')
+    parser.add_argument('--return-home', action='store_true', help='마지막에 MyHome으로 돌아옴')
+    parser.add_argument('--output', default=DEFAULT_FILE, help='저장할 CSV 파일 (step,x,y 형식)')
+    args = parser.parse_args()
+
+    data, category_df = load_processed_data()
+    start, _ = find_start_and_end_points(data, category_df)
+    if start is None:
+        print('시작점을 찾을 수 없어서 경로 탐색을 중단합니다.')
+        return
+    stops, labels = find_struct_cells(data, category_df, ('BandalgomCoffee',))
+    grid_map = create_grid_map(data, start)
+
+    method = '동적 계획법' if len(stops) <= EXACT_LIMIT else '최근접 이웃 + 2-opt'
+    print(f'경유지 {len(stops)}곳, 방문 순서 계산: {method}')
+    result = MultiStopPlanner(grid_map).plan(start, stops, args.return_home)
+
+    label_of = dict(zip(stops, labels))
+    print('방문 순서:')
+    for number, point in enumerate(result['order'], 1):
+        print(f'  {number}. {label_of[point]}')
+    print(f'총 거리: {result["distance"]}칸')
+
+    save_path_to_csv(result['path'], filename=args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,402 @@
+"""
+경로 저장 모듈
+여러 경로를 모아 두었다가 파일 하나에 한 번에 이어 쓰는 PathSink와,
+저장 형식(단계별 CSV, 압축 CSV, 바이너리)을 자동으로 알아보는 read_paths를 제공합니다.
+
+저장 형식:
+- steps:   route_id,step,x,y        (한 단계당 한 줄)
+- compact: route_id,x,y,moves      (시작 좌표 + 방향 런렝스 문자열, 예: 3D2L)
+- waypoints: route_id,waypoint,x,y (직선 구간을 접고 시작점, 꺾이는 점, 끝점만 한 줄씩)
+- binary:  매직 바이트 뒤에 경로마다 int32 [route_id, n, x1, y1, ..., xn, yn]
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+
+STEPS_HEADER = 'route_id,step,x,y'
+COMPACT_HEADER = 'route_id,x,y,moves'
+WAYPOINTS_HEADER = 'route_id,waypoint,x,y'
+LEGACY_HEADER = 'step,x,y'
+BINARY_MAGIC = b'HTCPATH1'
+
+# 방향 문자 (y축은 아래로 갈수록 커짐)
+MOVE_LETTERS = {(1, 0): 'R', (-1, 0): 'L', (0, 1): 'D', (0, -1): 'U'}
+LETTER_MOVES = {letter: move for move, letter in MOVE_LETTERS.items()}
+
+# 형식별 기본 파일 (3단계 결과 home_to_cafe.csv는 예전 step,x,y 형식 그대로 두고 따로 저장)
+DEFAULT_FILES = {
+    'steps': 'home_to_cafe_steps.csv',
+    'compact': 'home_to_cafe_compact.csv',
+    'waypoints': 'home_to_cafe_waypoints.csv',
+    'binary': 'home_to_cafe.bin',
+}
+
+
+def encode_moves(path):
+    """
+    경로를 방향 런렝스 문자열로 바꾸는 함수
+
+    Args:
+        path (list): 경로 좌표 리스트 (이웃한 칸끼리 이어져 있어야 함)
+
+    Returns:
+        str: 예) [(1,1), (1,2), (1,3), (0,3)] → '2D1L'
+    """
+    parts = []
+    previous, count = None, 0
+    for (x1, y1), (x2, y2) in zip(path, path[1:]):
+        letter = MOVE_LETTERS.get((x2 - x1, y2 - y1))
+        if letter is None:
+            raise ValueError(f'이웃하지 않은 좌표가 이어져 있습니다: {(x1, y1)} → {(x2, y2)}')
+        if letter == previous:
+            count += 1
+            continue
+        if previous is not None:
+            parts.append(f'{count}{previous}')
+        previous, count = letter, 1
+    if previous is not None:
+        parts.append(f'{count}{previous}')
+    return ''.join(parts)
+
+
+def decode_moves(start, moves):
+    """
+    시작 좌표와 방향 런렝스 문자열을 경로로 되돌리는 함수
+
+    Args:
+        start (tuple): 시작 좌표
+        moves (str): encode_moves로 만든 문자열
+
+    Returns:
+        list: 경로 좌표 리스트
+    """
+    x, y = start
+    path = [(x, y)]
+    number = ''
+    for char in moves:
+        if char.isdigit():
+            number += char
+            continue
+        dx, dy = LETTER_MOVES[char]
+        for _ in range(int(number)):
+            x, y = x + dx, y + dy
+            path.append((x, y))
+        number = ''
+    return path
+
+
+def _segment_step(a, b):
+    """
+    가로 또는 세로 구간 a → b의 한 칸 이동 방향과 길이를 구하는 함수
+    """
+    dx, dy = b[0] - a[0], b[1] - a[1]
+    if dx and dy:
+        raise ValueError(f'가로나 세로로 이어지지 않은 좌표입니다: {a} → {b}')
+    length = abs(dx) + abs(dy)
+    if length == 0:
+        return (0, 0), 0
+    return (dx // length, dy // length), length
+
+
+def compress_path(path):
+    """
+    경로의 직선 구간을 접어 시작점, 꺾이는 점, 끝점만 남기는 함수
+
+    한 칸씩 이어진 경로뿐 아니라 이미 접힌 경로(가로/세로 구간의 꼭짓점 목록)도 받을 수 있습니다.
+
+    Args:
+        path (list): 경로 좌표 리스트
+
+    Returns:
+        list: 꼭짓점 좌표 리스트, 예) [(1,1), (1,2), (1,3), (0,3)] → [(1,1), (1,3), (0,3)]
+    """
+    if len(path) <= 1:
+        return list(path)
+
+    waypoints = [tuple(path[0])]
+    previous = None
+    for a, b in zip(path, path[1:]):
+        step, length = _segment_step(a, b)
+        if length == 0:
+            continue
+        if step == previous:
+            # 같은 방향으로 계속 가면 마지막 꼭짓점을 앞으로 옮김
+            waypoints[-1] = tuple(b)
+        else:
+            waypoints.append(tuple(b))
+        previous = step
+    return waypoints
+
+
+def expand_waypoints(waypoints):
+    """
+    compress_path로 접은 꼭짓점 목록을 한 칸씩 이어진 경로로 되돌리는 함수
+
+    Args:
+        waypoints (list): 꼭짓점 좌표 리스트
+
+    Returns:
+        list: 경로 좌표 리스트
+    """
+    if not waypoints:
+        return []
+    path = [tuple(waypoints[0])]
+    for a, b in zip(waypoints, waypoints[1:]):
+        (dx, dy), length = _segment_step(a, b)
+        x, y = a
+        path.extend((x + dx * i, y + dy * i) for i in range(1, length + 1))
+    return path
+
+
+def path_format(filename):
+    """
+    파일 앞부분(헤더 줄)을 보고 저장 형식을 알아내는 함수
+
+    형식은 파일 이름이 아니라 헤더로 구분하므로, 경로 파일을 읽는 쪽은 이 값으로 분기합니다.
+
+    Returns:
+        str: 'binary', 'steps', 'compact', 'waypoints', 'legacy' 또는 빈 파일이면 None
+    """
+    if not os.path.exists(filename) or os.path.getsize(filename) == 0:
+        return None
+    with open(filename, 'rb') as f:
+        head = f.readline()
+    if head.startswith(BINARY_MAGIC):
+        return 'binary'
+    header = head.decode('utf-8-sig').strip()
+    formats = {
+        STEPS_HEADER: 'steps',
+        COMPACT_HEADER: 'compact',
+        WAYPOINTS_HEADER: 'waypoints',
+        LEGACY_HEADER: 'legacy',
+    }
+    if header not in formats:
+        raise ValueError(f'알 수 없는 경로 파일 형식입니다: {filename}')
+    return formats[header]
+
+
+def last_route_id(filename):
+    """
+    경로 파일에 저장된 가장 큰 route_id (파일이 없거나 비어 있으면 0, 예전 형식은 1)
+    """
+    file_format = path_format(filename)
+    if file_format is None:
+        return 0
+    if file_format == 'legacy':
+        return 1
+    if file_format == 'binary':
+        table = _read_binary(filename)
+    else:
+        table = pd.read_csv(filename, usecols=['route_id'])
+    return int(table['route_id'].max()) if len(table) else 0
+
+
+class PathSink:
+    """
+    경로를 메모리에 모았다가 flush()에서 파일에 한 번에 이어 쓰는 클래스
+
+    with 문으로 사용하면 블록이 끝날 때 자동으로 flush 합니다.
+    """
+
+    def __init__(self, filename=None, encoding='steps', start_id=None, overwrite=False):
+        """
+        Args:
+            filename (str): 저장할 파일 (None이면 형식별 기본 파일)
+            encoding (str): 'steps', 'compact', 'waypoints', 'binary' 중 하나
+            start_id (int): route_id를 지정하지 않았을 때 처음 붙일 번호
+                (None이면 이어 쓸 파일의 가장 큰 route_id 다음 번호, 새 파일이면 1)
+            overwrite (bool): True면 첫 flush에서 기존 파일을 지우고 새로 씀
+        """
+        if encoding not in DEFAULT_FILES:
+            raise ValueError(f'지원하지 않는 저장 형식입니다: {encoding}')
+        self.filename = filename or DEFAULT_FILES[encoding]
+        self.encoding = encoding
+        if start_id is None:
+            # 이어 쓸 때 기존 경로와 번호가 겹치면 읽을 때 한 경로로 합쳐지므로 다음 번호부터
+            start_id = 1 if overwrite else last_route_id(self.filename) + 1
+        self.next_id = start_id
+        self.overwrite = overwrite
+        self._routes = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
+
+    def __len__(self):
+        return len(self._routes)
+
+    def add(self, path, route_id=None):
+        """
+        경로 하나를 버퍼에 추가하는 함수
+
+        Args:
+            path (list): 경로 좌표 리스트
+            route_id (int): 경로 번호 (None이면 자동 번호)
+
+        Returns:
+            int: 붙여진 경로 번호
+        """
+        if route_id is None:
+            route_id = self.next_id
+        self.next_id = max(self.next_id, route_id + 1)
+        if path:
+            self._routes.append((route_id, path))
+        return route_id
+
+    def _render_text(self, include_header):
+        headers = {'steps': STEPS_HEADER, 'compact': COMPACT_HEADER, 'waypoints': WAYPOINTS_HEADER}
+        lines = []
+        if include_header:
+            lines.append(headers[self.encoding])
+        for route_id, path in self._routes:
+            if self.encoding == 'steps':
+                lines.extend(
+                    f'{route_id},{step},{x},{y}' for step, (x, y) in enumerate(path, start=1)
+                )
+            elif self.encoding == 'waypoints':
+                lines.extend(
+                    f'{route_id},{number},{x},{y}'
+                    for number, (x, y) in enumerate(compress_path(path), start=1)
+                )
+            else:
+                x, y = path[0]
+                lines.append(f'{route_id},{x},{y},{encode_moves(path)}')
+        return '\n'.join(lines) + '\n'
+
+    def _render_binary(self, include_header):
+        chunks = []
+        for route_id, path in self._routes:
+            chunks.append(np.array([route_id, len(path)], dtype='<i4'))
+            chunks.append(np.asarray(path, dtype='<i4').ravel())
+        body = np.concatenate(chunks).tobytes() if chunks else b''
+        return (BINARY_MAGIC + b'\n' if include_header else b'') + body
+
+    def flush(self):
+        """
+        모아 둔 경로를 파일 끝에 한 번의 쓰기로 이어 붙이는 함수
+
+        Returns:
+            int: 저장한 경로 개수
+        """
+        if not self._routes:
+            return 0
+
+        if self.overwrite:
+            if os.path.exists(self.filename):
+                os.remove(self.filename)
+            self.overwrite = False
+
+        existing = path_format(self.filename)
+        if existing is not None and existing != self.encoding:
+            raise ValueError(
+                f'{self.filename}은 {existing} 형식이라 {self.encoding} 경로를 이어 쓸 수 없습니다.'
+            )
+        include_header = existing is None
+
+        if self.encoding == 'binary':
+            with open(self.filename, 'ab') as f:
+                f.write(self._render_binary(include_header))
+        else:
+            with open(self.filename, 'a', encoding='utf-8', newline='') as f:
+                f.write(self._render_text(include_header))
+
+        count = len(self._routes)
+        self._routes = []
+        return count
+
+
+def _read_binary(filename):
+    with open(filename, 'rb') as f:
+        f.readline()
+        body = f.read()
+    if len(body) % 4:
+        raise ValueError(f'{filename}의 마지막 경로 레코드가 잘려 있습니다. ({len(body)}바이트는 4의 배수가 아님)')
+    values = np.frombuffer(body, dtype='<i4')
+
+    route_ids, steps, xs, ys = [], [], [], []
+    position = 0
+    while position < len(values):
+        if position + 2 > len(values):
+            raise ValueError(f'{filename}의 마지막 경로 레코드가 잘려 있습니다. (머리말 없음)')
+        route_id, length = int(values[position]), int(values[position + 1])
+        if length < 0 or position + 2 + 2 * length > len(values):
+            raise ValueError(
+                f'{filename}의 경로 {route_id}번 레코드가 잘려 있습니다. '
+                f'({length}단계 중 {max(0, (len(values) - position - 2) // 2)}단계만 있음)'
+            )
+        coords = values[position + 2:position + 2 + 2 * length].reshape(-1, 2)
+        route_ids.append(np.full(length, route_id))
+        steps.append(np.arange(1, length + 1))
+        xs.append(coords[:, 0])
+        ys.append(coords[:, 1])
+        position += 2 + 2 * length
+
+    if not route_ids:
+        return pd.DataFrame(columns=['route_id', 'step', 'x', 'y'])
+    return pd.DataFrame({
+        'route_id': np.concatenate(route_ids),
+        'step': np.concatenate(steps),
+        'x': np.concatenate(xs).astype(int),
+        'y': np.concatenate(ys).astype(int),
+    })
+
+
+def _expand_compact(compact):
+    rows = []
+    for route_id, x, y, moves in compact.itertuples(index=False):
+        path = decode_moves((int(x), int(y)), str(moves) if isinstance(moves, str) else '')
+        rows.extend((route_id, step, px, py) for step, (px, py) in enumerate(path, start=1))
+    return pd.DataFrame(rows, columns=['route_id', 'step', 'x', 'y'])
+
+
+def _expand_waypoints_table(table):
+    # 파일 순서대로 route_id가 바뀌거나 waypoint 번호가 다시 1부터 시작하면 새 경로
+    # (route_id를 이어 붙이지 않던 예전 파일은 같은 번호가 여러 번 나오므로 뒤의 것에 새 번호를 붙임)
+    routes = []
+    for route_id, number, x, y in table[['route_id', 'waypoint', 'x', 'y']].itertuples(index=False):
+        if not routes or routes[-1][0] != route_id or number <= routes[-1][1][-1][0]:
+            routes.append((route_id, []))
+        routes[-1][1].append((number, (int(x), int(y))))
+
+    rows, used = [], set()
+    next_id = int(table['route_id'].max()) + 1 if len(table) else 1
+    for route_id, waypoints in routes:
+        if route_id in used:
+            route_id, next_id = next_id, next_id + 1
+        used.add(route_id)
+        path = expand_waypoints([point for _, point in waypoints])
+        rows.extend((route_id, step, x, y) for step, (x, y) in enumerate(path, start=1))
+    return pd.DataFrame(rows, columns=['route_id', 'step', 'x', 'y'])
+
+
+def read_paths(filename='home_to_cafe.csv'):
+    """
+    어떤 형식으로 저장된 경로 파일이든 단계별 표로 읽는 함수
+
+    Args:
+        filename (str): 경로 파일
+
+    Returns:
+        pandas.DataFrame: route_id, step, x, y 컬럼의 데이터프레임
+        (route_id가 없는 예전 형식은 route_id를 1로 채움)
+    """
+    file_format = path_format(filename)
+    if file_format is None:
+        return pd.DataFrame(columns=['route_id', 'step', 'x', 'y'])
+    if file_format == 'binary':
+        return _read_binary(filename)
+
+    table = pd.read_csv(filename)
+    if file_format == 'compact':
+        return _expand_compact(table)
+    if file_format == 'waypoints':
+        return _expand_waypoints_table(table)
+    if file_format == 'legacy':
+        table.insert(0, 'route_id', 1)
+    return table
@@ -0,0 +1,283 @@
+"""
+파이프라인 실행기
+1~3단계를 한 프로세스 안에서 의존 관계(DAG) 순서대로 실행합니다.
+입력 CSV는 1단계에서 한 번만 읽고 결합해서(AreaRegistry) 메모리로 뒤 단계에 넘겨 주고,
+결과 파일이 입력 파일보다 새로우면 그 단계는 건너뜁니다(make와 같은 방식).
+단계의 입력 파일에는 입력 CSV와 단계 스크립트, 그 스크립트가 불러오는 이 폴더의 모듈이 모두 들어갑니다.
+
+단계 의존 관계:
+    1단계(데이터 읽기/분석) ─┬─> 2단계(map.png)
+                              └─> 3단계(map_final.png, home_to_cafe.csv)
+
+사용법:
+    python pipeline.py             # 오래된 단계만 실행
+    python pipeline.py --force     # 모든 단계 다시 실행
+    python pipeline.py --only 3    # 3단계(와 필요한 앞 단계)만
+    python pipeline.py --profile   # 단계마다 프로파일 파일 저장 (profiles/)
+"""
+
+import argparse
+import ast
+import os
+import time
+
+from csv_ingest import read_inputs
+from profiling import FORMATS, PROFILE_ENV
+
+
+# 모든 단계가 공통으로 읽는 입력 파일
+INPUT_FILES = ('area_map.csv', 'area_struct.csv', 'area_category.csv')
+
+
+def local_modules(script):
+    """
+    스크립트와 그 스크립트가 (함수 안에서 나중에 불러오는 것까지) 불러오는 이 폴더의 모듈 파일을 찾는 함수
+
+    불러온 모듈이 다시 불러오는 모듈도 따라가므로, 도우미 모듈(csv_ingest, area_registry 등)이
+    바뀌어도 그 모듈을 쓰는 단계는 오래된 것으로 판단됩니다.
+
+    Args:
+        script (str): 단계 스크립트 파일 이름
+
+    Returns:
+        tuple: 파일 이름 튜플 (스크립트가 맨 앞, 나머지는 이름순)
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    found, pending = set(), [script]
+    while pending:
+        name = pending.pop()
+        if name in found:
+            continue
+        found.add(name)
+        with open(os.path.join(here, name), encoding='utf-8') as f:
+            tree = ast.parse(f.read(), name)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                modules = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                modules = [node.module]
+            else:
+                continue
+            for module in modules:
+                path = module.split('.')[0] + '.py'
+                if os.path.exists(os.path.join(here, path)):
+                    pending.append(path)
+    return (script,) + tuple(sorted(found - {script}))
+
+
+class Stage:
+    """
+    파이프라인의 한 단계
+
+    run(context)는 앞 단계가 context에 넣어 둔 값을 쓰고, 다음 단계가 쓸 값을 context에 넣습니다.
+    """
+
+    def __init__(self, key, name, run, inputs=(), outputs=(), depends=()):
+        """
+        Args:
+            key (str): 단계 이름표 ('1', '2', '3')
+            name (str): 출력용 이름
+            run (callable): 단계를 실행하는 함수 (인자: context dict)
+            inputs (tuple): 이 단계의 입력 파일 (스크립트 파일 포함)
+            outputs (tuple): 이 단계가 만드는 파일 (없으면 뒤 단계가 필요할 때만 실행)
+            depends (tuple): 먼저 실행되어야 하는 단계 이름표
+        """
+        self.key = key
+        self.name = name
+        self.run = run
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs)
+        self.depends = tuple(depends)
+
+    def is_fresh(self):
+        """
+        결과 파일이 모두 있고 가장 오래된 결과가 가장 새 입력보다 새로우면 True
+        """
+        if not self.outputs or not all(os.path.exists(path) for path in self.outputs):
+            return False
+        newest_input = max((os.path.getmtime(path) for path in self.inputs if os.path.exists(path)), default=0)
+        oldest_output = min(os.path.getmtime(path) for path in self.outputs)
+        return oldest_output > newest_input
+
+
+def _run_stage1(context):
+    import caffee_map_final
+    from area_registry import AreaRegistry
+
+    # 읽기/검증/결합은 여기서 한 번만 하고 뒤 단계는 같은 레지스트리를 씀
+    inputs = read_inputs()
+    context['inputs'] = inputs
+    context['registry'] = AreaRegistry.from_inputs(inputs[0], inputs[1])
+    caffee_map_final.main(inputs, registry=context['registry'])
+
+
+def _run_stage2(context):
+    import map_draw_real
+
+    map_draw_real.main(context['inputs'], registry=context['registry'])
+
+
+def _run_stage3(context):
+    import map_direct_save
+
+    map_direct_save.main(inputs=context['inputs'], registry=context['registry'])
+
+
+STAGES = [
+    Stage('1', '1단계 데이터 분석', _run_stage1,
+          inputs=INPUT_FILES + local_modules('caffee_map_final.py')),
+    Stage('2', '2단계 지도 시각화', _run_stage2,
+          inputs=INPUT_FILES + local_modules('map_draw_real.py'),
+          outputs=('map.png',), depends=('1',)),
+    Stage('3', '3단계 최단경로', _run_stage3,
+          inputs=INPUT_FILES + local_modules('map_direct_save.py'),
+          outputs=('map_final.png', 'home_to_cafe.csv'), depends=('1',)),
+]
+
+
+def plan(stages, targets=None, force=False):
+    """
+    실행할 단계를 의존 순서대로 고르는 함수
+
+    결과 파일이 있는 단계는 오래되었거나 force일 때 실행하고,
+    결과 파일이 없는 단계(1단계)는 뒤 단계가 실행될 때만 실행합니다.
+
+    Args:
+        stages (list): Stage 리스트
+        targets (list): 실행 대상 단계 이름표 (None이면 전체)
+        force (bool): True면 최신이어도 실행
+
+    Returns:
+        tuple: (실행할 단계 이름표 집합, 단계별 상태 문구 dict)
+    """
+    by_key = {stage.key: stage for stage in stages}
+    wanted = set(targets or by_key)
+
+    # 대상 단계가 의존하는 앞 단계까지 포함
+    pending = list(wanted)
+    while pending:
+        for dependency in by_key[pending.pop()].depends:
+            if dependency not in wanted:
+                wanted.add(dependency)
+                pending.append(dependency)
+
+    to_run = set()
+    status = {}
+    for stage in stages:
+        if stage.key not in wanted:
+            continue
+        if not stage.outputs:
+            # 결과 파일이 없는 단계는 직접 지정했을 때만 바로 실행
+            if targets and stage.key in targets:
+                to_run.add(stage.key)
+                status[stage.key] = '지정 실행'
+            continue
+        if force:
+            to_run.add(stage.key)
+            status[stage.key] = '강제 실행'
+        elif stage.is_fresh():
+            status[stage.key] = '최신 (건너뜀)'
+        else:
+            to_run.add(stage.key)
+            status[stage.key] = '오래됨'
+
+    # 실행할 단계의 앞 단계는 결과 파일이 없어도 실행 (메모리 데이터를 넘겨야 하므로)
+    pending = list(to_run)
+    while pending:
+        for dependency in by_key[pending.pop()].depends:
+            if dependency not in to_run:
+                to_run.add(dependency)
+                status[dependency] = '뒤 단계에 필요'
+                pending.append(dependency)
+    for key in wanted:
+        status.setdefault(key, '필요 없음 (건너뜀)')
+
+    return to_run, status
+
+
+def _ordered(stages):
+    """
+    의존 관계를 지키는 실행 순서로 단계를 나열하는 함수 (위상 정렬)
+    """
+    by_key = {stage.key: stage for stage in stages}
+    done, order = set(), []
+
+    def visit(key, trail=()):
+        if key in done:
+            return
+        if key in trail:
+            raise ValueError(f'단계 의존 관계에 순환이 있습니다: {" → ".join(trail + (key,))}')
+        for dependency in by_key[key].depends:
+            visit(dependency, trail + (key,))
+        done.add(key)
+        order.append(by_key[key])
+
+    for stage in stages:
+        visit(stage.key)
+    return order
+
+
+def run_pipeline(targets=None, force=False, stages=None):
+    """
+    파이프라인을 실행하고 단계별 시간을 출력하는 함수
+
+    Args:
+        targets (list): 실행 대상 단계 이름표 (None이면 전체)
+        force (bool): True면 결과 파일이 최신이어도 다시 실행
+        stages (list): Stage 리스트 (None이면 기본 1~3단계)
+
+    Returns:
+        dict: 단계 이름표별 실행 시간(초), 건너뛴 단계는 None
+    """
+    stages = stages or STAGES
+    to_run, status = plan(stages, targets, force)
+    context = {}
+    timings = {}
+
+    for stage in _ordered(stages):
+        if stage.key not in status:
+            continue
+        if stage.key not in to_run:
+            timings[stage.key] = None
+            continue
+        print(f'\n>>> {stage.name} ({status[stage.key]})')
+        began = time.perf_counter()
+        stage.run(context)
+        timings[stage.key] = time.perf_counter() - began
+
+    print('\n=== 파이프라인 단계별 시간 ===')
+    total = 0.0
+    for stage in _ordered(stages):
+        if stage.key not in timings:
+            continue
+        elapsed = timings[stage.key]
+        if elapsed is None:
+            print(f'{stage.name:<16} {"-":>9}  {status[stage.key]}')
+        else:
+            total += elapsed
+            print(f'{stage.name:<16} {elapsed * 1000:>7.0f}ms  {status[stage.key]}')
+    print(f'{"합계":<16} {total * 1000:>7.0f}ms')
+    return timings
+
+
+def main():
+    """
+    메인 실행 함수
+    """
+    parser = argparse.ArgumentParser(description='1~3단계를 한 프로세스에서 실행하는 파이프라인')
+    parser.add_argument('--force', action='store_true', help='결과 파일이 최신이어도 모든 단계 실행')
+    parser.add_argument('--only', nargs='+', choices=[stage.key for stage in STAGES],
+                        help='실행할 단계 (필요한 앞 단계는 자동 포함)')
+    parser.add_argument('--profile', nargs='?', const='collapsed', choices=list(FORMATS),
+                        help='단계마다 프로파일을 profiles/ 폴더에 저장 (기본 collapsed)')
+    args = parser.parse_args()
+
+    if args.profile:
+        # 단계 모듈은 실행할 때 불러오므로 그 전에 켜 두면 각 main()이 프로파일됨
+        os.environ[PROFILE_ENV] = args.profile
+
+    run_pipeline(args.only, args.force)
+
+
+if __name__ == '__main__':
+    main()
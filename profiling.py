@@ -0,0 +1,242 @@
+"""
+프로파일링 훅
+각 단계의 main()과 대시보드 페이지를 샘플링 프로파일러로 실행하고
+실행마다 플레임그래프용 파일을 profiles/ 폴더에 남깁니다.
+
+켜는 방법 (@profiled 함수는 부를 때마다 환경 변수와 명령행 인자를 확인하므로,
+꺼져 있어도 호출마다 그 확인 비용(수 마이크로초)이 듭니다. 단계 main()처럼 한 번 부르는 함수에만 씁니다):
+    BANDALGOM_PROFILE=1 python map_direct_save.py            # collapsed stack (flamegraph.pl, speedscope)
+    BANDALGOM_PROFILE=speedscope python map_draw_real.py     # speedscope JSON
+    python caffee_map_final.py --profile
+    python map_direct_save.py --profile=speedscope
+    python pipeline.py --profile speedscope
+    BANDALGOM_PROFILE=1 streamlit run app.py                 # 페이지를 열 때마다, fragment만 다시 실행될 때마다 한 파일
+
+결과 보기:
+    https://www.speedscope.app 에 파일을 끌어다 놓거나
+    flamegraph.pl profiles/xxx.collapsed.txt > flame.svg
+"""
+
+import contextlib
+import functools
+import os
+import re
+import sys
+import threading
+import time
+
+
+PROFILE_ENV = 'BANDALGOM_PROFILE'
+PROFILE_DIR = 'profiles'
+
+# 출력 형식별 파일 확장자
+FORMATS = {'collapsed': '.collapsed.txt', 'speedscope': '.speedscope.json'}
+
+# 샘플링 간격 (초)
+SAMPLE_INTERVAL = 0.001
+
+
+def profile_mode(argv=None):
+    """
+    환경 변수나 명령행 인자로 지정한 프로파일 출력 형식을 돌려주는 함수
+
+    Returns:
+        str: 'collapsed' 또는 'speedscope', 꺼져 있으면 None
+    """
+    argv = sys.argv if argv is None else argv
+    value = os.environ.get(PROFILE_ENV, '').strip().lower()
+    for arg in argv[1:]:
+        if arg == '--profile':
+            value = value or 'collapsed'
+        elif arg.startswith('--profile='):
+            value = arg.split('=', 1)[1].lower()
+    if value in ('', '0', 'off', 'false'):
+        return None
+    if value in ('1', 'on', 'true'):
+        return 'collapsed'
+    if value not in FORMATS:
+        raise ValueError(f'알 수 없는 프로파일 형식입니다: {value} (가능: {", ".join(FORMATS)})')
+    return value
+
+
+_warned = set()
+
+
+def resolve_mode(argv=None):
+    """
+    profile_mode()와 같지만 잘못된 값이면 예외 대신 경고를 한 번 출력하고 끈 것으로 보는 함수
+
+    실행할 때마다 부르는 곳(데코레이터, 대시보드)에서 사용하므로
+    환경 변수를 잘못 적어도 모듈을 불러오거나 실행하는 데는 지장이 없습니다.
+    """
+    try:
+        return profile_mode(argv)
+    except ValueError as e:
+        if str(e) not in _warned:
+            _warned.add(str(e))
+            print(f'경고: {e} - 프로파일링을 끄고 실행합니다.')
+        return None
+
+
+class StackSampler:
+    """
+    별도 스레드에서 대상 스레드의 호출 스택을 주기적으로 기록하는 샘플링 프로파일러
+
+    스택은 (함수 이름, 파일, 함수 시작 줄) 튜플을 바깥 → 안쪽 순서로 담고,
+    샘플마다 실제로 흐른 시간을 가중치로 기록합니다.
+    """
+
+    def __init__(self, interval=SAMPLE_INTERVAL, thread_id=None):
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.samples = {}
+        self.elapsed = 0.0
+        self._began = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        frame = sys._current_frames().get(self.thread_id)
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+            frame = frame.f_back
+        return tuple(reversed(stack))
+
+    def _run(self):
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            stack = self._sample()
+            now = time.perf_counter()
+            if stack:
+                self.samples[stack] = self.samples.get(stack, 0.0) + (now - last)
+            last = now
+
+    def start(self):
+        self._began = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name='profiling-sampler', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.elapsed = time.perf_counter() - self._began
+        return self
+
+
+def _frame_name(frame):
+    name, filename, line = frame
+    return f'{name} ({os.path.basename(filename)}:{line})'
+
+
+def write_collapsed(samples, filename):
+    """
+    collapsed stack 형식 (한 줄에 '바깥;...;안쪽 값')으로 저장하는 함수
+
+    값은 마이크로초 단위 시간입니다.
+    """
+    with open(filename, 'w', encoding='utf-8') as f:
+        for stack, seconds in sorted(samples.items()):
+            weight = round(seconds * 1e6)
+            if weight:
+                f.write(';'.join(_frame_name(frame) for frame in stack) + f' {weight}\n')
+
+
+def write_speedscope(samples, filename, name, elapsed):
+    """
+    speedscope 파일 형식(sampled 프로파일)으로 저장하는 함수
+    """
+    import json
+
+    frames, index = [], {}
+    stacks, weights = [], []
+    for stack, seconds in samples.items():
+        for frame in stack:
+            if frame not in index:
+                index[frame] = len(frames)
+                frames.append({'name': frame[0], 'file': frame[1], 'line': frame[2]})
+        stacks.append([index[frame] for frame in stack])
+        weights.append(seconds)
+
+    document = {
+        '$schema': 'https://www.speedscope.app/file-format-schema.json',
+        'name': name,
+        'exporter': 'profiling.py',
+        'shared': {'frames': frames},
+        'profiles': [{
+            'type': 'sampled',
+            'name': name,
+            'unit': 'seconds',
+            'startValue': 0,
+            'endValue': elapsed,
+            'samples': stacks,
+            'weights': weights,
+        }],
+    }
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(document, f, ensure_ascii=False)
+
+
+_active = threading.local()
+
+
+@contextlib.contextmanager
+def profile_session(name, mode='collapsed'):
+    """
+    with 블록 안의 실행을 샘플링해서 profiles/ 폴더에 파일 하나로 저장하는 컨텍스트 관리자
+
+    같은 스레드에서 이미 프로파일 중이면(예: 파이프라인 안의 단계) 바깥 세션에 합쳐집니다.
+
+    Args:
+        name (str): 파일 이름에 들어갈 실행 이름
+        mode (str): 'collapsed' 또는 'speedscope'
+    """
+    if getattr(_active, 'session', None) is not None:
+        yield None
+        return
+
+    sampler = StackSampler().start()
+    _active.session = sampler
+    try:
+        yield sampler
+    finally:
+        sampler.stop()
+        _active.session = None
+
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        slug = re.sub(r'[^\w.-]+', '_', name).strip('_')
+        stem = os.path.join(PROFILE_DIR, f'{slug}-{time.strftime("%Y%m%d-%H%M%S")}')
+        filename, number = stem + FORMATS[mode], 1
+        while os.path.exists(filename):
+            # 같은 초에 여러 번 실행되면 번호를 붙임
+            number += 1
+            filename = f'{stem}-{number}{FORMATS[mode]}'
+        if mode == 'speedscope':
+            write_speedscope(sampler.samples, filename, name, sampler.elapsed)
+        else:
+            write_collapsed(sampler.samples, filename)
+        print(f'프로파일 저장: {filename} ({sampler.elapsed * 1000:.0f}ms, 스택 {len(sampler.samples)}종)')
+
+
+def profiled(name):
+    """
+    프로파일링이 켜져 있을 때만 함수를 profile_session으로 감싸 실행하는 데코레이터
+
+    켜져 있는지는 함수를 부를 때마다 확인하므로(환경 변수와 명령행 인자만 보는 가벼운 확인),
+    모듈을 불러온 뒤에 켜도 적용되고 잘못된 값은 불러올 때가 아니라 실행할 때 경고만 출력합니다.
+
+    Args:
+        name (str): 파일 이름에 들어갈 실행 이름
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            mode = resolve_mode()
+            if mode is None:
+                return func(*args, **kwargs)
+            with profile_session(name, mode):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
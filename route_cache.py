@@ -0,0 +1,278 @@
+"""
+경로 캐시 모듈
+(격자 버전 해시, 시작점, 끝점, 탐색 방식)을 키로 경로를 저장합니다.
+메모리 LRU와 재시작 후에도 남는 SQLite 두 단계로 구성되며,
+같은 키로 동시에 들어온 질의는 한 번만 계산하고 결과를 나눠 씁니다.
+
+- 디스크 조회/저장은 스레드마다 따로 연 연결로 전역 잠금 밖에서 합니다.
+- 디스크 단계는 최근 격자 버전 몇 개와 최대 행 수만 남기고 오래된 경로부터 지웁니다.
+- 캐시는 경로를 튜플로 보관하고 호출할 때마다 새 리스트로 돌려주므로,
+  받은 경로를 고쳐도 다른 호출자의 결과는 바뀌지 않습니다.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+
+DEFAULT_CAPACITY = 1024
+DEFAULT_DB_PATH = 'route_cache.sqlite'
+
+# 디스크 단계에 남길 최대 경로 수와 격자 버전 수
+DEFAULT_DISK_CAPACITY = 100_000
+DEFAULT_KEEP_VERSIONS = 4
+
+# 디스크 정리는 저장 몇 번마다 한 번 (정리 쿼리는 표 전체를 훑음)
+PRUNE_EVERY = 64
+
+
+def grid_version(grid_map):
+    """
+    격자 지도 내용으로 버전 해시를 계산하는 함수
+
+    Args:
+        grid_map (dict): 격자 지도
+
+    Returns:
+        str: 16자리 16진수 해시
+    """
+    digest = hashlib.sha1()
+    for (x, y), value in sorted(grid_map.items()):
+        digest.update(f'{x},{y},{value};'.encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+class RouteCache:
+    """
+    메모리 LRU + SQLite 2단계 경로 캐시
+
+    stats()로 단계별 적중/실패, 제거, 합쳐진 동시 질의 수를 확인할 수 있습니다.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, db_path=DEFAULT_DB_PATH,
+                 disk_capacity=DEFAULT_DISK_CAPACITY, keep_versions=DEFAULT_KEEP_VERSIONS):
+        """
+        Args:
+            capacity (int): 메모리 단계에 보관할 최대 경로 수
+            db_path (str): SQLite 파일 경로 (None이면 디스크 단계 사용 안 함)
+            disk_capacity (int): 디스크 단계에 보관할 최대 경로 수
+            keep_versions (int): 디스크 단계에 남길 최근 격자 버전 수
+        """
+        if disk_capacity < 1 or keep_versions < 1:
+            raise ValueError('디스크 캐시 크기와 남길 버전 수는 1 이상이어야 합니다.')
+        self.capacity = capacity
+        self.db_path = db_path
+        self.disk_capacity = disk_capacity
+        self.keep_versions = keep_versions
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self._counters = {
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'disk_evictions': 0,
+            'coalesced': 0,
+        }
+
+        # 스레드별 SQLite 연결 (한 연결을 여러 스레드가 나눠 쓰면 결국 잠금 안에서 써야 함)
+        self._local = threading.local()
+        self._connections = []
+        self._puts = 0
+        if db_path:
+            db = self._connection()
+            db.execute(
+                'CREATE TABLE IF NOT EXISTS routes ('
+                ' version TEXT, start TEXT, "end" TEXT, mode TEXT, path TEXT,'
+                ' PRIMARY KEY (version, start, "end", mode))'
+            )
+            db.commit()
+            self._prune(db)
+
+    @staticmethod
+    def make_key(version, start, end, mode='bfs'):
+        return (version, tuple(start), tuple(end), mode)
+
+    @staticmethod
+    def _db_key(key):
+        version, start, end, mode = key
+        return (version, f'{start[0]},{start[1]}', f'{end[0]},{end[1]}', mode)
+
+    @staticmethod
+    def _frozen(path):
+        return None if path is None else tuple(tuple(point) for point in path)
+
+    @staticmethod
+    def _copy(path):
+        return None if path is None else list(path)
+
+    def _connection(self):
+        """
+        현재 스레드의 SQLite 연결 (처음 부르면 새로 엶, 디스크 단계가 없으면 None)
+        """
+        if not self.db_path:
+            return None
+        db = getattr(self._local, 'db', None)
+        if db is None:
+            # close()가 다른 스레드에서 닫을 수 있도록 check_same_thread=False
+            db = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            self._local.db = db
+            with self._lock:
+                self._connections.append(db)
+        return db
+
+    def _prune(self, db):
+        """
+        최근 격자 버전 keep_versions개와 최근 경로 disk_capacity개만 남기고 지우는 함수
+
+        INSERT OR REPLACE는 행을 지우고 다시 넣으므로 rowid가 클수록 최근에 저장한 경로입니다.
+        """
+        removed = db.execute(
+            'DELETE FROM routes WHERE version NOT IN ('
+            ' SELECT version FROM routes GROUP BY version ORDER BY MAX(rowid) DESC LIMIT ?)',
+            (self.keep_versions,)
+        ).rowcount
+        removed += db.execute(
+            'DELETE FROM routes WHERE rowid <= ('
+            ' SELECT rowid FROM routes ORDER BY rowid DESC LIMIT 1 OFFSET ?)',
+            (self.disk_capacity,)
+        ).rowcount
+        db.commit()
+        if removed:
+            with self._lock:
+                self._counters['disk_evictions'] += removed
+
+    def _remember(self, key, path):
+        # 호출하는 쪽에서 self._lock을 잡고 있어야 함
+        self._memory[key] = path
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.capacity:
+            self._memory.popitem(last=False)
+            self._counters['evictions'] += 1
+
+    def get(self, key):
+        """
+        캐시에서 경로를 찾는 함수 (메모리 → 디스크 순서)
+
+        Returns:
+            list: 경로 좌표 리스트 (호출할 때마다 새 리스트), 없으면 None
+        """
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self._counters['memory_hits'] += 1
+                return self._copy(self._memory[key])
+
+        db = self._connection()
+        row = None
+        if db is not None:
+            row = db.execute(
+                'SELECT path FROM routes WHERE version=? AND start=? AND "end"=? AND mode=?',
+                self._db_key(key)
+            ).fetchone()
+
+        with self._lock:
+            if row is None:
+                self._counters['misses'] += 1
+                return None
+            path = self._frozen(json.loads(row[0]))
+            self._remember(key, path)
+            self._counters['disk_hits'] += 1
+            return self._copy(path)
+
+    def put(self, key, path):
+        """
+        경로를 두 단계 캐시에 모두 저장하는 함수
+        """
+        path = self._frozen(path)
+        with self._lock:
+            self._remember(key, path)
+            self._puts += 1
+            prune = self._puts % PRUNE_EVERY == 0
+
+        db = self._connection()
+        if db is not None:
+            db.execute(
+                'INSERT OR REPLACE INTO routes VALUES (?, ?, ?, ?, ?)',
+                self._db_key(key) + (json.dumps(path),)
+            )
+            db.commit()
+            if prune:
+                self._prune(db)
+
+    def get_or_compute(self, key, compute):
+        """
+        캐시에 있으면 바로 반환하고, 없으면 compute()로 계산해 저장하는 함수
+
+        같은 키를 계산 중인 다른 스레드가 있으면 새로 계산하지 않고
+        그 결과를 기다렸다가 함께 사용합니다.
+
+        Args:
+            key (tuple): make_key로 만든 키
+            compute (callable): 경로를 계산하는 함수 (인자 없음)
+
+        Returns:
+            list: 경로 좌표 리스트
+        """
+        path = self.get(key)
+        if path is not None:
+            return path
+
+        with self._lock:
+            # 조회와 등록 사이에 다른 스레드가 계산을 끝냈을 수 있음
+            if key in self._memory:
+                return self._copy(self._memory[key])
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._in_flight[key] = future
+            else:
+                self._counters['coalesced'] += 1
+
+        if not owner:
+            return self._copy(future.result())
+
+        try:
+            path = compute()
+            self.put(key, path)
+            future.set_result(self._frozen(path))
+            return path
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def stats(self):
+        """
+        단계별 적중/실패, 제거 수와 메모리/디스크 단계의 크기
+        """
+        db = self._connection()
+        disk_size = db.execute('SELECT COUNT(*) FROM routes').fetchone()[0] if db is not None else None
+        with self._lock:
+            return {
+                **self._counters,
+                'memory_size': len(self._memory),
+                'disk_size': disk_size,
+                'in_flight': len(self._in_flight),
+            }
+
+    def clear_memory(self):
+        with self._lock:
+            self._memory.clear()
+
+    def close(self):
+        """
+        모든 스레드의 SQLite 연결을 닫고 디스크 단계를 끄는 함수
+        """
+        with self._lock:
+            connections, self._connections = self._connections, []
+            self.db_path = None
+        for db in connections:
+            db.close()
@@ -0,0 +1,399 @@
+"""
+로컬 경로 질의 서비스
+CSV 데이터와 격자 지도를 한 번만 만들어 메모리에 올려 두고,
+asyncio 기반 HTTP 서버(TCP 또는 Unix 소켓)로 JSON 경로 질의에 답합니다.
+외부 네트워크 없이 로컬에서만 동작합니다.
+
+엔드포인트:
+- GET  /health  : 상태와 격자 정보
+- GET  /route   : 기본 경로 (MyHome → BandalgomCoffee)
+- POST /route   : {"start": [x, y], "end": [x, y], "mode": "bfs"} 경로 질의
+                  (생략한 값은 기본값, mode는 'bfs' 또는 'bitset',
+                   'bfs'는 numba가 있으면 컴파일 커널로 계산)
+- POST /reload  : CSV 파일을 다시 읽어 격자 재생성
+- GET  /stats   : 경로 캐시 적중/실패/제거 통계와 메모리/디스크 단계 크기
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import threading
+import time
+
+from area_registry import AreaRegistry
+from csv_ingest import read_inputs
+from grid_components import create_grid_map
+from map_direct_save import load_processed_data, find_start_and_end_points
+from bitset_bfs import BitGrid
+from search_kernels import FlatGrid, COMPILED, shortest_path
+from route_cache import (RouteCache, grid_version, DEFAULT_CAPACITY, DEFAULT_DB_PATH,
+                         DEFAULT_DISK_CAPACITY, DEFAULT_KEEP_VERSIONS)
+
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# 지원하는 탐색 방식
+SEARCH_MODES = ('bfs', 'bitset')
+
+STATUS_TEXT = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed'}
+
+
+class ReadWriteLock:
+    """
+    읽기는 여러 스레드가 동시에, 쓰기는 혼자서만 하도록 하는 잠금 (쓰기 우선)
+
+    쓰기를 기다리는 스레드가 있으면 새 읽기는 기다리게 해서 쓰기가 밀리지 않게 합니다.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._readers = 0
+        self._writing = False
+        self._waiting_writers = 0
+
+    @contextlib.contextmanager
+    def read(self):
+        with self._condition:
+            while self._writing or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @contextlib.contextmanager
+    def write(self):
+        with self._condition:
+            self._waiting_writers += 1
+            while self._writing or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writing = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writing = False
+                self._condition.notify_all()
+
+
+class RouteEngine:
+    """
+    데이터와 격자 지도를 메모리에 유지하며 경로 질의에 답하는 클래스
+
+    여러 스레드(HTTP 서비스의 작업 스레드, 대시보드의 세션들)가 한 엔진을 함께 쓸 수 있도록
+    질의는 읽기 잠금, 격자 교체/수정은 쓰기 잠금 안에서 처리합니다.
+    """
+
+    def __init__(self, cache=None):
+        """
+        Args:
+            cache (RouteCache): 경로 캐시 (None이면 매번 계산)
+        """
+        self.cache = cache
+        self.registry = None
+        self.data = None
+        self.category_df = None
+        self.grid_map = None
+        self.bit_grid = None
+        self.flat_grid = None
+        self.version = None
+        self.default_start = None
+        self.default_end = None
+        self.bounds = None
+        self.loaded_at = None
+        self._lock = ReadWriteLock()
+        self.reload()
+
+    def reload(self):
+        """
+        CSV 파일을 다시 읽어 격자 지도를 새로 만드는 함수
+
+        새 격자를 다 만든 뒤에 쓰기 잠금 안에서 한 번에 바꿔 끼우므로,
+        재생성 중에도 기존 격자로 질의에 답할 수 있습니다.
+        (재생성은 별도 스레드에서 돌 수 있으므로 출력은 서비스 로그로 그대로 남깁니다.)
+        """
+        inputs = read_inputs()
+        registry = AreaRegistry.from_inputs(inputs[0], inputs[1])
+        data, category_df = load_processed_data(inputs=inputs, registry=registry)
+        start, end = find_start_and_end_points(data, category_df)
+        grid_map = create_grid_map(data, start)
+        bit_grid = BitGrid.from_grid_map(grid_map)
+        flat_grid = FlatGrid.from_grid_map(grid_map)
+        version = grid_version(grid_map)
+        xs = [x for x, _ in grid_map]
+        ys = [y for _, y in grid_map]
+        bounds = (min(xs), min(ys), max(xs), max(ys))
+
+        # 격자 버전이 캐시 키에 들어가므로 예전 격자의 경로는 자연히 쓰이지 않음
+        with self._lock.write():
+            self.registry, self.data, self.category_df = registry, data, category_df
+            self.grid_map, self.bit_grid, self.flat_grid = grid_map, bit_grid, flat_grid
+            self.version = version
+            self.default_start, self.default_end = start, end
+            self.bounds = bounds
+            self.loaded_at = time.time()
+
+    def set_cells(self, changes):
+        """
+        격자 칸 몇 개의 상태를 바로 바꾸는 함수 (CSV를 다시 읽지 않음)
+
+        격자를 제자리에서 고치므로 진행 중인 질의가 끝날 때까지 기다렸다가 쓰기 잠금 안에서 바꿉니다.
+        모든 칸을 먼저 검사하고 하나라도 잘못되면 아무것도 바꾸지 않습니다.
+
+        Args:
+            changes (dict): {(x, y): 'obstacle' 또는 'free'}
+
+        Returns:
+            str: 바뀐 격자 버전
+        """
+        changes = {tuple(cell): value for cell, value in changes.items()}
+        for cell, value in changes.items():
+            if value not in ('obstacle', 'free'):
+                raise ValueError(f'칸 상태는 obstacle 또는 free여야 합니다: {cell} → {value}')
+
+        with self._lock.write():
+            # 격자는 reload()가 바꿔 끼울 수 있으므로 칸 확인도 쓰기 잠금 안에서
+            missing = [cell for cell in changes if cell not in self.grid_map]
+            if missing:
+                raise ValueError(f'격자에 없는 칸입니다: {", ".join(map(str, missing[:5]))}')
+            for cell, value in changes.items():
+                self.grid_map[cell] = value
+            self.bit_grid = BitGrid.from_grid_map(self.grid_map)
+            self.flat_grid = FlatGrid.from_grid_map(self.grid_map)
+            self.version = grid_version(self.grid_map)
+            return self.version
+
+    def snapshot(self):
+        """
+        그림 그리기용 (데이터, 카테고리, 격자 버전)을 한 번에 가져오는 함수
+        """
+        with self._lock.read():
+            return self.data, self.category_df, self.version
+
+    def info(self):
+        with self._lock.read():
+            obstacles = sum(1 for v in self.grid_map.values() if v == 'obstacle')
+            return {
+                'version': self.version,
+                'cells': len(self.grid_map),
+                'obstacles': obstacles,
+                'compiled_kernels': COMPILED,
+                'default_start': self.default_start,
+                'default_end': self.default_end,
+                'bounds': self.bounds,
+                'loaded_at': self.loaded_at,
+            }
+
+    @staticmethod
+    def _search(grids, start, end, mode):
+        grid_map, bit_grid, flat_grid = grids
+        if mode == 'bitset':
+            return bit_grid.shortest_path(start, end)
+        # 커널과 파이썬 BFS는 같은 경로를 내므로 캐시 키는 'bfs' 하나로 충분
+        return shortest_path(grid_map, flat_grid, start, end)
+
+    def route(self, start=None, end=None, mode='bfs'):
+        """
+        start에서 end까지의 최단경로를 계산하는 함수
+
+        Args:
+            start (tuple): 시작점 (None이면 MyHome)
+            end (tuple): 끝점 (None이면 첫 번째 BandalgomCoffee)
+            mode (str): 탐색 방식 ('bfs' 또는 'bitset', 캐시 키에 포함)
+
+        Returns:
+            dict: start, end, found, distance, path, elapsed_ms
+        """
+        if mode not in SEARCH_MODES:
+            raise ValueError(f'지원하지 않는 탐색 방식입니다: {mode}')
+
+        # 질의하는 동안에는 격자가 바뀌지 않도록 읽기 잠금 (다른 질의와는 동시에 진행)
+        with self._lock.read():
+            start = tuple(start) if start is not None else self.default_start
+            end = tuple(end) if end is not None else self.default_end
+            grids = (self.grid_map, self.bit_grid, self.flat_grid)
+            version = self.version
+
+            began = time.perf_counter()
+            if self.cache is None:
+                path = self._search(grids, start, end, mode)
+            else:
+                key = RouteCache.make_key(version, start, end, mode)
+                path = self.cache.get_or_compute(
+                    key, lambda: self._search(grids, start, end, mode)
+                )
+            elapsed = (time.perf_counter() - began) * 1000
+
+        return {
+            'start': start,
+            'end': end,
+            'mode': mode,
+            'version': version,
+            'found': bool(path),
+            'distance': len(path) - 1 if path else None,
+            'path': path,
+            'elapsed_ms': round(elapsed, 3),
+        }
+
+
+def _parse_point(value, name):
+    if value is None:
+        return None
+    if not (isinstance(value, (list, tuple)) and len(value) == 2):
+        raise ValueError(f'{name}는 [x, y] 형태여야 합니다.')
+    # 1.5를 1로 자르거나 true를 1로 받지 않도록 JSON 정수만 허용
+    if not all(isinstance(v, int) and not isinstance(v, bool) for v in value):
+        raise ValueError(f'{name}의 좌표는 정수여야 합니다: {value}')
+    return (value[0], value[1])
+
+
+class RouteService:
+    """
+    RouteEngine을 감싸는 asyncio HTTP 서버
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self._reload_lock = asyncio.Lock()
+
+    async def handle(self, method, path, body):
+        """
+        요청 하나를 처리해 (상태 코드, 응답 객체)를 반환하는 함수
+        """
+        if path == '/health':
+            if method != 'GET':
+                return 405, {'error': 'GET만 지원합니다.'}
+            return 200, {'status': 'ok', **self.engine.info()}
+
+        if path == '/route':
+            if method not in ('GET', 'POST'):
+                return 405, {'error': 'GET 또는 POST만 지원합니다.'}
+            query = json.loads(body) if body else {}
+            if not isinstance(query, dict):
+                raise ValueError('요청 본문은 JSON 객체여야 합니다. 예) {"start": [14, -5], "end": [2, 5]}')
+            start = _parse_point(query.get('start'), 'start')
+            end = _parse_point(query.get('end'), 'end')
+            mode = query.get('mode', 'bfs')
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(None, self.engine.route, start, end, mode)
+            return 200, result
+
+        if path == '/stats':
+            if method != 'GET':
+                return 405, {'error': 'GET만 지원합니다.'}
+            if self.engine.cache is None:
+                return 200, {'cache': None}
+            return 200, {'cache': self.engine.cache.stats()}
+
+        if path == '/reload':
+            if method != 'POST':
+                return 405, {'error': 'POST만 지원합니다.'}
+            async with self._reload_lock:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(None, self.engine.reload)
+            return 200, {'status': 'reloaded', **self.engine.info()}
+
+        return 404, {'error': f'알 수 없는 경로입니다: {path}'}
+
+    @staticmethod
+    async def _read_request(reader):
+        """
+        요청 줄, 헤더, 본문을 읽어 (메서드, 경로, 본문)을 반환하는 함수 (연결만 하고 끊으면 None)
+        """
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+        parts = request_line.decode('latin-1').split(' ', 2)
+        if len(parts) != 3:
+            raise ValueError('잘못된 요청 줄입니다.')
+        method, target, _ = parts
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        length = int(headers.get('content-length', 0))
+        if length < 0:
+            raise ValueError(f'잘못된 Content-Length입니다: {length}')
+        body = (await reader.readexactly(length)).decode('utf-8') if length else ''
+        return method.upper(), target.split('?', 1)[0], body
+
+    async def on_connection(self, reader, writer):
+        try:
+            # 잘못된 요청도 연결을 그냥 끊지 않고 400으로 답함
+            # (본문이 Content-Length보다 짧으면 IncompleteReadError, 숫자/UTF-8 오류는 ValueError)
+            try:
+                request = await self._read_request(reader)
+                if request is None:
+                    return
+                status, payload = await self.handle(*request)
+            except (ValueError, asyncio.IncompleteReadError) as e:
+                if isinstance(e, asyncio.IncompleteReadError):
+                    e = f'본문이 Content-Length보다 짧습니다. ({len(e.partial)}/{e.expected}바이트)'
+                status, payload = 400, {'error': str(e)}
+
+            data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+            writer.write(
+                f'HTTP/1.1 {status} {STATUS_TEXT.get(status, "")}\r\n'
+                f'Content-Type: application/json; charset=utf-8\r\n'
+                f'Content-Length: {len(data)}\r\n'
+                f'Connection: close\r\n\r\n'.encode('latin-1') + data
+            )
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT, unix_path=None):
+        if unix_path:
+            server = await asyncio.start_unix_server(self.on_connection, path=unix_path)
+            print(f'경로 서비스 시작: unix:{unix_path}')
+        else:
+            server = await asyncio.start_server(self.on_connection, host, port)
+            print(f'경로 서비스 시작: http://{host}:{port}')
+        async with server:
+            await server.serve_forever()
+
+
+def main():
+    """
+    메인 실행 함수
+    """
+    parser = argparse.ArgumentParser(description='반달곰 커피 로컬 경로 질의 서비스')
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--unix', help='TCP 대신 사용할 Unix 소켓 경로')
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CAPACITY, help='메모리 캐시 크기')
+    parser.add_argument('--cache-db', default=DEFAULT_DB_PATH, help='디스크 캐시 SQLite 파일')
+    parser.add_argument('--cache-disk-size', type=int, default=DEFAULT_DISK_CAPACITY, help='디스크 캐시 최대 경로 수')
+    parser.add_argument('--cache-versions', type=int, default=DEFAULT_KEEP_VERSIONS,
+                        help='디스크 캐시에 남길 최근 격자 버전 수')
+    parser.add_argument('--no-cache', action='store_true', help='경로 캐시 사용 안 함')
+    args = parser.parse_args()
+
+    cache = None if args.no_cache else RouteCache(
+        args.cache_size, args.cache_db, args.cache_disk_size, args.cache_versions
+    )
+
+    print('데이터를 불러오고 격자 지도를 만드는 중...')
+    engine = RouteEngine(cache)
+    print(f'격자 지도 준비 완료: {engine.info()["cells"]}개 셀')
+
+    try:
+        asyncio.run(RouteService(engine).serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        print('경로 서비스를 종료합니다.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,363 @@
+"""
+BFS 탐색 애니메이션
+MyHome에서 반달곰 커피까지 BFS 탐색 경계가 퍼져 나가는 모습을 GIF/MP4로 저장합니다.
+지도 바탕(격자, 구조물)은 visualize_path와 같은 모양으로 한 번만 그려 두고,
+프레임마다 바탕을 복원한 뒤 방문/경계/경로 레이어만 다시 그립니다(블리팅).
+프레임은 만들자마자 파일(또는 ffmpeg)로 흘려보내므로 전체 프레임을 메모리에 모으지 않습니다.
+
+사용법:
+    python search_animation.py                       # bfs_expansion.gif
+    python search_animation.py --output bfs.mp4      # MP4 (ffmpeg 필요)
+    python search_animation.py --fps 8 --dpi 50 --levels-per-frame 2
+"""
+
+import argparse
+import shutil
+import subprocess
+import time
+
+import numpy as np
+
+from map_direct_save import (
+    _load_pyplot,
+    load_processed_data,
+    find_start_and_end_points,
+    create_grid_map,
+    bfs_shortest_path,
+    draw_base_map,
+)
+from vector_bfs import grid_distance_field
+
+
+DEFAULT_FILE = 'bfs_expansion.gif'
+
+# 레이어 색 (RGBA)
+VISITED_COLOR = (1.0, 0.65, 0.0, 0.35)
+FRONTIER_COLOR = 'orangered'
+
+# 경로를 찾은 뒤 마지막 장면을 유지할 프레임 수
+HOLD_FRAMES = 10
+
+# GIF 이어 쓰기에 쓰는 GifImagePlugin.getheader/getdata는 문서화되지 않은 함수이므로
+# 동작을 확인한 Pillow 주 버전에서만 사용하고, 그 밖에는 공개 API(Image.save)로 한 번에 저장
+STREAMING_PILLOW = (9, 10, 11, 12)
+
+
+def gif_streaming_supported():
+    """
+    설치된 Pillow에서 GIF 프레임을 받는 즉시 이어 쓸 수 있는지 확인하는 함수
+    """
+    import PIL
+    from PIL import GifImagePlugin
+
+    major = int(PIL.__version__.split('.')[0])
+    return (
+        major in STREAMING_PILLOW
+        and hasattr(GifImagePlugin, 'getheader')
+        and hasattr(GifImagePlugin, 'getdata')
+    )
+
+
+class GifStreamWriter:
+    """
+    프레임을 받는 즉시 GIF 파일에 이어 쓰는 클래스
+
+    모든 프레임이 같은 전역 팔레트를 쓰며, 직전 프레임과 달라진 영역만 잘라서 씁니다.
+    메모리에는 직전 프레임 하나만 남겨 둡니다.
+    확인하지 않은 Pillow 버전이면(STREAMING_PILLOW) 양자화한 프레임을 모아 두었다가
+    닫을 때 Image.save(save_all=True)로 저장합니다 (메모리는 프레임 수에 비례).
+    """
+
+    def __init__(self, filename, fps, palette_frames):
+        """
+        Args:
+            filename (str): 저장할 GIF 파일
+            fps (int): 초당 프레임 수
+            palette_frames (list): 팔레트를 뽑을 RGBA 프레임들 (바탕과 마지막 장면 등)
+        """
+        from PIL import Image
+
+        self._image = Image
+        self.filename = filename
+        self.duration = int(round(1000 / fps))
+        self.frames = 0
+        # 팔레트 기준 프레임들을 세로로 이어 붙여 256색 팔레트 한 개를 만듦
+        source = np.concatenate([np.asarray(frame)[..., :3] for frame in palette_frames], axis=0)
+        self._palette = Image.fromarray(np.ascontiguousarray(source)).quantize(colors=256)
+        self._previous = None
+        self.streaming = gif_streaming_supported()
+        self._pending = []
+        self._file = open(filename, 'wb') if self.streaming else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _quantize(self, rgba):
+        rgb = self._image.fromarray(np.ascontiguousarray(np.asarray(rgba)[..., :3]))
+        return rgb.quantize(palette=self._palette, dither=self._image.Dither.NONE)
+
+    def write(self, rgba):
+        """
+        RGBA 프레임 하나를 파일에 바로 쓰는 함수
+        """
+        from PIL import GifImagePlugin
+
+        frame = self._quantize(rgba)
+        self.frames += 1
+        if not self.streaming:
+            self._pending.append(frame)
+            return
+        indices = np.asarray(frame)
+
+        if self._previous is None:
+            header, _ = GifImagePlugin.getheader(frame, info={'loop': 0, 'optimize': False})
+            self._file.write(b''.join(header))
+            box = (0, 0) + frame.size
+        else:
+            # 직전 프레임과 달라진 사각형 영역만 저장 (바뀐 곳이 없으면 1픽셀)
+            rows = np.flatnonzero((indices != self._previous).any(axis=1))
+            cols = np.flatnonzero((indices != self._previous).any(axis=0))
+            if rows.size:
+                box = (int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1)
+            else:
+                box = (0, 0, 1, 1)
+
+        chunk = frame.crop(box)
+        self._file.write(b''.join(GifImagePlugin.getdata(chunk, offset=box[:2], duration=self.duration)))
+        self._previous = indices
+
+    def close(self):
+        if self._pending:
+            first, rest = self._pending[0], self._pending[1:]
+            first.save(self.filename, save_all=True, append_images=rest,
+                       duration=self.duration, loop=0, optimize=False)
+            self._pending = []
+        if self._file is not None:
+            self._file.write(b';')
+            self._file.close()
+            self._file = None
+
+
+class FfmpegStreamWriter:
+    """
+    프레임을 ffmpeg 표준 입력으로 흘려보내 MP4를 만드는 클래스
+    """
+
+    def __init__(self, filename, fps, width, height):
+        if shutil.which('ffmpeg') is None:
+            raise RuntimeError('MP4로 저장하려면 ffmpeg가 필요합니다. GIF로 저장하거나 ffmpeg를 설치해 주세요.')
+        self.filename = filename
+        self.frames = 0
+        self._process = subprocess.Popen(
+            [
+                'ffmpeg', '-y', '-loglevel', 'error',
+                '-f', 'rawvideo', '-pix_fmt', 'rgba', '-s', f'{width}x{height}', '-r', str(fps),
+                '-i', '-',
+                # yuv420p는 가로세로가 짝수여야 하므로 1픽셀 여백으로 맞춤
+                '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2',
+                '-vcodec', 'libx264', '-pix_fmt', 'yuv420p',
+                filename,
+            ],
+            stdin=subprocess.PIPE,
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def write(self, rgba):
+        self._process.stdin.write(np.ascontiguousarray(rgba).tobytes())
+        self.frames += 1
+
+    def close(self):
+        if self._process is not None:
+            self._process.stdin.close()
+            self._process.wait()
+            self._process = None
+
+
+class SearchAnimator:
+    """
+    지도 바탕을 한 번 그리고 탐색 레이어만 블리팅하는 프레임 생성기
+    """
+
+    def __init__(self, data, category_df, field, path, start, end, dpi=60):
+        """
+        Args:
+            data (pandas.DataFrame | GridFrame): 지도 데이터
+            category_df (pandas.DataFrame): 카테고리 데이터프레임
+            field (DistanceField): 시작점에서의 거리 배열
+            path (list): 최단경로 (없으면 빈 리스트)
+            start (tuple): 시작점
+            end (tuple): 끝점
+            dpi (int): 프레임 해상도 (figsize 12x10 기준)
+        """
+        plt = _load_pyplot()
+        self._plt = plt
+        self.field = field
+        self.path = path
+
+        self.fig, ax = plt.subplots(figsize=(12, 10), dpi=dpi)
+        self.ax = ax
+        draw_base_map(ax, data, category_df)
+        ax.scatter(start[0], start[1], c='blue', s=400, marker='*',
+                   edgecolors='black', linewidth=2, label='Start', zorder=6)
+        ax.scatter(end[0], end[1], c='red', s=400, marker='*',
+                   edgecolors='black', linewidth=2, label='End', zorder=6)
+
+        # 프레임마다 바뀌는 레이어 (animated=True면 canvas.draw()에서 그리지 않음)
+        height, width = field.distance.shape
+        self._visited = np.zeros((height, width, 4))
+        self.visited_layer = ax.imshow(
+            self._visited,
+            zorder=0,
+            aspect='auto',
+            interpolation='nearest',
+            animated=True,
+            extent=(field.x0 - 0.5, field.x0 + width - 0.5, field.y0 + height - 0.5, field.y0 - 0.5),
+        )
+        self.frontier_layer = ax.scatter([], [], c=FRONTIER_COLOR, s=60, zorder=5,
+                                         animated=True, label='Frontier')
+        (self.path_layer,) = ax.plot([], [], 'r-', linewidth=3, alpha=0.7,
+                                     animated=True, label='Shortest Path')
+        self.level_text = ax.text(0.01, 0.99, '', transform=ax.transAxes, va='top',
+                                  fontsize=14, fontweight='bold', animated=True,
+                                  bbox={'facecolor': 'white', 'alpha': 0.8})
+
+        # imshow가 바꾼 좌표 범위를 원래대로 (y축은 뒤집힌 상태 유지)
+        x_min, x_max = data['x'].min(), data['x'].max()
+        y_min, y_max = data['y'].min(), data['y'].max()
+        ax.set_xlim(x_min - 0.5, x_max + 0.5)
+        ax.set_ylim(y_max + 0.5, y_min - 0.5)
+        ax.set_title('BFS Expansion from MyHome', fontsize=16, fontweight='bold')
+        ax.legend(loc='upper left', bbox_to_anchor=(1.02, 1), fontsize=10)
+        self.fig.tight_layout()
+
+        # 바탕은 여기서 한 번만 그리고 저장
+        self.canvas = self.fig.canvas
+        self.canvas.draw()
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+
+        self.width, self.height = self.canvas.get_width_height()
+        end_distance = field.distance_to(end)
+        self.last_level = end_distance if end_distance is not None else int(field.distance.max())
+
+    def _blit(self):
+        """
+        저장해 둔 바탕을 복원하고 움직이는 레이어만 그린 뒤 현재 화면을 돌려주는 함수
+        """
+        self.canvas.restore_region(self._background)
+        for artist in (self.visited_layer, self.frontier_layer, self.path_layer, self.level_text):
+            self.ax.draw_artist(artist)
+        return np.asarray(self.canvas.buffer_rgba())
+
+    def frame_at(self, level, show_path=False):
+        """
+        level 단계까지 방문한 상태의 프레임을 만드는 함수 (단계는 커지는 순서로 호출)
+        """
+        distance = self.field.distance
+        reached = (distance >= 0) & (distance <= level)
+        self._visited[reached] = VISITED_COLOR
+        self.visited_layer.set_data(self._visited)
+
+        rows, cols = np.nonzero(distance == level)
+        self.frontier_layer.set_offsets(np.column_stack([cols + self.field.x0, rows + self.field.y0]))
+
+        if show_path and self.path:
+            self.path_layer.set_data([p[0] for p in self.path], [p[1] for p in self.path])
+            self.level_text.set_text(f'Found: {len(self.path) - 1} steps')
+        else:
+            self.level_text.set_text(f'Level {level}')
+        return self._blit()
+
+    def frames(self, levels_per_frame=1):
+        """
+        탐색 단계별 프레임을 하나씩 만들어 주는 생성기 (마지막에 경로 장면 유지)
+        """
+        levels = list(range(0, self.last_level + 1, levels_per_frame))
+        if levels[-1] != self.last_level:
+            levels.append(self.last_level)
+        for level in levels:
+            yield self.frame_at(level)
+        for _ in range(HOLD_FRAMES):
+            yield self.frame_at(self.last_level, show_path=True)
+
+    def preview_frames(self):
+        """
+        GIF 팔레트를 뽑기 위한 바탕 프레임과 마지막 장면 프레임 (복사본)
+        """
+        base = np.asarray(self.canvas.buffer_rgba()).copy()
+        final = self.frame_at(self.last_level, show_path=True).copy()
+        # 미리보기로 칠한 방문 레이어를 지움
+        self._visited[:] = 0
+        self.path_layer.set_data([], [])
+        return [base, final]
+
+    def close(self):
+        self._plt.close(self.fig)
+
+
+def render_animation(filename=DEFAULT_FILE, fps=10, dpi=60, levels_per_frame=1):
+    """
+    MyHome → 반달곰 커피 BFS 탐색 애니메이션을 저장하는 함수
+
+    Args:
+        filename (str): 저장할 파일 (.gif 또는 .mp4)
+        fps (int): 초당 프레임 수
+        dpi (int): 프레임 해상도
+        levels_per_frame (int): 프레임 하나에 진행할 탐색 단계 수
+    """
+    data, category_df = load_processed_data()
+    start, end = find_start_and_end_points(data, category_df)
+    if start is None or end is None:
+        print('시작점 또는 끝점을 찾을 수 없어서 애니메이션을 만들 수 없습니다.')
+        return
+
+    grid_map = create_grid_map(data, start)
+    path = bfs_shortest_path(grid_map, start, end)
+    field = grid_distance_field(grid_map, start)
+
+    began = time.perf_counter()
+    animator = SearchAnimator(data, category_df, field, path, start, end, dpi)
+    base_time = time.perf_counter() - began
+
+    if filename.lower().endswith('.mp4'):
+        writer = FfmpegStreamWriter(filename, fps, animator.width, animator.height)
+    else:
+        writer = GifStreamWriter(filename, fps, animator.preview_frames())
+
+    began = time.perf_counter()
+    try:
+        with writer:
+            for frame in animator.frames(levels_per_frame):
+                writer.write(frame)
+    finally:
+        animator.close()
+    frame_time = (time.perf_counter() - began) / max(writer.frames, 1)
+
+    print(f'바탕 지도 그리기: {base_time * 1000:.0f}ms (1회)')
+    print(f'프레임 {writer.frames}개, 프레임당 {frame_time * 1000:.1f}ms (블리팅 + 인코딩)')
+    print(f'탐색 애니메이션이 {filename} 파일로 저장되었습니다.')
+
+
+def main():
+    """
+    메인 실행 함수
+    """
+    parser = argparse.ArgumentParser(description='BFS 탐색 경계 애니메이션 저장')
+    parser.add_argument('--output', default=DEFAULT_FILE, help='저장할 파일 (.gif 또는 .mp4)')
+    parser.add_argument('--fps', type=int, default=10, help='초당 프레임 수')
+    parser.add_argument('--dpi', type=int, default=60, help='프레임 해상도')
+    parser.add_argument('--levels-per-frame', type=int, default=1, help='프레임당 진행할 탐색 단계 수')
+    args = parser.parse_args()
+
+    render_animation(args.output, args.fps, args.dpi, args.levels_per_frame)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,264 @@
+"""
+컴파일 탐색 커널
+격자를 1차원 배열(한 칸 = 1바이트)로 펼쳐 두고 BFS 안쪽 반복문을 배열 인덱스 연산만으로 작성했습니다.
+numba를 불러올 수 있으면 커널을 기계어로 컴파일해서 쓰고,
+없으면 기존 파이썬 구현(bfs_shortest_path)으로 돌아갑니다.
+두 경로 모두 같은 탐색 순서를 따르므로 결과 경로가 완전히 같습니다.
+
+환경 변수 BANDALGOM_NO_JIT=1 로 numba가 있어도 컴파일 커널을 끌 수 있습니다.
+"""
+
+import contextlib
+import functools
+import importlib.util
+import io
+import os
+import time
+
+import numpy as np
+
+from vector_bfs import occupancy_from_grid_map
+
+
+# 컴파일 커널 사용 여부 (numba가 있고 환경 변수로 끄지 않은 경우)
+COMPILED = importlib.util.find_spec('numba') is not None and os.environ.get('BANDALGOM_NO_JIT') != '1'
+
+# bfs_shortest_path와 같은 탐색 순서 (상, 하, 좌, 우)
+STEP_X = np.array([0, 0, -1, 1], dtype=np.int64)
+STEP_Y = np.array([1, -1, 0, 0], dtype=np.int64)
+
+
+def _jit(function):
+    """
+    numba가 있으면 함수를 컴파일하고, 없으면 그대로 돌려주는 데코레이터
+
+    numba는 불러오는 데만 시간이 오래 걸리므로 커널을 처음 호출할 때 불러와 컴파일합니다.
+    """
+    if not COMPILED:
+        return function
+
+    compiled = None
+
+    @functools.wraps(function)
+    def wrapper(*args):
+        nonlocal compiled
+        if compiled is None:
+            import numba
+            compiled = numba.njit(cache=True, nogil=True)(function)
+        return compiled(*args)
+
+    return wrapper
+
+
+@_jit
+def _bfs_kernel(passable, width, height, start, end, parent):
+    """
+    1차원 격자에서 BFS를 수행해 parent 배열을 채우는 커널
+
+    방문 처리는 큐에 넣을 때, 도착 판정은 큐에서 꺼낼 때 하므로
+    bfs_shortest_path와 같은 경로가 만들어집니다.
+
+    Returns:
+        bool: end에 도달했는지 여부
+    """
+    parent[:] = -1
+    parent[start] = start
+    queue = np.empty(width * height, dtype=np.int64)
+    queue[0] = start
+    head, tail = 0, 1
+
+    while head < tail:
+        current = queue[head]
+        head += 1
+        if current == end:
+            return True
+
+        x = current % width
+        y = current // width
+        for k in range(4):
+            next_x = x + STEP_X[k]
+            next_y = y + STEP_Y[k]
+            if next_x < 0 or next_x >= width or next_y < 0 or next_y >= height:
+                continue
+            neighbor = next_y * width + next_x
+            if parent[neighbor] >= 0 or not passable[neighbor]:
+                continue
+            parent[neighbor] = current
+            queue[tail] = neighbor
+            tail += 1
+
+    return False
+
+
+@_jit
+def _distance_kernel(passable, width, height, start, distance):
+    """
+    1차원 격자에서 start부터 모든 칸까지의 거리를 distance 배열에 채우는 커널 (도달 불가 -1)
+    """
+    distance[:] = -1
+    distance[start] = 0
+    queue = np.empty(width * height, dtype=np.int64)
+    queue[0] = start
+    head, tail = 0, 1
+
+    while head < tail:
+        current = queue[head]
+        head += 1
+        x = current % width
+        y = current // width
+        for k in range(4):
+            next_x = x + STEP_X[k]
+            next_y = y + STEP_Y[k]
+            if next_x < 0 or next_x >= width or next_y < 0 or next_y >= height:
+                continue
+            neighbor = next_y * width + next_x
+            if distance[neighbor] >= 0 or not passable[neighbor]:
+                continue
+            distance[neighbor] = distance[current] + 1
+            queue[tail] = neighbor
+            tail += 1
+
+
+class FlatGrid:
+    """
+    커널에 넘길 1차원 격자
+
+    (x, y) 칸은 (y - y0) * width + (x - x0) 번째 원소이며,
+    격자 지도에 없는 칸과 장애물은 0, 지나갈 수 있는 칸은 1입니다.
+    """
+
+    def __init__(self, passable, x0, y0, width, height):
+        self.passable = passable
+        self.x0 = x0
+        self.y0 = y0
+        self.width = width
+        self.height = height
+
+    @classmethod
+    def from_grid_map(cls, grid_map):
+        """
+        create_grid_map으로 만든 격자 지도를 1차원 격자로 바꾸는 함수
+        """
+        occupancy, x0, y0 = occupancy_from_grid_map(grid_map)
+        height, width = occupancy.shape
+        return cls(occupancy.astype(np.uint8).ravel(), x0, y0, width, height)
+
+    def contains(self, cell):
+        x, y = cell
+        return 0 <= x - self.x0 < self.width and 0 <= y - self.y0 < self.height
+
+    def index(self, cell):
+        x, y = cell
+        return (y - self.y0) * self.width + (x - self.x0)
+
+    def cell(self, index):
+        return (int(index % self.width) + self.x0, int(index // self.width) + self.y0)
+
+    def kernel_path(self, start, end):
+        """
+        커널로 start에서 end까지의 최단경로를 찾는 함수 (start는 격자 범위 안)
+
+        Returns:
+            list: 경로 좌표 리스트 (없으면 빈 리스트)
+        """
+        if start == end:
+            return [start]
+        if not self.contains(end):
+            return []
+
+        parent = np.empty(self.width * self.height, dtype=np.int64)
+        target = self.index(end)
+        if not _bfs_kernel(self.passable, self.width, self.height, self.index(start), target, parent):
+            return []
+
+        path = []
+        current = target
+        while True:
+            path.append(self.cell(current))
+            if parent[current] == current:
+                break
+            current = parent[current]
+        path.reverse()
+        return path
+
+    def kernel_distances(self, start):
+        """
+        커널로 start에서 모든 칸까지의 거리를 계산하는 함수
+
+        Returns:
+            numpy.ndarray: (height, width) int32 배열, 도달할 수 없는 칸은 -1
+        """
+        distance = np.empty(self.width * self.height, dtype=np.int32)
+        _distance_kernel(self.passable, self.width, self.height, self.index(start), distance)
+        return distance.reshape(self.height, self.width)
+
+
+def shortest_path(grid_map, flat_grid, start, end):
+    """
+    컴파일 커널을 쓸 수 있으면 커널로, 아니면 bfs_shortest_path로 최단경로를 찾는 함수
+
+    Args:
+        grid_map (dict): 격자 지도 (파이썬 구현용)
+        flat_grid (FlatGrid): grid_map으로 만든 1차원 격자 (커널용)
+        start (tuple): 시작점 좌표
+        end (tuple): 끝점 좌표
+
+    Returns:
+        list: 경로 좌표 리스트 (없으면 빈 리스트)
+    """
+    if COMPILED and flat_grid.contains(start):
+        return flat_grid.kernel_path(start, end)
+
+    from map_direct_save import bfs_shortest_path
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        return bfs_shortest_path(grid_map, start, end)
+
+
+def benchmark(size=300, obstacle_ratio=0.25, seed=0, repeat=5):
+    """
+    무작위 격자에서 bfs_shortest_path와 탐색 커널을 비교하는 함수
+
+    numba가 없으면 커널을 파이썬 그대로 실행한 시간을 보여 줍니다.
+
+    Args:
+        size (int): 격자 한 변의 길이
+        obstacle_ratio (float): 장애물 비율
+        seed (int): 난수 시드
+        repeat (int): 측정 횟수 (최솟값 기준)
+    """
+    from map_direct_save import bfs_shortest_path
+
+    rng = np.random.default_rng(seed)
+    blocked = rng.random((size, size)) < obstacle_ratio
+    blocked[0, 0] = blocked[-1, -1] = False
+    grid_map = {
+        (x, y): 'obstacle' if blocked[y, x] else 'free'
+        for y in range(size) for x in range(size)
+    }
+    start, end = (0, 0), (size - 1, size - 1)
+    flat_grid = FlatGrid.from_grid_map(grid_map)
+
+    # 첫 호출에서 컴파일(또는 캐시 로드)이 일어나므로 측정 전에 한 번 실행
+    kernel = flat_grid.kernel_path(start, end)
+
+    python_times, kernel_times = [], []
+    for _ in range(repeat):
+        began = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            flat = bfs_shortest_path(grid_map, start, end)
+        python_times.append(time.perf_counter() - began)
+
+        began = time.perf_counter()
+        kernel = flat_grid.kernel_path(start, end)
+        kernel_times.append(time.perf_counter() - began)
+
+    label = 'numba 컴파일' if COMPILED else '컴파일 없음 (파이썬 실행)'
+    print(f'격자 {size}x{size}, 장애물 {obstacle_ratio:.0%}, 커널: {label}')
+    print(f'경로 일치: {"예" if flat == kernel else "아니오"} (길이 {len(flat)})')
+    print(f'파이썬 BFS: {min(python_times) * 1000:.1f}ms')
+    print(f'탐색 커널: {min(kernel_times) * 1000:.1f}ms ({min(python_times) / min(kernel_times):.1f}배)')
+
+
+if __name__ == '__main__':
+    benchmark()
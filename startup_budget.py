@@ -0,0 +1,198 @@
+"""
+시작 시간 예산 측정 스크립트
+각 실행 진입점을 새 파이썬 프로세스에서 불러오는 데 걸리는 시간
+(인터프리터 시작 + import)을 측정해서 예산과 비교합니다.
+경로 계산 전용 실행(python map_direct_save.py --route-only)은 프로세스를 시작해서
+첫 경로가 출력될 때까지의 시간도 재서 예산과 비교합니다.
+대시보드(app)는 새 프로세스에서 AppTest로 첫 화면을 한 번 실행하는 시간을 잽니다 (streamlit이 없으면 건너뜀).
+
+사용법:
+    python startup_budget.py          # 각 진입점 5회 측정, 중앙값 기준
+    python startup_budget.py -n 10
+"""
+
+import argparse
+import importlib.util
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from pipeline import INPUT_FILES
+
+
+# 진입점별 시작 시간 예산 (초)
+# 경로 계산 전용 진입점은 matplotlib 없이 1초보다 충분히 빨라야 함
+# app은 import 대신 첫 화면 실행 시간 (streamlit 불러오기는 빼고 앱의 import와 첫 실행)
+BUDGETS = {
+    'map_direct_save': 0.8,
+    'route_service': 0.8,
+    'hierarchical_path': 0.8,
+    'caffee_map_final': 0.8,
+    'map_draw_real': 0.8,
+    'app': 1.0,
+}
+
+# BUDGETS에서 import 대신 measure_app으로 재는 진입점
+APP_ENTRY = 'app'
+
+# 실행해서 첫 경로가 나올 때까지의 예산 (초)
+# (명령, 첫 경로가 나왔다는 출력 문구, 예산)
+ROUTE_BUDGETS = {
+    'map_direct_save --route-only': (['map_direct_save.py', '--route-only'], '최단 거리:', 1.0),
+}
+
+# 불러오지 않아야 하는 무거운 모듈 (진입점별)
+FORBIDDEN_MODULES = {
+    'map_direct_save': ['matplotlib'],
+    'route_service': ['matplotlib'],
+    'hierarchical_path': ['matplotlib'],
+    'caffee_map_final': ['matplotlib'],
+    'map_draw_real': ['matplotlib'],
+}
+
+
+def measure_import(module, repeat):
+    """
+    새 프로세스에서 모듈을 불러오는 시간을 repeat번 측정하는 함수
+
+    Args:
+        module (str): 모듈 이름
+        repeat (int): 측정 횟수
+
+    Returns:
+        tuple: (시간 리스트(초), 불러온 금지 모듈 리스트)
+    """
+    forbidden = FORBIDDEN_MODULES.get(module, [])
+    check = (
+        f'import sys; import {module}; '
+        f'print(",".join(m for m in {forbidden!r} if m in sys.modules))'
+    )
+
+    timings = []
+    loaded = []
+    for _ in range(repeat):
+        began = time.perf_counter()
+        result = subprocess.run([sys.executable, '-c', check], capture_output=True, text=True)
+        timings.append(time.perf_counter() - began)
+        if result.returncode != 0:
+            raise RuntimeError(f'{module} 불러오기 실패:\n{result.stderr}')
+        loaded = [m for m in result.stdout.strip().split(',') if m]
+    return timings, loaded
+
+
+def measure_first_route(command, marker, repeat):
+    """
+    스크립트를 새 프로세스로 실행해서 marker 문구가 출력될 때까지의 시간을 repeat번 측정하는 함수
+
+    결과 파일(home_to_cafe.csv 등)이 작업 폴더를 덮어쓰지 않도록
+    입력 CSV만 복사한 임시 폴더에서 실행합니다.
+
+    Args:
+        command (list): 스크립트 파일과 인자
+        marker (str): 첫 경로가 나왔음을 알리는 출력 문구
+        repeat (int): 측정 횟수
+
+    Returns:
+        list: 시간 리스트(초)
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ, PYTHONUNBUFFERED='1', PYTHONPATH=here)
+    script = [sys.executable, os.path.join(here, command[0])] + command[1:]
+
+    timings = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for name in INPUT_FILES:
+            shutil.copy(os.path.join(here, name), workdir)
+        for _ in range(repeat):
+            began = time.perf_counter()
+            process = subprocess.Popen(
+                script, cwd=workdir, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                text=True, encoding='utf-8', errors='replace',
+            )
+            elapsed, output = None, []
+            for line in process.stdout:
+                output.append(line)
+                if elapsed is None and marker in line:
+                    elapsed = time.perf_counter() - began
+            process.wait()
+            if process.returncode != 0 or elapsed is None:
+                raise RuntimeError(f'{" ".join(command)} 실행에서 첫 경로를 얻지 못했습니다:\n{"".join(output[-20:])}')
+            timings.append(elapsed)
+    return timings
+
+
+def measure_app(repeat):
+    """
+    새 프로세스에서 Streamlit 대시보드(app.py) 첫 화면을 한 번 실행하는 시간을 repeat번 측정하는 함수
+
+    streamlit 자체를 불러오는 시간은 빼고, 앱의 import와 첫 화면 실행 시간만 잽니다.
+
+    Returns:
+        list: 시간 리스트(초), streamlit이 없으면 None
+    """
+    if importlib.util.find_spec('streamlit') is None:
+        return None
+    app = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app.py')
+    check = (
+        'import time; from streamlit.testing.v1 import AppTest; '
+        f'began = time.perf_counter(); at = AppTest.from_file({app!r}, default_timeout=30).run(); '
+        'print(time.perf_counter() - began); '
+        'raise SystemExit(1 if at.exception else 0)'
+    )
+
+    timings = []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, '-c', check], capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f'app.py 첫 화면 실행 실패:\n{result.stdout}{result.stderr}')
+        timings.append(float(result.stdout.strip().splitlines()[-1]))
+    return timings
+
+
+def main():
+    """
+    메인 실행 함수
+    """
+    parser = argparse.ArgumentParser(description='진입점별 시작 시간 예산 측정')
+    parser.add_argument('-n', '--repeat', type=int, default=5, help='측정 횟수')
+    args = parser.parse_args()
+
+    baseline, _ = measure_import('sys', args.repeat)
+    print(f'빈 인터프리터 시작: {statistics.median(baseline):.3f}초')
+    print()
+    print(f'{"진입점":<20}{"중앙값":>10}{"예산":>10}  결과')
+
+    over_budget = False
+    for module, budget in BUDGETS.items():
+        if module == APP_ENTRY:
+            timings, loaded = measure_app(args.repeat), []
+            if timings is None:
+                print(f'{module:<20}{"-":>10}{budget:>9.3f}s  건너뜀 (streamlit 없음)')
+                continue
+        else:
+            timings, loaded = measure_import(module, args.repeat)
+        median = statistics.median(timings)
+        ok = median <= budget and not loaded
+        over_budget |= not ok
+        note = '통과' if ok else '초과'
+        if loaded:
+            note += f' (불러오면 안 되는 모듈: {", ".join(loaded)})'
+        print(f'{module:<20}{median:>9.3f}s{budget:>9.3f}s  {note}')
+
+    print()
+    print(f'{"첫 경로까지":<32}{"중앙값":>10}{"예산":>10}  결과')
+    for name, (command, marker, budget) in ROUTE_BUDGETS.items():
+        median = statistics.median(measure_first_route(command, marker, args.repeat))
+        ok = median <= budget
+        over_budget |= not ok
+        print(f'{name:<32}{median:>9.3f}s{budget:>9.3f}s  {"통과" if ok else "초과"}')
+
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == '__main__':
+    main()
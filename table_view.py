@@ -0,0 +1,102 @@
+"""
+대시보드 표 보기 도우미
+큰 데이터프레임을 서버에서 걸러 내고 한 페이지 분량만 잘라서 화면에 보내기 위한 함수들입니다.
+streamlit 없이도 쓸 수 있도록 pandas/numpy만 사용합니다.
+
+필터 문법 (컬럼 하나에 적용):
+    5          값이 5인 행
+    3~7        3 이상 7 이하인 행
+    1,4        1 또는 4인 행
+    Coffee     문자열 컬럼이면 'Coffee'가 들어 있는 행 (대소문자 무시)
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+
+# 화면에서 고를 수 있는 페이지 크기
+PAGE_SIZES = (25, 50, 100, 500)
+
+
+def _parse_number(text):
+    text = text.strip()
+    lowered = text.lower()
+    if lowered in ('true', 'false'):
+        return 1 if lowered == 'true' else 0
+    return float(text)
+
+
+def filter_rows(frame, column, query):
+    """
+    컬럼 하나에 필터를 적용해서 남는 행 위치를 구하는 함수
+
+    Args:
+        frame (pandas.DataFrame): 대상 데이터
+        column (str): 필터를 적용할 컬럼
+        query (str): 필터 문자열 (모듈 설명 참고, 비어 있으면 전체)
+
+    Returns:
+        numpy.ndarray: 남는 행의 위치 (정수 배열)
+
+    Raises:
+        ValueError: 숫자 컬럼에 숫자가 아닌 필터를 줬을 때
+    """
+    query = (query or '').strip()
+    if not query:
+        return np.arange(len(frame))
+
+    values = frame[column]
+    if pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(values):
+        numbers = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        try:
+            if '~' in query:
+                low, high = (_parse_number(part) for part in query.split('~', 1))
+                mask = (numbers >= low) & (numbers <= high)
+            else:
+                mask = np.isin(numbers, [_parse_number(part) for part in query.split(',')])
+        except ValueError:
+            raise ValueError(f'{column} 컬럼에는 숫자 필터(예: 5, 3~7, 1,4)만 쓸 수 있습니다: {query}') from None
+    else:
+        mask = values.astype('string').str.contains(query, case=False, regex=False).fillna(False).to_numpy(dtype=bool)
+    return np.flatnonzero(mask)
+
+
+def page_window(positions, page, page_size):
+    """
+    남은 행 위치 중 page번째 페이지에 해당하는 부분을 구하는 함수
+
+    Args:
+        positions (numpy.ndarray): filter_rows 결과
+        page (int): 페이지 번호 (1부터, 범위를 벗어나면 가장 가까운 페이지)
+        page_size (int): 페이지당 행 수
+
+    Returns:
+        tuple: (이 페이지의 행 위치, 실제 페이지 번호, 전체 페이지 수)
+    """
+    pages = max(1, math.ceil(len(positions) / page_size))
+    page = min(max(1, int(page)), pages)
+    start = (page - 1) * page_size
+    return positions[start:start + page_size], page, pages
+
+
+def column_stats(frame):
+    """
+    컬럼별 요약 통계 (타입, 빈 값 수, 고유값 수, 최솟값, 최댓값)를 구하는 함수
+
+    Returns:
+        pandas.DataFrame: 컬럼 이름을 인덱스로 하는 통계 표
+    """
+    rows = {}
+    for name in frame.columns:
+        values = frame[name]
+        numeric = pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values)
+        rows[name] = {
+            '타입': str(values.dtype),
+            '빈 값': int(values.isna().sum()),
+            '고유값 수': int(values.nunique()),
+            '최솟값': values.min() if numeric and len(values) else None,
+            '최댓값': values.max() if numeric and len(values) else None,
+        }
+    return pd.DataFrame.from_dict(rows, orient='index')
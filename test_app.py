@@ -0,0 +1,62 @@
+import functools
+
+import pytest
+
+st = pytest.importorskip('streamlit')
+
+from streamlit.testing.v1 import AppTest
+
+
+def open_route_page(monkeypatch, token=None):
+    if token is None:
+        monkeypatch.delenv('BANDALGOM_ADMIN_TOKEN', raising=False)
+    else:
+        monkeypatch.setenv('BANDALGOM_ADMIN_TOKEN', token)
+    at = AppTest.from_file('app.py', default_timeout=60).run()
+    at.sidebar.selectbox[0].select('경로 질의').run()
+    assert not at.exception
+    return at
+
+
+def labels(at):
+    return {button.label for button in at.button}
+
+
+def test_admin_tools_hidden_without_token(monkeypatch):
+    at = open_route_page(monkeypatch)
+    assert '칸 바꾸기' not in labels(at)
+    assert not [field for field in at.text_input if field.label == '관리자 토큰']
+
+
+def test_admin_tools_need_matching_token(monkeypatch):
+    at = open_route_page(monkeypatch, 'secret')
+    field = next(field for field in at.text_input if field.label == '관리자 토큰')
+    assert '칸 바꾸기' not in labels(at)
+
+    field.set_value('wrong').run()
+    assert '칸 바꾸기' not in labels(at)
+    assert at.error
+
+    next(field for field in at.text_input if field.label == '관리자 토큰').set_value('secret').run()
+    assert {'칸 바꾸기', '🔄 CSV 다시 읽기'} <= labels(at)
+
+
+def test_admin_tools_rerun_as_fragment(monkeypatch):
+    # AppTest는 fragment만 다시 실행할 수 없으므로 어떤 함수가 fragment로 실행되는지 기록
+    fragments = []
+    real_fragment = st.fragment
+
+    def recording_fragment(func=None, **kwargs):
+        if func is None:
+            return lambda inner: recording_fragment(inner, **kwargs)
+
+        @functools.wraps(func)
+        def run(*args, **inner_kwargs):
+            fragments.append(func.__name__)
+            return func(*args, **inner_kwargs)
+        return real_fragment(run, **kwargs)
+
+    monkeypatch.setattr(st, 'fragment', recording_fragment)
+    open_route_page(monkeypatch, 'secret')
+    assert 'route_engine_admin' in fragments
+    assert 'admin_token' not in fragments
@@ -0,0 +1,68 @@
+import subprocess
+import sys
+
+import pandas as pd
+
+from area_registry import AreaRegistry
+from grid_components import GridMap
+
+
+def small_inputs():
+    # 4x4 격자: 왼쪽 두 열은 area 1, 오른쪽 두 열은 area 2
+    cells = [(x, y) for x in range(1, 5) for y in range(1, 5)]
+    area_map = pd.DataFrame({
+        'x': [x for x, _ in cells],
+        'y': [y for _, y in cells],
+        'ConstructionSite': [1 if (x, y) == (2, 2) else 0 for x, y in cells],
+    })
+    area_struct = pd.DataFrame({
+        'x': [x for x, _ in cells],
+        'y': [y for _, y in cells],
+        'category': [2 if (x, y) == (3, 3) else 0 for x, y in cells],
+        'area': [1 if x <= 2 else 2 for x, _ in cells],
+    })
+    return area_map, area_struct
+
+
+def test_boxes_and_spatial_index():
+    registry = AreaRegistry.from_inputs(*small_inputs())
+
+    assert registry.area_ids() == [1, 2]
+    assert registry.box(2).offset == (-2, 0)
+    assert registry.areas_at(1, 4) == [1]
+    assert registry.areas_at(4, 1) == [2]
+    assert registry.areas_in(2, 1, 3, 1) == [1, 2]
+
+
+def test_area_grid_is_cached_and_localized():
+    registry = AreaRegistry.from_inputs(*small_inputs())
+
+    grid_map = registry.grid_map(2)
+    assert isinstance(grid_map, GridMap)
+    assert registry.grid_map(2) is grid_map
+    # area 2의 (3, 3)은 보정하면 (1, 3)
+    assert grid_map[(1, 3)] == 'obstacle'
+    assert len(grid_map) == 8
+
+    registry.invalidate(2)
+    assert registry.grid_map(2) is not grid_map
+
+
+def test_does_not_import_stage_scripts():
+    code = 'import sys, area_registry; print("map_direct_save" in sys.modules)'
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == 'False'
+
+
+def test_stage_loader_reuses_registry():
+    from map_direct_save import load_processed_data
+
+    area_map, area_struct = small_inputs()
+    category = pd.DataFrame({'category': [1, 2], 'struct': ['Apartment', 'Building']})
+    registry = AreaRegistry.from_inputs(area_map, area_struct)
+
+    data, _ = load_processed_data(inputs=(area_map, area_struct, category), registry=registry)
+    fresh, _ = load_processed_data(inputs=(area_map, area_struct, category))
+
+    for name in ('x', 'y', 'ConstructionSite', 'category'):
+        assert list(data[name]) == list(fresh[name])
@@ -0,0 +1,79 @@
+import random
+
+import numpy as np
+import pytest
+
+from bitset_bfs import BitGrid
+from conftest import assert_valid_path, random_grid, reference_path
+
+
+@pytest.mark.parametrize('seed', range(30))
+def test_shortest_path_matches_bfs_length(seed):
+    rng = random.Random(seed)
+    grid_map = random_grid(rng)
+    bit_grid = BitGrid.from_grid_map(grid_map)
+    cells = list(grid_map)
+    for _ in range(10):
+        start, end = rng.choice(cells), rng.choice(cells)
+        expected = reference_path(grid_map, start, end)
+        path = bit_grid.shortest_path(start, end)
+        assert len(path) == len(expected)
+        if path and start != end:
+            assert_valid_path(grid_map, path, start, end)
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_distance_field_matches_bfs(seed):
+    rng = random.Random(seed)
+    grid_map = random_grid(rng)
+    bit_grid = BitGrid.from_grid_map(grid_map)
+    start = rng.choice(list(grid_map))
+    distance = bit_grid.distance_field(start)
+    for (x, y) in grid_map:
+        expected = len(reference_path(grid_map, start, (x, y))) - 1
+        assert distance[y - bit_grid.y0, x - bit_grid.x0] == expected
+
+
+def test_edges_and_unreachable():
+    grid_map = {(x, 0): 'free' for x in range(5)}
+    grid_map[(2, 0)] = 'obstacle'
+    bit_grid = BitGrid.from_grid_map(grid_map)
+
+    assert bit_grid.shortest_path((0, 0), (0, 0)) == [(0, 0)]
+    assert bit_grid.shortest_path((0, 0), (4, 0)) == []
+    assert bit_grid.shortest_path((0, 0), (9, 9)) == []
+    np.testing.assert_array_equal(bit_grid.distance_field((4, 0)), [[-1, -1, -1, 1, 0]])
+
+    # 행 끝의 경계 비트 덕분에 (2, 0)에서 오른쪽으로 밀어도 다음 행의 (0, 1)로 넘어가지 않음
+    corners = {(x, y): 'obstacle' for x in range(3) for y in range(2)}
+    corners[(2, 0)] = corners[(0, 1)] = 'free'
+    bit_grid = BitGrid.from_grid_map(corners)
+    assert bit_grid.shortest_path((2, 0), (0, 1)) == []
+    assert bit_grid.distance_field((2, 0))[1, 0] == -1
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_start_outside_grid_matches_bfs(seed):
+    rng = random.Random(seed)
+    grid_map = random_grid(rng)
+    bit_grid = BitGrid.from_grid_map(grid_map)
+    # 격자 범위(x -3~11, y 2~13)를 둘러싼 칸에서 출발
+    outside = [(x, y) for x in range(-4, 13) for y in (1, 14)] + [(x, y) for x in (-4, 12) for y in range(2, 14)]
+    cells = list(grid_map)
+    for _ in range(10):
+        start, end = rng.choice(outside), rng.choice(cells)
+        expected = reference_path(grid_map, start, end)
+        path = bit_grid.shortest_path(start, end)
+        assert len(path) == len(expected)
+        if path:
+            assert_valid_path(grid_map, path, start, end)
+
+
+def test_start_outside_grid():
+    grid_map = {(x, y): 'free' for x in range(1, 4) for y in range(0, 3)}
+    bit_grid = BitGrid.from_grid_map(grid_map)
+    assert bit_grid.shortest_path((0, 0), (1, 1)) == [(0, 0), (1, 0), (1, 1)]
+    assert len(reference_path(grid_map, (0, 0), (1, 1))) == 3
+    # 격자와 맞닿지 않은 시작점에서는 갈 수 없음
+    assert bit_grid.shortest_path((-5, -5), (1, 1)) == []
+    assert bit_grid.distance_field((0, 1))[1].tolist() == [1, 2, 3]
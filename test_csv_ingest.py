@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import csv_ingest
+from csv_ingest import read_inputs, read_table, validate_inputs
+
+
+@pytest.fixture(params=['arrow', 'pandas'])
+def reader(request, monkeypatch):
+    if request.param == 'arrow':
+        if not csv_ingest.ARROW_AVAILABLE:
+            pytest.skip('pyarrow가 없음')
+    else:
+        monkeypatch.setattr(csv_ingest, 'ARROW_AVAILABLE', False)
+    return request.param
+
+
+def write(path, lines, bom=True):
+    # 입력 CSV와 같은 형식 (UTF-8 BOM, CRLF, 쉼표 뒤 공백)
+    path.write_bytes((b'\xef\xbb\xbf' if bom else b'') + '\r\n'.join(lines).encode('utf-8') + b'\r\n')
+    return str(path)
+
+
+def plain(frame):
+    # Arrow/pandas 리더 결과를 같은 모양으로 비교
+    return pd.DataFrame({name: frame[name].tolist() for name in frame.columns})
+
+
+def test_bom_crlf_and_spaces_are_cleaned(tmp_path, reader):
+    filename = write(tmp_path / 'area_category.csv', [' category , struct', '1,  Apartment ', '4, BandalgomCoffee'])
+    frame = read_table(filename)
+    assert list(frame.columns) == ['category', 'struct']
+    assert plain(frame).equals(pd.DataFrame({'category': [1, 4], 'struct': ['Apartment', 'BandalgomCoffee']}))
+
+    filename = write(tmp_path / 'area_map.csv', ['x, y, ConstructionSite', '1, 2, 0', '3, 4, 1'])
+    frame = read_table(filename)
+    assert plain(frame).equals(pd.DataFrame({'x': [1, 3], 'y': [2, 4], 'ConstructionSite': [False, True]}))
+
+
+@pytest.mark.parametrize('header', ['x,y', 'y,x,ConstructionSite', 'x,y,ConstructionSite,extra'])
+def test_header_mismatch_is_rejected(tmp_path, reader, header):
+    filename = write(tmp_path / 'area_map.csv', [header, '1,2,0'])
+    with pytest.raises(ValueError, match='컬럼이 예상과 다릅니다'):
+        read_table(filename)
+
+
+def test_construction_site_must_be_zero_or_one(tmp_path, reader):
+    filename = write(tmp_path / 'area_map.csv', ['x,y,ConstructionSite', '1,2,0', '1,3, 2'])
+    with pytest.raises(ValueError, match='0 또는 1만'):
+        read_table(filename)
+
+
+def test_non_integer_values_are_rejected(tmp_path, reader):
+    filename = write(tmp_path / 'area_map.csv', ['x,y,ConstructionSite', '1,x,0'])
+    with pytest.raises(ValueError):
+        read_table(filename)
+
+
+def test_kind_overrides_file_name(tmp_path, reader):
+    filename = write(tmp_path / 'copy.csv', ['category,struct', '2,Building'], bom=False)
+    assert plain(read_table(filename, 'area_category.csv'))['struct'].tolist() == ['Building']
+
+
+def test_project_inputs_match_read_csv(reader):
+    area_map, area_struct, area_category = read_inputs()
+    expected = pd.read_csv('area_struct.csv', encoding='utf-8-sig', skipinitialspace=True)
+    expected.columns = expected.columns.str.strip()
+    np.testing.assert_array_equal(area_struct.to_numpy(dtype=np.int64), expected.to_numpy(dtype=np.int64))
+    assert area_category['struct'].tolist() == ['Apartment', 'Building', 'MyHome', 'BandalgomCoffee']
+
+
+def inputs():
+    area_map = pd.DataFrame({'x': [1, 1, 2, 2], 'y': [1, 2, 1, 2], 'ConstructionSite': [False, True, False, False]})
+    area_struct = pd.DataFrame({'x': [1, 1, 2, 2], 'y': [1, 2, 1, 2], 'category': [0, 1, 2, 0], 'area': [0, 0, 1, 1]})
+    area_category = pd.DataFrame({'category': [1, 2], 'struct': ['Apartment', 'Building']})
+    return area_map, area_struct, area_category
+
+
+def test_valid_inputs_pass():
+    validate_inputs(*inputs())
+
+
+def test_missing_values_stop_validation():
+    area_map, area_struct, area_category = inputs()
+    area_struct['category'] = area_struct['category'].astype(float)
+    area_struct.loc[0, 'category'] = np.nan
+    with pytest.raises(ValueError, match=r'area_struct\.category에 빈 값이 1개'):
+        validate_inputs(area_map, area_struct, area_category)
+
+
+def test_all_problems_are_reported_together():
+    area_map, area_struct, area_category = inputs()
+    area_map.loc[3, ['x', 'y']] = [1, 1]
+    area_struct.loc[3, 'category'] = 9
+    area_category.loc[1, 'struct'] = 'Apartment'
+    with pytest.raises(ValueError) as error:
+        validate_inputs(area_map, area_struct, area_category)
+    message = str(error.value)
+    assert 'area_map에 중복된 (x, y) 좌표가 1개' in message
+    assert '없는 카테고리가 있습니다: [9]' in message
+    assert 'area_category에 중복된' in message
+    assert 'area_struct에 중복된' not in message
+
+
+def test_sparse_coordinates_duplicate_check():
+    # 좌표가 넓게 흩어진 경우(정렬로 확인하는 경로)
+    area_map, area_struct, area_category = inputs()
+    area_map.loc[0, ['x', 'y']] = [1000, 1000]
+    area_map.loc[1, ['x', 'y']] = [1000, 1000]
+    with pytest.raises(ValueError, match='area_map에 중복된 \\(x, y\\) 좌표가 1개'):
+        validate_inputs(area_map, area_struct, area_category)
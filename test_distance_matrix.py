@@ -0,0 +1,56 @@
+import random
+
+import numpy as np
+import pytest
+
+import distance_matrix
+from conftest import random_grid, reference_path
+from distance_matrix import UNREACHABLE, DistanceMatrix, compute_distance_matrix
+
+
+def reference_matrix(grid_map, sources, targets):
+    rows = []
+    for source in sources:
+        lengths = [len(reference_path(grid_map, source, target)) for target in targets]
+        rows.append([length - 1 if length else UNREACHABLE for length in lengths])
+    return np.array(rows, dtype=np.int32).reshape(len(sources), len(targets))
+
+
+@pytest.mark.parametrize('workers', [1, 3])
+@pytest.mark.parametrize('compiled', [True, False])
+@pytest.mark.parametrize('seed', range(8))
+def test_every_entry_equals_bfs_length(monkeypatch, seed, compiled, workers):
+    # compiled=False면 numba 대신 vector_bfs 거리 배열로 계산
+    monkeypatch.setattr(distance_matrix, 'COMPILED', compiled and distance_matrix.COMPILED)
+    rng = random.Random(seed)
+    grid_map = random_grid(rng)
+    cells = list(grid_map)
+    # 장애물 칸 출발지(Apartment처럼), 격자 밖 도착지, 같은 칸도 섞음
+    sources = rng.sample(cells, 6)
+    targets = rng.sample(cells, 8) + [(99, 99), sources[0]]
+
+    distances = compute_distance_matrix(grid_map, sources, targets, workers)
+    assert distances.dtype == np.int32
+    np.testing.assert_array_equal(distances, reference_matrix(grid_map, sources, targets))
+
+
+def test_save_load_and_nearest(tmp_path):
+    distances = np.array([[4, UNREACHABLE, 2], [UNREACHABLE, UNREACHABLE, UNREACHABLE]], dtype=np.int32)
+    matrix = DistanceMatrix(distances, ['h1', 'h2'], ['c1', 'c2', 'c3'], [(0, 0), (1, 1)], [(2, 2), (3, 3), (4, 4)])
+    filename = str(tmp_path / 'matrix.npz')
+    matrix.save(filename)
+
+    loaded = DistanceMatrix.load(filename)
+    np.testing.assert_array_equal(loaded.distances, distances)
+    assert loaded.row_labels == ['h1', 'h2'] and loaded.col_cells == [(2, 2), (3, 3), (4, 4)]
+    assert loaded.nearest() == [('h1', 'c3', 2), ('h2', None, None)]
+    assert loaded.to_frame().isna().sum().sum() == 4
+
+
+def test_project_home_cafe_matrix_matches_bfs():
+    from map_direct_save import create_grid_map, load_processed_data
+
+    matrix = distance_matrix.build_home_cafe_matrix()
+    data, _ = load_processed_data()
+    grid_map = create_grid_map(data)
+    np.testing.assert_array_equal(matrix.distances, reference_matrix(grid_map, matrix.row_cells, matrix.col_cells))
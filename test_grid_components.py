@@ -0,0 +1,83 @@
+import random
+
+import pytest
+
+from grid_components import ComponentIndex, GridMap
+
+
+def partition(index):
+    """
+    요소 번호와 상관없이 비교할 수 있도록 칸 집합들의 집합으로 바꿈
+    """
+    groups = {}
+    for cell, label in index.labels.items():
+        groups.setdefault(label, set()).add(cell)
+    for label, members in index.members.items():
+        assert members == groups.get(label, set())
+    return {frozenset(group) for group in groups.values()}
+
+
+def assert_consistent(grid_map):
+    assert partition(grid_map.components) == partition(ComponentIndex(dict(grid_map)))
+
+
+def random_grid(rng, width=12, height=10, density=0.3):
+    return GridMap(
+        ((x, y), 'obstacle' if rng.random() < density else 'free')
+        for x in range(width) for y in range(height)
+    )
+
+
+def test_close_splits_and_open_merges():
+    # 가운데 세로줄 하나로만 이어진 두 방
+    grid_map = GridMap(((x, y), 'free') for x in range(5) for y in range(3))
+    for y in (0, 2):
+        grid_map[(2, y)] = 'obstacle'
+    assert grid_map.components.connected((0, 0), (4, 2))
+
+    grid_map[(2, 1)] = 'obstacle'
+    assert not grid_map.components.connected((0, 0), (4, 2))
+    assert grid_map.components.component_count() == 2
+
+    grid_map[(2, 0)] = 'free'
+    assert grid_map.components.connected((0, 0), (4, 2))
+    assert_consistent(grid_map)
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_random_setitem_matches_full_relabel(seed):
+    rng = random.Random(seed)
+    grid_map = random_grid(rng)
+    cells = list(grid_map)
+    for _ in range(200):
+        grid_map[rng.choice(cells)] = rng.choice(('free', 'obstacle'))
+        assert_consistent(grid_map)
+
+
+def test_dict_methods_keep_index_in_sync():
+    rng = random.Random(7)
+    grid_map = random_grid(rng)
+    cells = list(grid_map)
+
+    grid_map.update({cell: 'free' for cell in cells[:20]})
+    assert_consistent(grid_map)
+    grid_map |= {cells[5]: 'obstacle'}
+    assert_consistent(grid_map)
+
+    assert grid_map.pop(cells[30]) in ('free', 'obstacle')
+    assert grid_map.pop((99, 99), 'missing') == 'missing'
+    assert_consistent(grid_map)
+
+    cell, _ = grid_map.popitem()
+    assert cell not in grid_map.components.labels
+    assert_consistent(grid_map)
+
+    assert grid_map.setdefault(cells[30], 'free') == 'free'
+    assert grid_map.setdefault(cells[30], 'obstacle') == 'free'
+    assert_consistent(grid_map)
+
+    grid_map.clear()
+    assert grid_map.components.component_count() == 0
+    grid_map[(0, 0)] = 'free'
+    assert grid_map.components.connected((0, 0), (0, 0))
+    assert_consistent(grid_map)
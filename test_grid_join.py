@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from csv_ingest import read_inputs
+from grid_join import align_grid
+
+
+def random_tables(rng, width=9, height=7, x0=-3, y0=2):
+    cells = [(x, y) for x in range(x0, x0 + width) for y in range(y0, y0 + height)]
+    map_rows = rng.permutation(len(cells))
+    struct_rows = rng.permutation(len(cells))
+    area_map = pd.DataFrame({
+        'x': [cells[i][0] for i in map_rows],
+        'y': [cells[i][1] for i in map_rows],
+        'ConstructionSite': rng.integers(0, 2, len(cells)),
+    })
+    area_struct = pd.DataFrame({
+        'x': [cells[i][0] for i in struct_rows],
+        'y': [cells[i][1] for i in struct_rows],
+        'category': rng.integers(0, 5, len(cells)),
+        'area': rng.integers(0, 4, len(cells)),
+    })
+    return area_map, area_struct
+
+
+def reference(area_map, area_struct):
+    return pd.merge(area_map, area_struct, on=['x', 'y'], how='left')
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_dense_path_matches_merge(seed):
+    area_map, area_struct = random_tables(np.random.default_rng(seed))
+    joined = align_grid(area_map, area_struct)
+    assert joined.is_dense
+    pd.testing.assert_frame_equal(joined.to_frame(), reference(area_map, area_struct))
+
+    # 선형 인덱스가 (x, y)와 맞는지
+    index = joined.linear_index()
+    assert sorted(index.tolist()) == list(range(joined.width * joined.height))
+    np.testing.assert_array_equal(index % joined.width + joined.x0, joined['x'])
+    np.testing.assert_array_equal(index // joined.width + joined.y0, joined['y'])
+
+
+def drop_cell(area_map, area_struct):
+    return area_map, area_struct.iloc[1:].reset_index(drop=True)
+
+
+def shift_struct(area_map, area_struct):
+    return area_map, area_struct.assign(x=area_struct['x'] + 1)
+
+
+def duplicate_map_cell(area_map, area_struct):
+    area_map = area_map.copy()
+    area_map.loc[1, ['x', 'y']] = area_map.loc[0, ['x', 'y']].to_numpy()
+    return area_map, area_struct
+
+
+def float_coordinates(area_map, area_struct):
+    return area_map.astype({'x': float, 'y': float}), area_struct.astype({'x': float, 'y': float})
+
+
+@pytest.mark.parametrize('change', [drop_cell, shift_struct, duplicate_map_cell, float_coordinates])
+def test_fallback_matches_merge(change):
+    area_map, area_struct = change(*random_tables(np.random.default_rng(0)))
+    joined = align_grid(area_map, area_struct)
+    assert not joined.is_dense
+    pd.testing.assert_frame_equal(joined.to_frame(), reference(area_map, area_struct))
+
+
+def test_project_inputs_match_merge():
+    area_map, area_struct, _ = read_inputs()
+    joined = align_grid(area_map, area_struct)
+    assert joined.is_dense
+    # pyarrow 리더로 읽으면 merge 결과는 Arrow 타입, GridFrame은 numpy 배열이므로 값만 비교
+    pd.testing.assert_frame_equal(joined.to_frame(), reference(area_map, area_struct), check_dtype=False)
@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from conftest import assert_valid_path, random_grid, reference_path
+from hierarchical_path import HierarchicalPlanner, build_area_lookup, compare_with_flat
+
+
+def quadrant_areas(grid_map):
+    # random_grid 범위(x -3~11, y 2~13)를 네 지역으로 나눔
+    return {(x, y): (x >= 4) + 2 * (y >= 8) for x, y in grid_map}
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_paths_are_valid_and_never_shorter_than_bfs(seed):
+    rng = random.Random(seed)
+    grid_map = random_grid(rng, density=0.2)
+    planner = HierarchicalPlanner(grid_map, quadrant_areas(grid_map))
+    free = [cell for cell, value in grid_map.items() if value == 'free']
+    for _ in range(20):
+        start, end = rng.choice(free), rng.choice(free)
+        path = planner.find_path(start, end)
+        flat = reference_path(grid_map, start, end)
+        if not flat:
+            assert path == []
+            continue
+        if path:
+            assert_valid_path(grid_map, path, start, end)
+            assert len(path) >= len(flat)
+
+
+def test_open_grid_always_finds_a_path():
+    grid_map = {(x, y): 'free' for x in range(12) for y in range(10)}
+    planner = HierarchicalPlanner(grid_map, {(x, y): x // 4 + 3 * (y // 5) for x, y in grid_map})
+    rng = random.Random(0)
+    cells = list(grid_map)
+    for _ in range(50):
+        start, end = rng.choice(cells), rng.choice(cells)
+        path = planner.find_path(start, end)
+        assert_valid_path(grid_map, path, start, end)
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_compare_with_flat_reports_extra_length(seed):
+    rng = random.Random(seed)
+    grid_map = random_grid(rng, density=0.2)
+    planner = HierarchicalPlanner(grid_map, quadrant_areas(grid_map))
+    free = [cell for cell, value in grid_map.items() if value == 'free']
+    start, end = rng.choice(free), rng.choice(free)
+
+    report = compare_with_flat(planner, start, end)
+    path = planner.find_path(start, end)
+    flat = reference_path(grid_map, start, end)
+    assert report['hierarchical_distance'] == (len(path) - 1 if path else None)
+    assert report['flat_distance'] == (len(flat) - 1 if flat else None)
+    if path and len(flat) > 1:
+        assert report['ratio'] == pytest.approx((len(path) - 1) / (len(flat) - 1))
+        assert report['ratio'] >= 1
+
+
+def test_project_route_matches_report():
+    from map_direct_save import create_grid_map, find_start_and_end_points, load_processed_data
+
+    data, category_df = load_processed_data()
+    start, end = find_start_and_end_points(data, category_df)
+    grid_map = create_grid_map(data, start)
+    planner = HierarchicalPlanner(grid_map, build_area_lookup(data))
+
+    report = compare_with_flat(planner, start, end)
+    path = planner.find_path(start, end)
+    assert_valid_path(grid_map, path, start, end)
+    assert report['flat_distance'] == len(reference_path(grid_map, start, end)) - 1
+    assert report['hierarchical_distance'] == len(path) - 1 >= report['flat_distance']
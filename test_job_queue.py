@@ -0,0 +1,120 @@
+import shutil
+import subprocess
+
+import pytest
+
+import job_queue
+from job_queue import DONE, FAILED, JOB_SPECS, JobQueue, JobSpec, input_hash
+
+
+def test_outputs_ready_checks_path_format(tmp_path):
+    output = tmp_path / 'home_to_cafe.csv'
+    spec = JobSpec('경로', 'map_direct_save.py', (), (str(output),), (), formats={str(output): 'legacy'})
+    assert not spec.outputs_ready()
+
+    output.write_text('route_id,waypoint,x,y\n1,1,1,1\n')
+    assert not spec.outputs_ready()
+
+    output.write_text('step,x,y\n1,1,1\n')
+    assert spec.outputs_ready()
+
+
+# 신호 파일이 생길 때까지 기다렸다가 결과 파일을 쓰는 작업 스크립트
+SCRIPT = '''
+import os, sys, time
+print('시작', flush=True)
+while not os.path.exists('go'):
+    time.sleep(0.01)
+if os.path.exists('fail'):
+    sys.exit(1)
+with open('out.txt', 'w') as f:
+    f.write('done')
+print('끝', flush=True)
+'''
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'job.py').write_text(SCRIPT, encoding='utf-8')
+    (tmp_path / 'input.csv').write_text('x\n1\n')
+    spec = JobSpec('테스트', 'job.py', ('input.csv',), ('out.txt',), ('시작', '끝'))
+    return JobQueue(workers=2, specs={'test': spec})
+
+
+def test_same_input_jobs_are_deduplicated(queue, tmp_path):
+    first = queue.submit('test')
+    assert queue.submit('test') is first
+
+    (tmp_path / 'go').touch()
+    assert queue.wait(10)
+    assert first.status == DONE and first.progress == 1.0
+    # 결과 파일이 남아 있으면 끝난 작업을 다시 돌려줌
+    assert queue.submit('test') is first
+
+    assert queue.submit('test', force=True) is not first
+    assert queue.wait(10)
+    (tmp_path / 'out.txt').unlink()
+    assert queue.submit('test') is not first
+    assert queue.wait(10)
+
+    (tmp_path / 'input.csv').write_text('x\n2\n')
+    assert queue.submit('test').key != first.key
+
+
+def test_failed_job_is_not_reused(queue, tmp_path):
+    (tmp_path / 'go').touch()
+    (tmp_path / 'fail').touch()
+    job = queue.submit('test')
+    assert queue.wait(10)
+    assert job.status == FAILED
+
+    (tmp_path / 'fail').unlink()
+    retry = queue.submit('test')
+    assert retry is not job
+    assert queue.wait(10)
+    assert retry.status == DONE
+
+
+def test_unexpected_error_marks_job_failed(queue, monkeypatch):
+    def broken(*args, **kwargs):
+        raise RuntimeError('popen broke')
+
+    monkeypatch.setattr(subprocess, 'Popen', broken)
+    job = queue.submit('test')
+    assert queue.wait(10)
+    assert job.status == FAILED
+    assert 'popen broke' in job.error
+
+    monkeypatch.undo()
+    assert queue.submit('test') is not job
+
+
+def test_input_hash_reads_unchanged_files_once(queue, tmp_path, monkeypatch):
+    reads = []
+    original = job_queue._hash_file
+    monkeypatch.setattr(job_queue, '_hash_file', lambda name: reads.append(name) or original(name))
+    monkeypatch.setattr(job_queue, '_digests', {})
+    spec = queue.specs['test']
+
+    key = input_hash(spec)
+    assert input_hash(spec) == key
+    assert sorted(reads) == ['input.csv', 'job.py']
+
+    (tmp_path / 'input.csv').write_text('x\n22\n')
+    assert input_hash(spec) != key
+    assert reads.count('input.csv') == 2
+
+
+def test_helper_module_change_changes_job_key(tmp_path, monkeypatch):
+    spec = JOB_SPECS['route']
+    assert {'grid_components.py', 'area_registry.py', 'csv_ingest.py', 'path_store.py'} <= set(spec.inputs)
+    for name in spec.inputs:
+        shutil.copy(name, tmp_path)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(job_queue, '_digests', {})
+
+    before = input_hash(spec)
+    with open('grid_components.py', 'a', encoding='utf-8') as f:
+        f.write('\n# 바뀐 도우미 모듈\n')
+    assert input_hash(spec) != before
@@ -0,0 +1,109 @@
+import itertools
+import random
+
+import pytest
+
+from multi_stop import INFINITY, MultiStopPlanner, exact_order, heuristic_order, plan_order, route_cost
+
+
+def random_cost(rng, size, symmetric=True, unreachable=0.0):
+    cost = [[0] * size for _ in range(size)]
+    for a in range(size):
+        for b in range(a + 1 if symmetric else 0, size):
+            if a == b:
+                continue
+            value = INFINITY if rng.random() < unreachable else rng.randint(1, 50)
+            cost[a][b] = value
+            if symmetric:
+                cost[b][a] = value
+    return cost
+
+
+def brute_force(cost, return_to_start):
+    return min(
+        route_cost(cost, order, return_to_start)
+        for order in itertools.permutations(range(1, len(cost)))
+    )
+
+
+@pytest.mark.parametrize('return_to_start', [False, True])
+@pytest.mark.parametrize('symmetric', [True, False])
+@pytest.mark.parametrize('seed', range(15))
+def test_exact_order_is_optimal(seed, symmetric, return_to_start):
+    rng = random.Random(seed)
+    cost = random_cost(rng, rng.randint(2, 7), symmetric)
+    order = exact_order(cost, return_to_start)
+    assert sorted(order) == list(range(1, len(cost)))
+    assert route_cost(cost, order, return_to_start) == brute_force(cost, return_to_start)
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_exact_order_avoids_unreachable_legs(seed):
+    # 경유지 사이에 막힌 구간이 있어도 무한대가 아닌 순서가 있으면 그 순서를 골라야 함
+    rng = random.Random(seed)
+    cost = random_cost(rng, 6, symmetric=False, unreachable=0.3)
+    for stop in range(1, 6):
+        cost[0][stop] = rng.randint(1, 50)
+    order = exact_order(cost)
+    assert sorted(order) == list(range(1, 6))
+    assert route_cost(cost, order) == brute_force(cost, False)
+
+
+def test_exact_order_without_finite_route_still_visits_every_stop():
+    cost = [
+        [0, 1, 1, 1],
+        [1, 0, INFINITY, INFINITY],
+        [1, INFINITY, 0, INFINITY],
+        [1, INFINITY, INFINITY, 0],
+    ]
+    assert sorted(exact_order(cost)) == [1, 2, 3]
+    assert sorted(exact_order(cost, return_to_start=True)) == [1, 2, 3]
+
+
+def test_exact_order_edge_cases():
+    assert exact_order([[0]]) == []
+    assert exact_order([[0, 4], [4, 0]], return_to_start=True) == [1]
+
+
+@pytest.mark.parametrize('return_to_start', [False, True])
+@pytest.mark.parametrize('seed', range(15))
+def test_heuristic_order_is_a_valid_order(seed, return_to_start):
+    rng = random.Random(seed)
+    cost = random_cost(rng, rng.randint(2, 8))
+    order = heuristic_order(cost, return_to_start)
+    assert sorted(order) == list(range(1, len(cost)))
+    assert route_cost(cost, order, return_to_start) >= brute_force(cost, return_to_start)
+
+
+def test_plan_order_switches_to_heuristic(monkeypatch):
+    import multi_stop
+
+    cost = random_cost(random.Random(0), 6)
+    monkeypatch.setattr(multi_stop, 'EXACT_LIMIT', 3)
+    assert plan_order(cost) == heuristic_order(cost)
+    monkeypatch.setattr(multi_stop, 'EXACT_LIMIT', 5)
+    assert plan_order(cost) == exact_order(cost)
+
+
+@pytest.mark.parametrize('return_to_start', [False, True])
+def test_plan_joins_legs_and_skips_unreachable(return_to_start):
+    # 세로 벽으로 막힌 오른쪽 칸 하나는 도달할 수 없음
+    grid_map = {(x, y): 'free' for x in range(8) for y in range(6)}
+    for y in range(6):
+        grid_map[(6, y)] = 'obstacle'
+    start = (0, 0)
+    stops = [(5, 5), (2, 3), (7, 2), (4, 0)]
+
+    result = MultiStopPlanner(grid_map).plan(start, stops, return_to_start)
+
+    assert result['skipped'] == [(7, 2)]
+    assert sorted(result['order']) == sorted([(5, 5), (2, 3), (4, 0)])
+    path = result['path']
+    assert path[0] == start
+    assert path[-1] == (start if return_to_start else result['order'][-1])
+    for (x1, y1), (x2, y2) in zip(path, path[1:]):
+        assert abs(x1 - x2) + abs(y1 - y2) == 1
+    assert all(grid_map[cell] == 'free' for cell in path)
+    assert len(path) - 1 == result['distance']
+    for stop in result['order']:
+        assert stop in path
@@ -0,0 +1,88 @@
+import pytest
+
+from path_store import PathSink, compress_path, expand_waypoints, read_paths
+
+
+ROUTE = [(1, 1), (1, 2), (1, 3), (0, 3), (0, 4), (1, 4), (2, 4), (3, 4)]
+OTHER = [(5, 5), (6, 5), (7, 5), (7, 6)]
+
+
+def routes(table):
+    return {
+        route_id: list(zip(group['x'], group['y']))
+        for route_id, group in table.sort_values(['route_id', 'step']).groupby('route_id')
+    }
+
+
+def test_waypoints_round_trip():
+    waypoints = compress_path(ROUTE)
+    assert waypoints == [(1, 1), (1, 3), (0, 3), (0, 4), (3, 4)]
+    assert expand_waypoints(waypoints) == ROUTE
+
+
+@pytest.mark.parametrize('encoding', ['steps', 'compact', 'waypoints', 'binary'])
+def test_round_trip(tmp_path, encoding):
+    filename = str(tmp_path / f'routes.{encoding}')
+    with PathSink(filename, encoding=encoding) as sink:
+        sink.add(ROUTE)
+        sink.add(OTHER)
+
+    assert routes(read_paths(filename)) == {1: ROUTE, 2: OTHER}
+
+
+@pytest.mark.parametrize('encoding', ['steps', 'compact', 'waypoints', 'binary'])
+def test_two_appends_get_new_route_ids(tmp_path, encoding):
+    filename = str(tmp_path / f'routes.{encoding}')
+    with PathSink(filename, encoding=encoding) as sink:
+        first = sink.add(ROUTE)
+    with PathSink(filename, encoding=encoding) as sink:
+        second = sink.add(OTHER)
+
+    assert (first, second) == (1, 2)
+    assert routes(read_paths(filename)) == {1: ROUTE, 2: OTHER}
+
+    with PathSink(filename, encoding=encoding, overwrite=True) as sink:
+        assert sink.add(OTHER) == 1
+    assert routes(read_paths(filename)) == {1: OTHER}
+
+
+def test_default_files_differ_per_encoding(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'home_to_cafe.csv').write_text('step,x,y\n1,1,1\n2,1,2\n')
+
+    for encoding in ('steps', 'compact', 'waypoints', 'binary'):
+        with PathSink(encoding=encoding) as sink:
+            sink.add(ROUTE)
+        assert routes(read_paths(sink.filename)) == {1: ROUTE}
+
+    # 3단계 결과 파일은 예전 형식 그대로
+    assert routes(read_paths('home_to_cafe.csv')) == {1: [(1, 1), (1, 2)]}
+
+
+def test_truncated_binary_record(tmp_path):
+    filename = tmp_path / 'routes.bin'
+    with PathSink(str(filename), encoding='binary') as sink:
+        sink.add(ROUTE)
+        sink.add(OTHER)
+    data = filename.read_bytes()
+
+    # 좌표 하나(8바이트)가 빠진 레코드와 int32 중간에서 끊긴 레코드
+    for cut in (8, 2):
+        filename.write_bytes(data[:-cut])
+        with pytest.raises(ValueError, match='잘려'):
+            read_paths(str(filename))
+
+
+def test_waypoints_file_with_repeated_route_ids(tmp_path):
+    # route_id를 이어 붙이지 않던 예전 방식으로 두 번 저장한 파일
+    filename = tmp_path / 'routes.csv'
+    filename.write_text(
+        'route_id,waypoint,x,y\n'
+        '1,1,1,1\n1,2,1,3\n1,3,3,3\n'
+        '1,1,5,5\n1,2,7,5\n'
+    )
+
+    assert routes(read_paths(str(filename))) == {
+        1: [(1, 1), (1, 2), (1, 3), (2, 3), (3, 3)],
+        2: [(5, 5), (6, 5), (7, 5)],
+    }
@@ -0,0 +1,46 @@
+import os
+
+import pipeline
+from area_registry import AreaRegistry
+from pipeline import Stage, local_modules
+
+
+def test_local_modules_follow_helper_imports():
+    modules = local_modules('map_direct_save.py')
+    assert modules[0] == 'map_direct_save.py'
+    for helper in ('csv_ingest.py', 'area_registry.py', 'grid_join.py', 'grid_components.py', 'path_store.py'):
+        assert helper in modules
+    assert 'app.py' not in modules
+
+
+def test_stage_is_stale_when_a_helper_changes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    for name in ('input.csv', 'stage.py', 'helper.py', 'output.png'):
+        (tmp_path / name).write_text(name)
+    os.utime('input.csv', (100, 100))
+    os.utime('stage.py', (100, 100))
+    os.utime('helper.py', (100, 100))
+    os.utime('output.png', (200, 200))
+
+    stage = Stage('2', 'stage', None, inputs=('input.csv', 'stage.py', 'helper.py'), outputs=('output.png',))
+    assert stage.is_fresh()
+    os.utime('helper.py', (300, 300))
+    assert not stage.is_fresh()
+
+
+def test_later_stages_reuse_stage1_registry(monkeypatch):
+    import caffee_map_final
+    import map_direct_save
+    import map_draw_real
+
+    received = {}
+    monkeypatch.setattr(caffee_map_final, 'main', lambda inputs, registry=None: received.update(s1=registry))
+    monkeypatch.setattr(map_draw_real, 'main', lambda inputs, registry=None: received.update(s2=registry))
+    monkeypatch.setattr(map_direct_save, 'main', lambda inputs=None, registry=None: received.update(s3=registry))
+
+    context = {}
+    for run in (pipeline._run_stage1, pipeline._run_stage2, pipeline._run_stage3):
+        run(context)
+
+    assert isinstance(context['registry'], AreaRegistry)
+    assert received == {'s1': context['registry'], 's2': context['registry'], 's3': context['registry']}
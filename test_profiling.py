@@ -0,0 +1,60 @@
+import os
+
+import pytest
+
+from profiling import PROFILE_DIR, PROFILE_ENV, profile_session, profiled, resolve_mode
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv(PROFILE_ENV, raising=False)
+    return tmp_path
+
+
+def profile_files(workdir):
+    folder = workdir / PROFILE_DIR
+    return sorted(os.listdir(folder)) if folder.exists() else []
+
+
+def test_invalid_mode_warns_instead_of_raising(workdir, monkeypatch, capsys):
+    monkeypatch.setenv(PROFILE_ENV, 'bogus')
+
+    @profiled('stage')
+    def stage():
+        return 42
+
+    assert stage() == 42
+    assert stage() == 42
+    assert capsys.readouterr().out.count('경고') == 1
+    assert resolve_mode(['prog']) is None
+    assert profile_files(workdir) == []
+
+
+def test_mode_is_resolved_at_call_time(workdir, monkeypatch):
+    @profiled('stage')
+    def stage():
+        return sum(range(1000))
+
+    stage()
+    assert profile_files(workdir) == []
+
+    monkeypatch.setenv(PROFILE_ENV, 'speedscope')
+    stage()
+    files = profile_files(workdir)
+    assert len(files) == 1 and files[0].endswith('.speedscope.json')
+
+
+def test_nested_session_joins_outer(workdir, monkeypatch):
+    # 전체 실행 안에서 불린 fragment처럼 바깥 세션이 있으면 파일을 따로 만들지 않음
+    monkeypatch.setenv(PROFILE_ENV, '1')
+
+    @profiled('inner')
+    def inner():
+        return 1
+
+    with profile_session('outer'):
+        inner()
+    assert len(profile_files(workdir)) == 1
+    inner()
+    assert len(profile_files(workdir)) == 2
@@ -0,0 +1,81 @@
+import threading
+
+import route_cache
+from route_cache import RouteCache
+
+
+PATH = [(1, 1), (1, 2), (2, 2)]
+
+
+def key(version, n=0):
+    return RouteCache.make_key(version, (0, n), (5, 5))
+
+
+def test_get_returns_independent_copies():
+    cache = RouteCache(db_path=None)
+    cache.put(key('v1'), PATH)
+
+    first = cache.get(key('v1'))
+    first.append((9, 9))
+    assert cache.get(key('v1')) == PATH
+    assert cache.get_or_compute(key('v1'), lambda: None) == PATH
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    db_path = str(tmp_path / 'cache.sqlite')
+    cache = RouteCache(db_path=db_path)
+    cache.put(key('v1'), PATH)
+    cache.close()
+
+    cache = RouteCache(db_path=db_path)
+    assert cache.get(key('v1')) == PATH
+    assert cache.stats()['disk_hits'] == 1
+    assert cache.stats()['disk_size'] == 1
+    cache.close()
+
+
+def test_disk_tier_prunes_old_versions_and_caps_rows(tmp_path, monkeypatch):
+    monkeypatch.setattr(route_cache, 'PRUNE_EVERY', 1)
+    cache = RouteCache(db_path=str(tmp_path / 'cache.sqlite'), disk_capacity=5, keep_versions=2)
+
+    for version in ('v1', 'v2', 'v3'):
+        for n in range(2):
+            cache.put(key(version, n), PATH)
+    assert cache.stats()['disk_size'] == 4
+    cache.clear_memory()
+    assert cache.get(key('v1')) is None
+    assert cache.get(key('v3', 1)) == PATH
+
+    for n in range(2, 6):
+        cache.put(key('v3', n), PATH)
+    stats = cache.stats()
+    assert stats['disk_size'] == 5
+    assert stats['disk_evictions'] == 5
+    cache.close()
+
+
+def test_concurrent_queries_share_one_computation(tmp_path):
+    cache = RouteCache(db_path=str(tmp_path / 'cache.sqlite'))
+    calls = []
+    started = threading.Event()
+
+    def compute():
+        calls.append(1)
+        started.wait(1)
+        return PATH
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_compute(key('v1'), compute)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    started.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [PATH] * 8
+    assert len({id(result) for result in results}) == 8
+    cache.close()
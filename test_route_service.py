@@ -0,0 +1,84 @@
+import asyncio
+import json
+
+import pytest
+
+from route_service import RouteEngine, RouteService
+
+
+@pytest.fixture(scope='module')
+def engine():
+    return RouteEngine(cache=None)
+
+
+def exchange(engine, raw):
+    """
+    서버를 띄워 요청 바이트를 보내고 (상태 코드, 응답 객체)를 받는 함수
+    """
+    async def run():
+        server = await asyncio.start_server(RouteService(engine).on_connection, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(raw)
+            if writer.can_write_eof():
+                writer.write_eof()
+            response = await reader.read()
+            writer.close()
+        head, _, body = response.partition(b'\r\n\r\n')
+        return int(head.split()[1]), json.loads(body)
+
+    return asyncio.run(run())
+
+
+def post(path, body):
+    data = body.encode('utf-8')
+    return f'POST {path} HTTP/1.1\r\nContent-Length: {len(data)}\r\n\r\n'.encode('latin-1') + data
+
+
+def test_default_route(engine):
+    status, payload = exchange(engine, b'GET /route HTTP/1.1\r\n\r\n')
+    assert status == 200
+    assert payload['distance'] == 24
+
+
+@pytest.mark.parametrize('body', [
+    '[1, 2]', '"start"', 'null', '{"start": [null, 1]}', '{"mode": "dfs"}', '{',
+    '{"start": [1.5, 2]}', '{"end": [true, 2]}', '{"start": ["1", 2]}',
+])
+def test_bad_route_body_is_400(engine, body):
+    status, payload = exchange(engine, post('/route', body))
+    assert status == 400
+    assert payload['error']
+
+
+def test_short_body_is_400(engine):
+    raw = b'POST /route HTTP/1.1\r\nContent-Length: 50\r\n\r\n{"start": [14, -5]}'
+    status, payload = exchange(engine, raw)
+    assert status == 400
+    assert 'Content-Length' in payload['error']
+
+
+@pytest.mark.parametrize('path', ['/health', '/stats'])
+def test_read_only_endpoints_reject_post(engine, path):
+    assert exchange(engine, post(path, '{}'))[0] == 405
+    assert exchange(engine, f'GET {path} HTTP/1.1\r\n\r\n'.encode())[0] == 200
+
+
+def test_set_cells_is_all_or_nothing(engine):
+    cell = engine.route()['path'][3]
+    before = (engine.version, engine.grid_map[cell], engine.bit_grid, engine.flat_grid)
+
+    with pytest.raises(ValueError, match='격자에 없는 칸'):
+        engine.set_cells({cell: 'obstacle', (999, 999): 'free'})
+    with pytest.raises(ValueError, match='obstacle 또는 free'):
+        engine.set_cells({cell: 'obstacle', (1, 1): 'wall'})
+    assert (engine.version, engine.grid_map[cell], engine.bit_grid, engine.flat_grid) == before
+
+    version = engine.set_cells({cell: 'obstacle'})
+    try:
+        assert version != before[0]
+        assert cell not in engine.route()['path']
+    finally:
+        engine.set_cells({cell: 'free'})
+    assert engine.version == before[0]
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+Image = pytest.importorskip('PIL.Image')
+
+import search_animation
+from search_animation import GifStreamWriter
+
+
+COLORS = np.array([(255, 255, 255), (255, 165, 0), (255, 69, 0), (0, 0, 255)], dtype=np.uint8)
+
+
+def make_frames(count, size=(20, 30)):
+    # 프레임마다 한 칸씩 칠해 가는 RGBA 프레임 (앞 프레임과 항상 다름)
+    height, width = size
+    labels = np.zeros(size, dtype=np.int64)
+    frames = []
+    for i in range(count):
+        labels[(i * 3) % height, (i * 7) % width] = 1 + i % 3
+        rgba = np.full((height, width, 4), 255, dtype=np.uint8)
+        rgba[..., :3] = COLORS[labels]
+        frames.append(rgba)
+    return frames
+
+
+def decode(filename):
+    frames = []
+    with Image.open(filename) as gif:
+        assert gif.info.get('loop') == 0
+        durations = []
+        for index in range(gif.n_frames):
+            gif.seek(index)
+            durations.append(gif.info['duration'])
+            frames.append(np.asarray(gif.convert('RGB')))
+    return frames, durations
+
+
+@pytest.mark.parametrize('streaming', [True, False])
+def test_written_gif_decodes_to_the_same_frames(tmp_path, monkeypatch, streaming):
+    if not streaming:
+        monkeypatch.setattr(search_animation, 'gif_streaming_supported', lambda: False)
+    elif not search_animation.gif_streaming_supported():
+        pytest.skip('이 Pillow 버전은 이어 쓰기를 지원하지 않음')
+
+    frames = make_frames(12)
+    filename = str(tmp_path / 'bfs.gif')
+    with GifStreamWriter(filename, 10, [frames[0], frames[-1]]) as writer:
+        assert writer.streaming == streaming
+        for frame in frames:
+            writer.write(frame)
+    assert writer.frames == len(frames)
+
+    decoded, durations = decode(filename)
+    assert len(decoded) == len(frames)
+    assert durations == [100] * len(frames)
+    for expected, actual in zip(frames, decoded):
+        np.testing.assert_array_equal(actual, expected[..., :3])
+
+
+def test_unchanged_frames_are_kept_when_streaming(tmp_path):
+    if not search_animation.gif_streaming_supported():
+        pytest.skip('이 Pillow 버전은 이어 쓰기를 지원하지 않음')
+    # 경로를 찾은 뒤 같은 장면을 유지하는 프레임도 한 장씩 남아야 함
+    frame = make_frames(1)[0]
+    filename = str(tmp_path / 'hold.gif')
+    with GifStreamWriter(filename, 5, [frame]) as writer:
+        for _ in range(4):
+            writer.write(frame)
+    decoded, durations = decode(filename)
+    assert len(decoded) == 4
+    assert durations == [200] * 4
@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+import search_kernels
+from conftest import assert_valid_path, random_grid, reference_path
+from search_kernels import FlatGrid, shortest_path
+
+
+@pytest.fixture(params=['compiled', 'python'])
+def kernels(request, monkeypatch):
+    # numba가 있어도 컴파일하지 않은 원래 함수로 같은 결과가 나오는지 확인
+    if request.param == 'python':
+        for name in ('_bfs_kernel', '_distance_kernel'):
+            function = getattr(search_kernels, name)
+            monkeypatch.setattr(search_kernels, name, getattr(function, '__wrapped__', function))
+    return request.param
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_kernel_path_is_identical_to_bfs(kernels, seed):
+    rng = random.Random(seed)
+    grid_map = random_grid(rng)
+    flat_grid = FlatGrid.from_grid_map(grid_map)
+    cells = list(grid_map)
+    for _ in range(10):
+        start, end = rng.choice(cells), rng.choice(cells)
+        path = flat_grid.kernel_path(start, end)
+        assert path == reference_path(grid_map, start, end)
+        if len(path) > 1:
+            assert_valid_path(grid_map, path, start, end)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_kernel_distances_match_bfs(kernels, seed):
+    rng = random.Random(seed)
+    grid_map = random_grid(rng)
+    flat_grid = FlatGrid.from_grid_map(grid_map)
+    start = rng.choice(list(grid_map))
+    distance = flat_grid.kernel_distances(start)
+    for (x, y) in grid_map:
+        expected = len(reference_path(grid_map, start, (x, y))) - 1
+        assert distance[y - flat_grid.y0, x - flat_grid.x0] == expected
+
+
+@pytest.mark.parametrize('compiled', [True, False])
+def test_shortest_path_falls_back_to_bfs(monkeypatch, compiled):
+    monkeypatch.setattr(search_kernels, 'COMPILED', compiled)
+    grid_map = random_grid(random.Random(3))
+    flat_grid = FlatGrid.from_grid_map(grid_map)
+    cells = sorted(grid_map)
+    start, end = cells[0], cells[-1]
+    assert shortest_path(grid_map, flat_grid, start, end) == reference_path(grid_map, start, end)
+    # 격자 범위 밖의 시작점은 파이썬 구현으로 처리
+    assert shortest_path(grid_map, flat_grid, (99, 99), end) == reference_path(grid_map, (99, 99), end)
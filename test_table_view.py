@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from table_view import PAGE_SIZES, column_stats, filter_rows, page_window
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({
+        'x': [1, 2, 3, 4, 5, 6, 7, -2],
+        'category': pd.array([0, 1, 2, None, 4, 1, 0, 3], dtype='Int64'),
+        'ConstructionSite': [True, False, False, True, False, False, True, False],
+        'struct': ['Apartment', 'BandalgomCoffee', None, 'MyHome', 'Building', 'bandalgomcoffee', 'a.b', 'Apartment'],
+    })
+
+
+@pytest.mark.parametrize('column, query, expected', [
+    ('x', '', [0, 1, 2, 3, 4, 5, 6, 7]),
+    ('x', '   ', [0, 1, 2, 3, 4, 5, 6, 7]),
+    ('x', '5', [4]),
+    ('x', '3~5', [2, 3, 4]),
+    ('x', ' 3 ~ 5 ', [2, 3, 4]),
+    ('x', '-3~1', [0, 7]),
+    ('x', '5~3', []),
+    ('x', '1, 7', [0, 6]),
+    ('x', '2.0', [1]),
+    ('category', '1', [1, 5]),
+    ('category', '0~2', [0, 1, 2, 5, 6]),
+    ('ConstructionSite', 'true', [0, 3, 6]),
+    ('ConstructionSite', '0', [1, 2, 4, 5, 7]),
+    ('struct', 'coffee', [1, 5]),
+    ('struct', 'Apartment', [0, 7]),
+    ('struct', '.', [6]),
+])
+def test_filter_rows(frame, column, query, expected):
+    positions = filter_rows(frame, column, query)
+    assert positions.dtype.kind == 'i'
+    assert positions.tolist() == expected
+
+
+def test_filter_rows_matches_pandas(frame):
+    # 범위 필터 결과가 pandas의 between과 같아야 함 (빈 값은 제외)
+    positions = filter_rows(frame, 'category', '1~3')
+    expected = np.flatnonzero(frame['category'].between(1, 3).fillna(False).to_numpy(dtype=bool))
+    assert positions.tolist() == expected.tolist()
+
+
+@pytest.mark.parametrize('query', ['abc', '1~x', '~'])
+def test_filter_rows_rejects_text_on_numeric_column(frame, query):
+    with pytest.raises(ValueError, match='숫자 필터'):
+        filter_rows(frame, 'x', query)
+
+
+@pytest.mark.parametrize('page, expected_page, expected_rows', [
+    (1, 1, [0, 1, 2, 3, 4]),
+    (3, 3, [10, 11]),
+    (0, 1, [0, 1, 2, 3, 4]),
+    (99, 3, [10, 11]),
+])
+def test_page_window(page, expected_page, expected_rows):
+    rows, actual_page, pages = page_window(np.arange(12), page, 5)
+    assert (rows.tolist(), actual_page, pages) == (expected_rows, expected_page, 3)
+
+
+def test_page_window_empty_and_page_sizes():
+    rows, page, pages = page_window(np.arange(0), 4, PAGE_SIZES[0])
+    assert (rows.tolist(), page, pages) == ([], 1, 1)
+
+    positions = np.arange(1234)
+    for page_size in PAGE_SIZES:
+        _, _, pages = page_window(positions, 1, page_size)
+        pieces = [page_window(positions, page, page_size)[0] for page in range(1, pages + 1)]
+        assert all(len(piece) <= page_size for piece in pieces)
+        assert np.concatenate(pieces).tolist() == positions.tolist()
+
+
+def test_column_stats(frame):
+    stats = column_stats(frame)
+    assert list(stats.index) == list(frame.columns)
+    assert stats.loc['x', '최솟값'] == -2 and stats.loc['x', '최댓값'] == 7
+    assert stats.loc['category', '빈 값'] == 1
+    assert stats.loc['struct', '고유값 수'] == 6
+    assert pd.isna(stats.loc['ConstructionSite', '최솟값'])
+    assert pd.isna(stats.loc['struct', '최댓값'])
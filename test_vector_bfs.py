@@ -0,0 +1,39 @@
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import assert_valid_path, random_grid, reference_path
+from vector_bfs import grid_distance_field
+
+
+@pytest.mark.parametrize('seed', range(30))
+def test_distances_and_paths_match_bfs(seed):
+    rng = random.Random(seed)
+    grid_map = random_grid(rng)
+    start = rng.choice(list(grid_map))
+    field = grid_distance_field(grid_map, start)
+
+    for cell in grid_map:
+        expected = reference_path(grid_map, start, cell)
+        path = field.path_to(cell)
+        assert len(path) == len(expected)
+        assert field.distance_to(cell) == (len(expected) - 1 if expected else None)
+        if path:
+            assert_valid_path(grid_map, path, start, cell)
+
+
+def test_unreachable_and_out_of_range():
+    grid_map = {(x, 0): 'free' for x in range(5)}
+    grid_map[(2, 0)] = 'obstacle'
+    field = grid_distance_field(grid_map, (0, 0))
+
+    assert field.distance_to((1, 0)) == 1
+    assert field.distance_to((4, 0)) is None
+    assert field.path_to((4, 0)) == []
+    assert field.distance_to((9, 9)) is None
+    assert field.path_to((0, 0)) == [(0, 0)]
+
+    data = pd.DataFrame({'x': [0, 1, 4, 9], 'y': [0, 0, 0, 0]})
+    np.testing.assert_array_equal(field.to_frame_values(data), [0, 1, -1, -1])
@@ -0,0 +1,98 @@
+import shutil
+
+import pytest
+
+from change_feed import ChangeFeed, compact
+from csv_ingest import read_inputs
+from pipeline import INPUT_FILES
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    for name in INPUT_FILES:
+        shutil.copy(name, tmp_path)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def write_feed(path, lines, header=True):
+    with open(path, 'a', encoding='utf-8', newline='') as f:
+        if header:
+            f.write('x,y,field,value\r\n')
+        f.writelines(line + '\r\n' for line in lines)
+
+
+def construction(inputs, x, y):
+    area_map = inputs[0]
+    return int(area_map[(area_map['x'] == x) & (area_map['y'] == y)]['ConstructionSite'].iloc[0])
+
+
+def test_watch_starts_with_pending_feed(workdir):
+    from watch import watch
+
+    first = watch(once=True)
+    # 경로 가운데 칸을 막는 기록이 남아 있는 채로 다시 시작 (보정 좌표 → 원래 좌표는 y + 7)
+    x, y = first.path[len(first.path) // 2]
+    write_feed(workdir / 'area_changes.csv', [f'{x},{y + 7},ConstructionSite,1'])
+
+    watcher = watch(once=True)
+    assert watcher.pending == [(x, y + 7, 'ConstructionSite', 1)]
+    assert (x, y) not in watcher.path
+    assert watcher.grid_map[(x, y)] == 'obstacle'
+    assert construction(watcher.inputs, x, y + 7) == 1
+
+
+def test_compact_keeps_records_appended_after_read(workdir):
+    feed = ChangeFeed()
+    write_feed('area_changes.csv', ['1,1,ConstructionSite,1'])
+    records = feed.read_new()
+
+    # read_new()와 합치기 사이에 다른 프로세스가 추가한 기록
+    write_feed('area_changes.csv', ['2,1,ConstructionSite,1'], header=False)
+    merged, tail = compact(read_inputs(), records, feed)
+
+    assert tail == [(2, 1, 'ConstructionSite', 1)]
+    snapshot = read_inputs()
+    assert construction(snapshot, 1, 1) == construction(snapshot, 2, 1) == 1
+    assert not (workdir / 'area_changes.csv.compacting').exists()
+
+    write_feed('area_changes.csv', ['3,1,ConstructionSite,1'], header=False)
+    assert feed.read_new() == [(3, 1, 'ConstructionSite', 1)]
+
+
+def test_failed_compact_restores_feed(workdir):
+    feed = ChangeFeed()
+    write_feed('area_changes.csv', ['1,1,ConstructionSite,1'])
+    records = feed.read_new()
+    write_feed('area_changes.csv', ['999,999,ConstructionSite,1'], header=False)
+    before = (workdir / 'area_map.csv').read_bytes()
+
+    with pytest.raises(ValueError):
+        compact(read_inputs(), records, feed)
+
+    assert (workdir / 'area_map.csv').read_bytes() == before
+    assert not (workdir / 'area_changes.csv.compacting').exists()
+    # 떼어 낸 뒤 읽지 않았던 기록은 다시 읽힘
+    assert feed.read_new() == [(999, 999, 'ConstructionSite', 1)]
+
+
+def test_moving_home_matches_rebuild(workdir):
+    from change_feed import apply_changes_to_inputs
+    from watch import Watcher, watch
+
+    watcher = watch(once=True)
+    # 이전 집 칸은 빌딩(2)으로, 경로 위 칸은 집(3)으로 (보정 좌표 → 원래 좌표는 y + 7)
+    (old_x, old_y), (new_x, new_y) = watcher.start, watcher.path[3]
+    actions = watcher.apply_changes([
+        (old_x, old_y + 7, 'category', 2),
+        (new_x, new_y + 7, 'category', 3),
+    ])
+    assert any('막힘 1' in action for action in actions)
+
+    rebuilt = Watcher()
+    rebuilt.rebuild(apply_changes_to_inputs(read_inputs(), watcher.pending))
+    assert watcher.start == rebuilt.start == (new_x, new_y)
+    assert watcher.end == rebuilt.end
+    assert dict(watcher.grid_map) == dict(rebuilt.grid_map)
+    assert watcher.grid_map[(old_x, old_y)] == 'obstacle'
+    assert len(watcher.path) == len(rebuilt.path)
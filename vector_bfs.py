@@ -0,0 +1,169 @@
+"""
+단계 동기(level-synchronous) 벡터화 BFS
+탐색 경계 전체를 numpy 불리언 배열로 두고, 한 단계마다 배열을 상하좌우로 밀어(shift)
+장애물 마스크와 겹쳐서 다음 경계를 한 번에 계산합니다.
+모든 칸까지의 거리(int32)와 경로 복원용 방향(int8) 배열을 함께 만듭니다.
+"""
+
+import numpy as np
+
+
+# 방향 코드: 이전 칸에서 이 칸으로 올 때의 이동 (dx, dy)
+# bfs_shortest_path의 탐색 순서와 같은 순서 (상, 하, 좌, 우)
+DIRECTION_STEPS = [(0, 1), (0, -1), (-1, 0), (1, 0)]
+NO_DIRECTION = -1
+
+
+def occupancy_from_grid_map(grid_map):
+    """
+    격자 지도를 지나갈 수 있는 칸 배열로 바꾸는 함수
+
+    Args:
+        grid_map (dict): {(x, y): 'free' | 'obstacle'} 격자 지도
+
+    Returns:
+        tuple: ((height, width) 불리언 배열, x0, y0) - 격자 지도에 없는 칸은 False
+    """
+    cells = np.array(list(grid_map.keys()), dtype=np.int64).reshape(-1, 2)
+    passable = np.array([value != 'obstacle' for value in grid_map.values()], dtype=bool)
+    x0, y0 = cells.min(axis=0).tolist()
+    width = int(cells[:, 0].max()) - x0 + 1
+    height = int(cells[:, 1].max()) - y0 + 1
+
+    occupancy = np.zeros((height, width), dtype=bool)
+    occupancy[cells[passable, 1] - y0, cells[passable, 0] - x0] = True
+    return occupancy, x0, y0
+
+
+def _shift(array, dx, dy):
+    """
+    배열을 (dx, dy)만큼 민 배열을 만드는 함수 (밀려 나간 칸은 버리고 빈 칸은 False)
+    """
+    shifted = np.zeros_like(array)
+    height, width = array.shape
+    src_y = slice(max(0, -dy), height - max(0, dy))
+    dst_y = slice(max(0, dy), height - max(0, -dy))
+    src_x = slice(max(0, -dx), width - max(0, dx))
+    dst_x = slice(max(0, dx), width - max(0, -dx))
+    shifted[dst_y, dst_x] = array[src_y, src_x]
+    return shifted
+
+
+class DistanceField:
+    """
+    한 시작점에서 모든 칸까지의 거리와 방향 배열
+
+    distance[r, c]는 (x0 + c, y0 + r) 칸까지의 최단거리 (도달 불가면 -1),
+    direction[r, c]는 그 칸에 들어올 때 사용한 DIRECTION_STEPS의 번호입니다.
+    """
+
+    def __init__(self, distance, direction, x0, y0, start):
+        self.distance = distance
+        self.direction = direction
+        self.x0 = x0
+        self.y0 = y0
+        self.start = start
+
+    def _index(self, cell):
+        x, y = cell
+        row, col = y - self.y0, x - self.x0
+        if 0 <= row < self.distance.shape[0] and 0 <= col < self.distance.shape[1]:
+            return row, col
+        return None
+
+    def distance_to(self, cell):
+        """
+        cell까지의 최단거리 (도달할 수 없으면 None)
+        """
+        index = self._index(cell)
+        if index is None or self.distance[index] < 0:
+            return None
+        return int(self.distance[index])
+
+    def path_to(self, cell):
+        """
+        방향 배열을 거꾸로 따라가 시작점에서 cell까지의 경로를 만드는 함수
+
+        Returns:
+            list: 경로 좌표 리스트 (도달할 수 없으면 빈 리스트)
+        """
+        if self.distance_to(cell) is None:
+            return []
+        path = [cell]
+        x, y = cell
+        while (x, y) != self.start:
+            dx, dy = DIRECTION_STEPS[self.direction[y - self.y0, x - self.x0]]
+            x, y = x - dx, y - dy
+            path.append((x, y))
+        path.reverse()
+        return path
+
+    def to_frame_values(self, data):
+        """
+        데이터의 각 행(x, y)에 해당하는 거리를 배열로 돌려주는 함수 (렌더러용)
+
+        Args:
+            data (pandas.DataFrame | GridFrame): x, y 컬럼을 가진 데이터
+
+        Returns:
+            numpy.ndarray: 행별 거리 (범위 밖이거나 도달 불가면 -1)
+        """
+        rows = np.asarray(data['y']).astype(int) - self.y0
+        cols = np.asarray(data['x']).astype(int) - self.x0
+        inside = (rows >= 0) & (rows < self.distance.shape[0]) & (cols >= 0) & (cols < self.distance.shape[1])
+        values = np.full(len(rows), -1, dtype=np.int32)
+        values[inside] = self.distance[rows[inside], cols[inside]]
+        return values
+
+
+def distance_field(occupancy, x0, y0, start):
+    """
+    단계 동기 BFS로 start에서 모든 칸까지의 거리와 방향을 계산하는 함수
+
+    bfs_shortest_path와 같이 시작점 자체의 장애물 여부는 보지 않습니다.
+
+    Args:
+        occupancy (numpy.ndarray): (height, width) 지나갈 수 있는 칸 배열
+        x0 (int): 0번 열의 x좌표
+        y0 (int): 0번 행의 y좌표
+        start (tuple): 시작점 좌표 (격자 범위 안)
+
+    Returns:
+        DistanceField: 거리(int32)와 방향(int8) 배열
+    """
+    distance = np.full(occupancy.shape, -1, dtype=np.int32)
+    direction = np.full(occupancy.shape, NO_DIRECTION, dtype=np.int8)
+
+    frontier = np.zeros(occupancy.shape, dtype=bool)
+    frontier[start[1] - y0, start[0] - x0] = True
+    distance[frontier] = 0
+
+    level = 0
+    while frontier.any():
+        level += 1
+        unvisited = occupancy & (distance < 0)
+        reached = np.zeros_like(frontier)
+        for code, (dx, dy) in enumerate(DIRECTION_STEPS):
+            # 앞 방향에서 이미 도달한 칸은 건너뛰어 방향을 하나만 기록
+            arrived = _shift(frontier, dx, dy) & unvisited & ~reached
+            direction[arrived] = code
+            reached |= arrived
+        distance[reached] = level
+        frontier = reached
+
+    return DistanceField(distance, direction, x0, y0, start)
+
+
+def grid_distance_field(grid_map, start):
+    """
+    격자 지도에서 바로 거리 배열을 계산하는 함수 (3단계 파이프라인용)
+
+    Args:
+        grid_map (dict): 격자 지도
+        start (tuple): 시작점 좌표
+
+    Returns:
+        DistanceField: 거리와 방향 배열
+    """
+    occupancy, x0, y0 = occupancy_from_grid_map(grid_map)
+    return distance_field(occupancy, x0, y0, start)
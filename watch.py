@@ -0,0 +1,444 @@
+"""
+감시 모드
+area_map.csv, area_struct.csv, area_category.csv를 주기적으로 확인하다가 바뀌면
+직전 스냅샷과 행 단위로 비교해서 영향을 받는 결과만 다시 만듭니다.
+
+- 건설현장/구조물 변경: 격자 칸만 고치고, 현재 경로가 영향을 받을 때만 경로를 다시 찾은 뒤 다시 그림
+  (막힌 칸이 경로 밖에 생기면 기존 경로가 그대로 최단경로라 다시 찾지 않음)
+- 카테고리 이름만 변경: 경로는 그대로 두고 범례가 바뀐 지도만 다시 그림
+- 행 추가/삭제, 지역 번호 변경처럼 구조가 바뀌면 전체를 다시 만듦 (드문 경우)
+- 2단계 지도(map.png)는 area 1 안이 바뀌었을 때만 다시 그림
+- 변경 피드(area_changes.csv, change_feed.py 참고)에 추가된 줄은 CSV를 다시 읽지 않고
+  메모리의 데이터와 격자에서 그 칸만 고치며, 쌓이면 입력 CSV에 합침
+
+사용법:
+    python watch.py                # 2초마다 확인
+    python watch.py --interval 5
+    python watch.py --compact-every 100
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from area_registry import AreaRegistry, DEFAULT_AREA
+from change_feed import ChangeFeed, COMPACT_EVERY, apply_changes_to_inputs, compact
+from csv_ingest import read_inputs, EMPTY_CATEGORY
+from grid_components import OBSTACLE_CATEGORIES
+
+
+WATCHED_FILES = ('area_map.csv', 'area_struct.csv', 'area_category.csv')
+
+
+def _file_state():
+    """
+    감시 파일들의 (수정 시각, 크기) 목록
+    """
+    return tuple(
+        (os.path.getmtime(name), os.path.getsize(name)) if os.path.exists(name) else None
+        for name in WATCHED_FILES
+    )
+
+
+def _sorted_cells(frame):
+    """
+    (x, y) 순서로 정렬한 행 위치와 좌표 배열
+    """
+    xs = frame['x'].to_numpy(dtype=np.int64)
+    ys = frame['y'].to_numpy(dtype=np.int64)
+    order = np.lexsort((ys, xs))
+    return order, xs[order], ys[order]
+
+
+def _diff_column(old, new, column):
+    """
+    같은 칸 집합을 가진 두 데이터에서 column 값이 바뀐 칸을 찾는 함수
+
+    Returns:
+        list: (x, y, 이전 값, 새 값) 리스트, 칸 집합이 다르면 None
+    """
+    old_order, old_x, old_y = _sorted_cells(old)
+    new_order, new_x, new_y = _sorted_cells(new)
+    if len(old_x) != len(new_x) or (old_x != new_x).any() or (old_y != new_y).any():
+        return None
+
+    before = old[column].to_numpy()[old_order]
+    after = new[column].to_numpy()[new_order]
+    changed = np.flatnonzero(before != after)
+    return [
+        (int(new_x[i]), int(new_y[i]), before[i].item(), after[i].item())
+        for i in changed
+    ]
+
+
+def diff_inputs(old, new):
+    """
+    두 입력 스냅샷 (area_map, area_struct, area_category)을 비교하는 함수
+
+    Returns:
+        dict: construction/category 변경 칸 리스트, names(번호별 (이전, 새) 이름),
+              structural(칸 집합이나 지역, 카테고리 번호가 바뀌었는지)
+    """
+    old_map, old_struct, old_category = old
+    new_map, new_struct, new_category = new
+
+    construction = _diff_column(old_map, new_map, 'ConstructionSite')
+    category = _diff_column(old_struct, new_struct, 'category')
+    area = _diff_column(old_struct, new_struct, 'area')
+
+    old_names = dict(zip(old_category['category'].tolist(), old_category['struct'].tolist()))
+    new_names = dict(zip(new_category['category'].tolist(), new_category['struct'].tolist()))
+
+    structural = construction is None or category is None or bool(area) or set(old_names) != set(new_names)
+    return {
+        'construction': construction or [],
+        'category': category or [],
+        'names': {
+            key: (old_names[key], new_names[key])
+            for key in new_names if key in old_names and old_names[key] != new_names[key]
+        },
+        'structural': structural,
+    }
+
+
+class Watcher:
+    """
+    마지막으로 만든 결과(데이터, 격자, 경로)를 메모리에 들고 있다가 바뀐 부분만 다시 계산하는 클래스
+    """
+
+    def __init__(self):
+        self.inputs = None
+        self.registry = None
+        self.data = None
+        self.category_df = None
+        self.grid_map = None
+        self.start = None
+        self.end = None
+        self.path = []
+        # 변경 피드에서 받아 메모리에만 반영하고 아직 입력 CSV에 합치지 않은 기록
+        self.pending = []
+        # 보정된 좌표 (x, y) → self.data 행 위치
+        self._rows = {}
+
+    def rebuild(self, inputs):
+        """
+        입력 전체로 격자와 경로를 새로 만들고 두 지도를 모두 그리는 함수
+        """
+        from map_direct_save import (
+            find_start_and_end_points,
+            create_grid_map,
+            bfs_shortest_path,
+        )
+
+        self.inputs = inputs
+        self._load(inputs)
+        self.start, self.end = find_start_and_end_points(self.data, self.category_df)
+        self.grid_map = create_grid_map(self.data, self.start)
+        self.path = bfs_shortest_path(self.grid_map, self.start, self.end) if self.start else []
+
+        self._render_area_map()
+        self._render_final()
+        self._save_path()
+
+    def _load(self, inputs):
+        """
+        3단계 데이터를 다시 만들고 칸별 행 위치 색인을 새로 만드는 함수
+
+        두 표는 여기서 한 번만 결합하고, 레지스트리를 들고 있다가 2단계 지도(area 1)도 그 데이터로 그립니다.
+        self.data는 registry.data를 평행이동한 복사본이라 행 순서가 같으므로 같은 행 위치 색인을 씁니다.
+        """
+        from map_direct_save import load_processed_data
+
+        self.registry = AreaRegistry.from_inputs(inputs[0], inputs[1])
+        self.data, self.category_df = load_processed_data(inputs=inputs, registry=self.registry)
+        xs = np.asarray(self.data['x']).astype(np.int64).tolist()
+        ys = np.asarray(self.data['y']).astype(np.int64).tolist()
+        self._rows = {cell: i for i, cell in enumerate(zip(xs, ys))}
+
+    def _render_final(self):
+        from map_direct_save import visualize_path
+
+        visualize_path(self.data, self.category_df, self.path, self.start, self.end)
+
+    def _render_area_map(self):
+        import map_draw_real
+
+        # 변경 피드로 고친 값도 registry.data에 들어 있으므로 CSV를 다시 읽지 않음
+        map_draw_real.create_map_visualization(self.registry.area_frame(DEFAULT_AREA), self.category_df)
+
+    def _save_path(self):
+        from map_direct_save import save_path_to_csv
+
+        save_path_to_csv(self.path)
+
+    def _patch_grid(self, cells, start):
+        """
+        바뀐 칸들의 장애물 여부만 격자에 다시 써 넣는 함수 (바뀐 칸 수에 비례하는 비용)
+
+        새 시작점은 건너뛰고, 시작점이 옮겨 갔으면 이전 시작점 칸도 다시 확인합니다.
+
+        Args:
+            cells (list): 바뀐 칸의 원래 좌표 리스트
+            start (tuple): 이번 변경을 반영한 새 시작점 (격자 좌표)
+
+        Returns:
+            tuple: (막힌 칸에서 풀린 칸 수, 새로 막힌 칸 리스트 (격자 좌표))
+        """
+        dx, dy = self.registry.box(DEFAULT_AREA).offset
+        construction = self.data['ConstructionSite']
+        category = self.data['category']
+
+        targets = [(x + dx, y + dy) for x, y in cells]
+        if self.start != start and self.start in self._rows:
+            targets.append(self.start)
+
+        opened, closed = 0, []
+        for cell in dict.fromkeys(targets):
+            row = self._rows[cell]
+            blocked = construction[row] == 1 or category[row] in OBSTACLE_CATEGORIES
+            value = 'obstacle' if blocked else 'free'
+            if cell == start or self.grid_map.get(cell) == value:
+                continue
+            self.grid_map[cell] = value
+            if value == 'free':
+                opened += 1
+            else:
+                closed.append(cell)
+        return opened, closed
+
+    def update(self, inputs):
+        """
+        새 입력을 직전 스냅샷과 비교해서 필요한 것만 다시 계산하는 함수
+
+        Returns:
+            list: 수행한 작업 설명 리스트
+        """
+        from map_direct_save import find_start_and_end_points
+
+        if self.pending:
+            # 아직 합치지 않은 변경 기록은 새로 읽은 스냅샷 위에 다시 얹음
+            # (처음 시작할 때는 비교할 이전 스냅샷이 없음)
+            inputs = apply_changes_to_inputs(inputs, self.pending)
+            if self.inputs is not None:
+                self.inputs = apply_changes_to_inputs(self.inputs, self.pending)
+
+        if self.inputs is None:
+            self.rebuild(inputs)
+            return ['전체 생성']
+
+        changes = diff_inputs(self.inputs, inputs)
+        if changes['structural']:
+            self.rebuild(inputs)
+            return ['구조 변경 → 전체 다시 생성']
+
+        cells = [(x, y) for x, y, _, _ in changes['construction'] + changes['category']]
+        names = changes['names']
+        if not cells and not names:
+            self.inputs = inputs
+            return []
+
+        self.inputs = inputs
+        self._load(inputs)
+        start, end = find_start_and_end_points(self.data, self.category_df)
+        return self._refresh(cells, names, start, end)
+
+    def _refresh(self, cells, names, start, end):
+        """
+        바뀐 칸을 격자에 반영하고 필요할 때만 경로를 다시 찾고 지도를 다시 그리는 함수
+
+        Returns:
+            list: 수행한 작업 설명 리스트
+        """
+        from map_direct_save import bfs_shortest_path
+
+        actions = []
+        opened, closed = self._patch_grid(cells, start)
+        if cells:
+            actions.append(f'격자 {len(cells)}칸 갱신 (풀림 {opened}, 막힘 {len(closed)})')
+
+        # 시작/끝점이 바뀌었거나, 칸이 풀렸거나(더 짧은 길이 생길 수 있음), 경로 위가 막혔을 때만 다시 탐색
+        on_path = set(self.path)
+        reroute = (start, end) != (self.start, self.end) or opened > 0 or any(cell in on_path for cell in closed)
+        if reroute:
+            if start is not None and start not in self.grid_map:
+                self.grid_map[start] = 'free'
+            self.start, self.end = start, end
+            path = bfs_shortest_path(self.grid_map, start, end) if start else []
+            if path != self.path:
+                self.path = path
+                self._save_path()
+                actions.append(f'경로 다시 탐색 → {len(path) - 1 if path else "없음"}칸')
+            else:
+                actions.append('경로 다시 탐색 (변화 없음)')
+
+        # 3단계 지도는 전체 지도이므로 칸 변경이나 이름 변경이 있으면 다시 그림
+        self._render_final()
+        actions.append('map_final.png 다시 그림' + (' (범례만 변경)' if not cells else ''))
+
+        # 2단계 지도는 area 1만 그리므로 area 1 안이 바뀌었거나 이름이 바뀌었을 때만
+        box = self.registry.box(DEFAULT_AREA)
+        if names or any(box.contains(x, y) for x, y in cells):
+            self._render_area_map()
+            actions.append('map.png 다시 그림')
+
+        return actions
+
+    def apply_changes(self, records):
+        """
+        변경 피드 기록을 메모리의 데이터와 격자에 바로 반영하는 함수
+
+        입력 CSV를 다시 읽지 않고 기록된 칸의 값만 바꾸므로 비용은 기록 수에 비례합니다.
+        (지도 그림은 전체를 다시 그리므로 지도 크기에 비례)
+        입력에 없는 칸이나 없는 카테고리를 가리키는 기록은 경고를 출력하고 건너뜁니다.
+
+        Args:
+            records (list): (x, y, field, value) 리스트
+
+        Returns:
+            list: 수행한 작업 설명 리스트
+        """
+        from map_direct_save import find_start_and_end_points
+
+        box = self.registry.box(DEFAULT_AREA)
+        dx, dy = box.offset
+        known = set(self.category_df['category'].tolist()) | {EMPTY_CATEGORY}
+        names = dict(zip(self.category_df['category'].tolist(), self.category_df['struct'].tolist()))
+        routing = {number for number, name in names.items() if name in ('MyHome', 'BandalgomCoffee')}
+
+        cells, moved = [], False
+        for x, y, field, value in records:
+            row = self._rows.get((x + dx, y + dy))
+            if row is None:
+                print(f'경고: 입력에 없는 칸 ({x}, {y})의 변경 기록을 건너뜁니다.')
+                continue
+            if field == 'category' and value not in known:
+                print(f'경고: ({x}, {y})의 카테고리 {value}는 area_category.csv에 없어 건너뜁니다.')
+                continue
+            self.pending.append((x, y, field, value))
+            column = self.data[field]
+            if column[row] == value:
+                continue
+            if field == 'category' and (column[row] in routing or value in routing):
+                # 집이나 카페가 생기거나 없어지면 시작점/끝점을 다시 찾아야 함
+                moved = True
+            column[row] = value
+            self.registry.data[field][row] = value
+            cells.append((x, y))
+
+        if not cells:
+            return []
+        if any(box.contains(x, y) for x, y in cells):
+            # area 1 데이터가 바뀌었으므로 레지스트리의 지역 캐시를 버림
+            self.registry.invalidate(DEFAULT_AREA)
+        start, end = self.start, self.end
+        if moved:
+            start, end = find_start_and_end_points(self.data, self.category_df)
+        return self._refresh(list(dict.fromkeys(cells)), {}, start, end)
+
+    def compact(self, feed):
+        """
+        메모리에만 반영된 변경 기록을 입력 CSV에 합치고 피드를 비우는 함수
+
+        마지막으로 읽은 뒤 피드에 추가된 기록도 함께 합치고, 메모리에도 반영합니다.
+
+        Returns:
+            list: 함께 합친 새 기록에 대해 수행한 작업 설명 리스트
+        """
+        if not self.pending:
+            return []
+        self.inputs, tail = compact(self.inputs, self.pending, feed)
+        self.pending = []
+        if not tail:
+            return []
+        actions = self.apply_changes(tail)
+        # 이미 스냅샷에 합친 기록이므로 다시 쌓아 두지 않음
+        self.pending = []
+        return actions
+
+
+def _report(label, actions, began):
+    elapsed = (time.perf_counter() - began) * 1000
+    summary = ', '.join(actions) if actions else '영향 없는 변경'
+    print(f'[{time.strftime("%H:%M:%S")}] {label}: {summary} ({elapsed:.0f}ms)')
+
+
+def watch(interval=2.0, once=False, compact_every=COMPACT_EVERY):
+    """
+    입력 파일과 변경 피드를 주기적으로 확인하며 바뀐 부분만 다시 계산하는 함수
+
+    입력 CSV는 수정 시각이 한 주기 동안 그대로일 때 읽고(쓰는 중일 수 있으므로),
+    변경 피드는 줄바꿈으로 끝난 새 줄만 바로 반영합니다.
+
+    Args:
+        interval (float): 확인 주기 (초)
+        once (bool): True면 처음 한 번만 만들고 끝냄
+        compact_every (int): 이 개수만큼 변경 기록이 쌓이면 입력 CSV에 합침
+    """
+    watcher = Watcher()
+    feed = ChangeFeed()
+    state = _file_state()
+    print('=== 초기 생성 ===')
+    # 지난번에 합치지 못한 변경 기록은 스냅샷 위에 얹어서 시작
+    watcher.pending = feed.recover() + feed.read_new()
+    watcher.update(read_inputs())
+    if once:
+        return watcher
+
+    print(f'\n입력 파일과 {feed.filename} 감시 중... ({interval}초마다 확인, Ctrl+C로 종료)')
+    pending = None
+    try:
+        while True:
+            time.sleep(interval)
+
+            records = feed.read_new()
+            if records:
+                began = time.perf_counter()
+                actions = watcher.apply_changes(records)
+                _report(f'변경 기록 {len(records)}건', actions, began)
+                if len(watcher.pending) >= compact_every:
+                    began = time.perf_counter()
+                    actions = watcher.compact(feed)
+                    if actions:
+                        _report('합치는 동안 추가된 변경 기록', actions, began)
+                    # 직접 쓴 스냅샷은 다시 읽지 않음
+                    state = _file_state()
+
+            current = _file_state()
+            if current == state:
+                pending = None
+                continue
+            if current != pending:
+                # 아직 쓰이는 중일 수 있으므로 한 주기 더 기다림
+                pending = current
+                continue
+
+            state, pending = current, None
+            began = time.perf_counter()
+            try:
+                actions = watcher.update(read_inputs())
+            except ValueError as e:
+                print(f'입력 파일을 읽을 수 없어 이번 변경은 건너뜁니다: {e}')
+                continue
+            _report('변경 감지', actions, began)
+    except KeyboardInterrupt:
+        print('감시를 종료합니다.')
+    return watcher
+
+
+def main():
+    """
+    메인 실행 함수
+    """
+    parser = argparse.ArgumentParser(description='입력 CSV 감시 및 증분 재계산')
+    parser.add_argument('--interval', type=float, default=2.0, help='확인 주기 (초)')
+    parser.add_argument('--compact-every', type=int, default=COMPACT_EVERY,
+                        help='변경 기록이 이만큼 쌓이면 입력 CSV에 합침')
+    args = parser.parse_args()
+
+    watch(args.interval, compact_every=args.compact_every)
+
+
+if __name__ == '__main__':
+    main()